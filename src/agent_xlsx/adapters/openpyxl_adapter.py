@@ -383,50 +383,62 @@ def _border_side(side: Any) -> dict[str, Any] | None:
 
 def get_cell_formatting(filepath: str | Path, sheet_name: str, cell_ref: str) -> dict[str, Any]:
     """Return detailed formatting for a single cell."""
+    return get_cells_formatting(filepath, sheet_name, [cell_ref])[0]
+
+
+def get_cells_formatting(
+    filepath: str | Path, sheet_name: str, cell_refs: list[str]
+) -> list[dict[str, Any]]:
+    """Return detailed formatting for each of *cell_refs*, parsing the workbook once."""
     wb = load_workbook(str(filepath), data_only=True)
     try:
         ws = wb[sheet_name]
-        cell = ws[cell_ref]
-
-        font = cell.font
-        fill = cell.fill
-        alignment = cell.alignment
-        border = cell.border
-
-        result: dict[str, Any] = {
-            "cell": cell_ref,
-            "value": cell.value,
-            "font": {
-                "name": font.name,
-                "size": font.size,
-                "bold": font.bold,
-                "italic": font.italic,
-                "underline": font.underline,
-                "color": _colour_to_hex(font.color),
-            },
-            "fill": {
-                "type": fill.fill_type,
-                "color": _colour_to_hex(fill.fgColor) if fill.fgColor else None,
-            },
-            "border": {
-                "top": _border_side(border.top),
-                "bottom": _border_side(border.bottom),
-                "left": _border_side(border.left),
-                "right": _border_side(border.right),
-            },
-            "alignment": {
-                "horizontal": alignment.horizontal,
-                "vertical": alignment.vertical,
-                "wrap_text": alignment.wrap_text,
-                "text_rotation": alignment.text_rotation,
-            },
-            "number_format": cell.number_format,
-        }
-        return result
+        return [_cell_formatting(ws, cell_ref) for cell_ref in cell_refs]
     finally:
         wb.close()
 
 
+def _cell_formatting(ws: Any, cell_ref: str) -> dict[str, Any]:
+    """Formatting dict for one cell of an open worksheet."""
+    cell = ws[cell_ref]
+
+    font = cell.font
+    fill = cell.fill
+    alignment = cell.alignment
+    border = cell.border
+
+    result: dict[str, Any] = {
+        "cell": cell_ref,
+        "value": cell.value,
+        "font": {
+            "name": font.name,
+            "size": font.size,
+            "bold": font.bold,
+            "italic": font.italic,
+            "underline": font.underline,
+            "color": _colour_to_hex(font.color),
+        },
+        "fill": {
+            "type": fill.fill_type,
+            "color": _colour_to_hex(fill.fgColor) if fill.fgColor else None,
+        },
+        "border": {
+            "top": _border_side(border.top),
+            "bottom": _border_side(border.bottom),
+            "left": _border_side(border.left),
+            "right": _border_side(border.right),
+        },
+        "alignment": {
+            "horizontal": alignment.horizontal,
+            "vertical": alignment.vertical,
+            "wrap_text": alignment.wrap_text,
+            "text_rotation": alignment.text_rotation,
+        },
+        "number_format": cell.number_format,
+    }
+    return result
+
+
 # ---------------------------------------------------------------------------
 # Range formulas
 # ---------------------------------------------------------------------------
@@ -28,7 +28,8 @@ from agent_xlsx.utils.validation import (
     ParsedRange,
     col_letter_to_index,
     file_size_bytes,
-    file_size_human,
+    file_size_human_from_stat,
+    file_stat,
     index_to_col_letter,
 )
 
@@ -493,10 +494,11 @@ def probe_workbook(
     elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
 
     # Workbook-level metadata from fastexcel
+    st = file_stat(fpath)
     result: dict[str, Any] = {
         "file": Path(filepath).name,
-        "size_bytes": file_size_bytes(fpath),
-        "file_size_human": file_size_human(fpath),
+        "size_bytes": st.st_size,
+        "file_size_human": file_size_human_from_stat(st),
         "format": Path(filepath).suffix.lstrip(".").lower(),
         "probe_time_ms": elapsed_ms,
         "sheets": sheets_result,
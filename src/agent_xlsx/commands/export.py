@@ -2,6 +2,7 @@
 
 import sys
 import time
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Any, Optional
 
@@ -13,9 +14,9 @@ from agent_xlsx.adapters.polars_adapter import (
     read_sheet_data,
 )
 from agent_xlsx.cli import app
-from agent_xlsx.formatters.json_formatter import output, output_spreadsheet_data
+from agent_xlsx.formatters.json_formatter import dumps_pretty, output, output_spreadsheet_data
 from agent_xlsx.utils.dataframe import apply_compact
-from agent_xlsx.utils.dates import detect_date_column_indices, excel_serial_to_isodate
+from agent_xlsx.utils.dates import convert_date_columns, detect_date_column_indices
 from agent_xlsx.utils.errors import SheetNotFoundError, handle_error
 from agent_xlsx.utils.validation import validate_file
 
@@ -42,6 +43,14 @@ def export(
         "--compact/--no-compact",
         help="Drop fully-null columns from output to reduce token waste (default: on).",
     ),
+    columnar: bool = typer.Option(
+        False,
+        "--columnar",
+        help=(
+            "JSON only: emit data as {column: [values, ...]} instead of a list of row "
+            "objects. Smaller output; header names are not repeated per row."
+        ),
+    ),
     json_envelope: bool = typer.Option(
         False,
         "--json-envelope",
@@ -81,7 +90,7 @@ def export(
     elif fmt == "markdown":
         _export_markdown(df, output_path, json_envelope)
     else:
-        _export_json(df, output_path, path, target_sheet, elapsed_ms)
+        _export_json(df, output_path, path, target_sheet, elapsed_ms, columnar)
 
 
 def _export_json(
@@ -90,44 +99,38 @@ def _export_json(
     source: Path,
     sheet: Any,
     elapsed_ms: float,
+    columnar: bool = False,
 ) -> None:
     """Export as JSON — either to file or stdout."""
-    import json
-
-    from agent_xlsx.formatters.json_formatter import _serialise
-
-    rows = []
-    for row in df.rows(named=True):
-        clean = {}
-        for k, v in row.items():
-            if v is None:
-                clean[k] = None
-            elif hasattr(v, "isoformat"):
-                clean[k] = v.isoformat()
-            elif isinstance(v, float) and v != v:
-                clean[k] = None
-            else:
-                clean[k] = v
-        rows.append(clean)
+    columns = _json_columns(df)
+    payload: Any
+    if columnar:
+        payload = columns
+    elif columns:
+        names = list(columns)
+        payload = [dict(zip(names, vals)) for vals in zip(*columns.values())]
+    else:
+        payload = [{} for _ in range(len(df))]
 
     data = {
         "source": Path(source).name if hasattr(source, "name") else str(source),
         "sheet": sheet if isinstance(sheet, str) else None,
-        "row_count": len(rows),
+        "row_count": len(df),
         "columns": df.columns,
-        "data": rows,
+        "data": payload,
         "export_time_ms": elapsed_ms,
     }
+    if columnar:
+        data["layout"] = "columnar"
 
     if output_path:
-        with open(output_path, "w") as f:
-            json.dump(data, f, indent=2, default=_serialise)
+        Path(output_path).write_bytes(dumps_pretty(data))
         output(
             {
                 "status": "success",
                 "format": "json",
                 "output": output_path,
-                "row_count": len(rows),
+                "row_count": len(df),
                 "export_time_ms": elapsed_ms,
             }
         )
@@ -135,13 +138,45 @@ def _export_json(
         output_spreadsheet_data(data)
 
 
+def _json_columns(df: Any) -> dict[str, list]:
+    """Convert a DataFrame to JSON-ready ``{column: values}`` lists, one column at a time.
+
+    NaN becomes null and date/time values become ISO strings. Each conversion
+    is decided once per column from its dtype, not per cell.
+    """
+    import polars as pl
+
+    columns: dict[str, list] = {}
+    for series in df.get_columns():
+        dtype = series.dtype
+        if dtype.is_float():
+            series = series.fill_nan(None)
+        values = series.to_list()
+        if dtype in (pl.Date, pl.Time) or isinstance(dtype, pl.Datetime):
+            values = [None if v is None else v.isoformat() for v in values]
+        elif dtype == pl.Object:
+            values = [_json_value(v) for v in values]
+        columns[series.name] = values
+    return columns
+
+
+def _json_value(v: Any) -> Any:
+    """Per-value cleanup for columns whose dtype does not pin down the Python type."""
+    if hasattr(v, "isoformat"):
+        return v.isoformat()
+    if isinstance(v, float) and v != v:
+        return None
+    return v
+
+
 def _export_csv(df: Any, output_path: Optional[str], json_envelope: bool = False) -> None:
-    """Export as CSV — either to file or stdout (optionally wrapped in a JSON envelope)."""
-    csv_str = df.write_csv()
+    """Export as CSV — either to file or stdout (optionally wrapped in a JSON envelope).
 
+    File and raw-stdout targets are written by Polars' native CSV writer
+    directly, without first materialising the whole CSV as a Python string.
+    """
     if output_path:
-        with open(output_path, "w") as f:
-            f.write(csv_str)
+        df.write_csv(output_path)
         output(
             {
                 "status": "success",
@@ -151,19 +186,22 @@ def _export_csv(df: Any, output_path: Optional[str], json_envelope: bool = False
             }
         )
     elif json_envelope:
-        output_spreadsheet_data({"format": "csv", "data": csv_str, "row_count": len(df)})
+        output_spreadsheet_data({"format": "csv", "data": df.write_csv(), "row_count": len(df)})
     else:
-        sys.stdout.write(csv_str)
+        out = getattr(sys.stdout, "buffer", None)
+        if out is None:
+            sys.stdout.write(df.write_csv())
+            return
+        sys.stdout.flush()  # keep ordering with any prior text writes
+        df.write_csv(out)
+        out.flush()
 
 
 def _export_markdown(df: Any, output_path: Optional[str], json_envelope: bool = False) -> None:
     """Export as Markdown table — either to file or stdout (optionally wrapped in a JSON envelope)."""  # noqa: E501
-    lines = _df_to_markdown(df)
-    md_str = "\n".join(lines) + "\n"
-
     if output_path:
-        with open(output_path, "w") as f:
-            f.write(md_str)
+        with open(output_path, "wb", buffering=_OUTPUT_BUFFER_BYTES) as f:
+            f.writelines(_iter_markdown_chunks(df))
         output(
             {
                 "status": "success",
@@ -173,65 +211,102 @@ def _export_markdown(df: Any, output_path: Optional[str], json_envelope: bool =
             }
         )
     elif json_envelope:
+        md_str = b"".join(_iter_markdown_chunks(df)).decode("utf-8")
         output_spreadsheet_data({"format": "markdown", "data": md_str, "row_count": len(df)})
     else:
-        sys.stdout.write(md_str)
-
-
-def _is_numeric(s: str) -> bool:
-    """Check if a string looks like a positive number (for date serial coercion)."""
-    try:
-        return float(s) > 0
-    except (ValueError, TypeError):
-        return False
+        out = getattr(sys.stdout, "buffer", None)
+        if out is None:
+            sys.stdout.write(b"".join(_iter_markdown_chunks(df)).decode("utf-8"))
+            return
+        sys.stdout.flush()  # keep ordering with any prior text writes
+        out.writelines(_iter_markdown_chunks(df))
+        out.flush()
 
 
 def _apply_df_date_conversion(df: Any, filepath: Path, sheet_name: Any) -> Any:
     """Best-effort conversion of date serial numbers in a DataFrame."""
     try:
-        import polars as pl
-
         sheet_arg = sheet_name if isinstance(sheet_name, str) else None
         indices = detect_date_column_indices(str(filepath), sheet_arg)
         if not indices:
             return df
-        for idx in indices:
-            if idx >= len(df.columns):
-                continue
-            col_name = df.columns[idx]
-            converted = [
-                excel_serial_to_isodate(float(v))
-                if isinstance(v, (int, float)) and v == v and v > 0
-                else (
-                    excel_serial_to_isodate(float(v))
-                    if isinstance(v, str) and _is_numeric(v)
-                    else v
-                )
-                for v in df[col_name].to_list()
-            ]
-            df = df.with_columns(pl.Series(col_name, converted))
-        return df
+        date_cols = [df.columns[idx] for idx in sorted(indices) if idx < len(df.columns)]
+        return convert_date_columns(df, date_cols)
     except Exception:
         return df
 
 
-def _df_to_markdown(df) -> list[str]:
-    """Convert a Polars DataFrame to Markdown table lines."""
+# --output file buffer: large enough that chunked Markdown writes coalesce
+# into a handful of write(2) calls (the default is 8 KiB)
+_OUTPUT_BUFFER_BYTES = 1 << 20
+_MD_CHUNK_BYTES = 1 << 16
+_MD_SLICE_ROWS = 10_000
+
+# Pipes would split a cell and newlines would end the row early
+_MD_ESCAPE = str.maketrans({"|": "\\|", "\n": " ", "\r": " "})
+
+
+def _md_cell(val: Any) -> str:
+    """Format a single Markdown table cell of unknown type."""
+    if val is None:
+        return ""
+    if isinstance(val, str):
+        return val.translate(_MD_ESCAPE)
+    if isinstance(val, float) and val != val:
+        return ""
+    if hasattr(val, "isoformat"):
+        return val.isoformat()
+    return str(val)
+
+
+def _md_str(val: str | None) -> str:
+    return "" if val is None else val.translate(_MD_ESCAPE)
+
+
+def _md_iso(val: Any) -> str:
+    return "" if val is None else val.isoformat()
+
+
+def _md_plain(val: Any) -> str:
+    return "" if val is None else str(val)
+
+
+def _md_formatter(dtype: Any) -> Callable[[Any], str]:
+    """Pick the cell formatter for a column once, from its Polars dtype."""
+    import polars as pl
+
+    if dtype == pl.String:
+        return _md_str
+    if dtype in (pl.Date, pl.Time) or isinstance(dtype, pl.Datetime):
+        return _md_iso
+    if dtype.is_numeric() or dtype == pl.Boolean:
+        return _md_plain
+    return _md_cell
+
+
+def _iter_markdown_chunks(df: Any) -> Iterator[bytes]:
+    """Yield a Polars DataFrame as UTF-8 Markdown table bytes, in ~64 KiB chunks.
+
+    Cell formatters are chosen per column before any row is touched, then each
+    slice of rows is formatted column by column (NaN already nulled by Polars)
+    and zipped back into lines. Rows are appended to a reusable ``bytearray``
+    that is flushed whenever it passes ``_MD_CHUNK_BYTES``.
+    """
     headers = df.columns
-    rows = df.rows()
-
-    # Format cells
-    def fmt(val) -> str:
-        if val is None:
-            return ""
-        if isinstance(val, float) and val != val:
-            return ""
-        if hasattr(val, "isoformat"):
-            return val.isoformat()
-        return str(val)
-
-    header_line = "| " + " | ".join(headers) + " |"
-    separator = "| " + " | ".join("---" for _ in headers) + " |"
-    data_lines = ["| " + " | ".join(fmt(v) for v in row) + " |" for row in rows]
-
-    return [header_line, separator, *data_lines]
+    formatters = [_md_formatter(dtype) for dtype in df.dtypes]
+    buf = bytearray(("| " + " | ".join(map(_md_cell, headers)) + " |\n").encode("utf-8"))
+    buf += ("| " + " | ".join(["---"] * len(headers)) + " |\n").encode("utf-8")
+
+    for part in df.iter_slices(n_rows=_MD_SLICE_ROWS):
+        cols = []
+        for fmt, series in zip(formatters, part.get_columns()):
+            if series.dtype.is_float():
+                series = series.fill_nan(None)
+            cols.append(list(map(fmt, series.to_list())))
+        for cells in zip(*cols):
+            buf += ("| " + " | ".join(cells) + " |\n").encode("utf-8")
+            if len(buf) >= _MD_CHUNK_BYTES:
+                yield bytes(buf)
+                buf.clear()
+    if buf:
+        yield bytes(buf)
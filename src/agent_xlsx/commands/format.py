@@ -117,11 +117,12 @@ def format_cmd(
     if read:
         if is_multi and ranges:
             target_sheet = _resolve_sheet(cell, sheet, str(path), ranges)
+            # Use start cell of each range as representative; one workbook load for all
+            formats = oxl.get_cells_formatting(
+                str(path), target_sheet, [ri["start"] for ri in ranges]
+            )
             results = []
-            for ri in ranges:
-                # Use start cell of each range as representative
-                cell_ref = ri["start"]
-                result = oxl.get_cell_formatting(str(path), target_sheet, cell_ref)
+            for ri, result in zip(ranges, formats):
                 range_str = f"{ri['start']}:{ri['end']}" if ri.get("end") else ri["start"]
                 results.append({"range": range_str, "formatting": result})
             output_spreadsheet_data({"results": results, "total_ranges": len(results)})
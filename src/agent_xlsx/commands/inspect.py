@@ -5,7 +5,7 @@ charts, VBA presence, formatting, comments, conditional formatting,
 data validation, and hyperlinks.
 """
 
-from typing import Optional
+from typing import Any, Optional
 
 import typer
 
@@ -55,6 +55,41 @@ def inspect_cmd(
     ),
 ) -> None:
     """Detailed inspection of workbook elements."""
+    output_spreadsheet_data(
+        run(
+            file=file,
+            sheet=sheet,
+            range_=range_,
+            names=names,
+            charts=charts,
+            vba=vba,
+            format_cell=format_cell,
+            comments=comments,
+            conditional=conditional,
+            validation=validation,
+            hyperlinks=hyperlinks,
+        )
+    )
+
+
+def run(
+    file: str,
+    sheet: Optional[str] = None,
+    range_: Optional[str] = None,
+    names: bool = False,
+    charts: bool = False,
+    vba: bool = False,
+    format_cell: Optional[str] = None,
+    comments: bool = False,
+    conditional: Optional[str] = None,
+    validation: Optional[str] = None,
+    hyperlinks: Optional[str] = None,
+) -> dict[str, Any]:
+    """Build the ``inspect`` payload without printing it.
+
+    Same options as the CLI command; the returned dict is what ``inspect``
+    prints, minus the ``_data_origin`` tag added at output time.
+    """
     path = validate_file(file)
 
     if format_cell:
@@ -75,9 +110,7 @@ def inspect_cmd(
             format_cell = parts[1]
         if not fmt_sheet:
             fmt_sheet = _default_sheet(str(path))
-        result = oxl.get_cell_formatting(str(path), fmt_sheet, format_cell)
-        output_spreadsheet_data(result)
-        return
+        return oxl.get_cell_formatting(str(path), fmt_sheet, format_cell)
 
     if range_:
         parsed = parse_range(range_)
@@ -86,18 +119,14 @@ def inspect_cmd(
         summary = summarise_formulas(formulas, MAX_FORMULA_CELLS)
         summary["range"] = range_
         summary["sheet"] = r_sheet
-        output_spreadsheet_data(summary)
-        return
+        return summary
 
     if names:
         meta = oxl.get_workbook_metadata(str(path))
-        output_spreadsheet_data(
-            {
-                "named_ranges": meta["named_ranges"],
-                "count": meta["named_range_count"],
-            }
-        )
-        return
+        return {
+            "named_ranges": meta["named_ranges"],
+            "count": meta["named_range_count"],
+        }
 
     if charts:
         meta = oxl.get_workbook_metadata(str(path))
@@ -110,36 +139,27 @@ def inspect_cmd(
                         "chart_count": s["chart_count"],
                     }
                 )
-        output_spreadsheet_data(
-            {
-                "charts": charts_data,
-                "total_chart_count": meta["total_chart_count"],
-            }
-        )
-        return
+        return {
+            "charts": charts_data,
+            "total_chart_count": meta["total_chart_count"],
+        }
 
     if vba:
         meta = oxl.get_workbook_metadata(str(path))
-        output_spreadsheet_data(
-            {
-                "has_vba": meta["has_vba"],
-            }
-        )
-        return
+        return {
+            "has_vba": meta["has_vba"],
+        }
 
     if comments:
         target_sheet = sheet or _default_sheet(str(path))
         comment_list = oxl.get_comments(str(path), target_sheet)
         capped = cap_list(comment_list, MAX_LOCATIONS)
-        output_spreadsheet_data(
-            {
-                "sheet": target_sheet,
-                "comments": capped["items"],
-                "comment_count": capped["total"],
-                "truncated": capped["truncated"],
-            }
-        )
-        return
+        return {
+            "sheet": target_sheet,
+            "comments": capped["items"],
+            "comment_count": capped["total"],
+            "truncated": capped["truncated"],
+        }
 
     if conditional:
         # conditional can be "Sheet1!A1:D100" or just a sheet name
@@ -148,51 +168,40 @@ def inspect_cmd(
             cf_sheet = conditional.split("!", 1)[0]
         cf_rules = oxl.get_conditional_formatting(str(path), cf_sheet)
         capped = cap_list(cf_rules, MAX_LOCATIONS)
-        output_spreadsheet_data(
-            {
-                "sheet": cf_sheet,
-                "rules": capped["items"],
-                "rule_count": capped["total"],
-                "truncated": capped["truncated"],
-            }
-        )
-        return
+        return {
+            "sheet": cf_sheet,
+            "rules": capped["items"],
+            "rule_count": capped["total"],
+            "truncated": capped["truncated"],
+        }
 
     if validation:
         val_rules = oxl.get_data_validations(str(path), validation)
         capped = cap_list(val_rules, MAX_LOCATIONS)
-        output_spreadsheet_data(
-            {
-                "sheet": validation,
-                "validations": capped["items"],
-                "validation_count": capped["total"],
-                "truncated": capped["truncated"],
-            }
-        )
-        return
+        return {
+            "sheet": validation,
+            "validations": capped["items"],
+            "validation_count": capped["total"],
+            "truncated": capped["truncated"],
+        }
 
     if hyperlinks:
         link_list = oxl.get_hyperlinks(str(path), hyperlinks)
         capped = cap_list(link_list, MAX_LOCATIONS)
-        output_spreadsheet_data(
-            {
-                "sheet": hyperlinks,
-                "hyperlinks": capped["items"],
-                "hyperlink_count": capped["total"],
-                "truncated": capped["truncated"],
-            }
-        )
-        return
+        return {
+            "sheet": hyperlinks,
+            "hyperlinks": capped["items"],
+            "hyperlink_count": capped["total"],
+            "truncated": capped["truncated"],
+        }
 
     if sheet:
         # Full sheet inspection — everything in one pass
-        result = oxl.get_full_sheet_inspection(str(path), sheet)
-        output_spreadsheet_data(result)
-        return
+        return oxl.get_full_sheet_inspection(str(path), sheet)
 
     # --- Default: inspect all sheets with summary metadata ---
     meta = oxl.get_workbook_metadata(str(path))
-    output_spreadsheet_data(meta)
+    return meta
 
 
 def _default_sheet(filepath: str) -> str:
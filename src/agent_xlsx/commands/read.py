@@ -18,7 +18,11 @@ from agent_xlsx.cli import app
 from agent_xlsx.formatters.json_formatter import output_spreadsheet_data, should_include_meta
 from agent_xlsx.utils.constants import DEFAULT_LIMIT, DEFAULT_OFFSET, MAX_READ_ROWS
 from agent_xlsx.utils.dataframe import apply_compact
-from agent_xlsx.utils.dates import detect_date_column_indices, excel_serial_to_isodate
+from agent_xlsx.utils.dates import (
+    detect_date_column_indices,
+    is_serial_dtype,
+    serial_to_isodate_expr,
+)
 from agent_xlsx.utils.errors import SheetNotFoundError, handle_error
 from agent_xlsx.utils.validation import (
     ParsedRange,
@@ -97,6 +101,54 @@ def read(
     multi-range reads, and --all-sheets to read the same range(s) from
     every sheet.
     """
+    if format_ == "csv" and not formulas and not all_sheets and not _is_multi_range(range_):
+        _output_csv(
+            _read_frame(
+                file, range_, sheet, limit, offset, sort, descending, no_header, headers, compact
+            )
+        )
+        return
+    output_spreadsheet_data(
+        run(
+            file=file,
+            range_=range_,
+            sheet=sheet,
+            limit=limit,
+            offset=offset,
+            formulas=formulas,
+            sort=sort,
+            descending=descending,
+            no_header=no_header,
+            headers=headers,
+            compact=compact,
+            all_sheets=all_sheets,
+            precision=precision,
+        )
+    )
+
+
+def run(
+    file: str,
+    range_: Optional[str] = None,
+    sheet: Optional[str] = None,
+    limit: int = DEFAULT_LIMIT,
+    offset: int = DEFAULT_OFFSET,
+    formulas: bool = False,
+    sort: Optional[str] = None,
+    descending: bool = False,
+    no_header: bool = False,
+    headers: bool = False,
+    compact: bool = True,
+    all_sheets: bool = False,
+    precision: Optional[int] = None,
+) -> dict[str, Any]:
+    """Build the JSON ``read`` payload without printing it.
+
+    Same options as the CLI command; the returned dict is what ``read``
+    prints as JSON, minus the ``_data_origin`` tag added at output time.
+    ``--format csv`` applies only to single-range reads, which go through
+    :func:`_read_frame` instead.
+    """
     path = validate_file(file)
     start = time.perf_counter()
 
@@ -104,41 +156,14 @@ def read(
     effective_limit = min(limit, MAX_READ_ROWS)
 
     if formulas:
-        _read_with_formulas(path, range_, sheet, effective_limit, offset, compact, precision)
-        return
-
-    # --- Determine ranges to read ---
-    is_multi_range = range_ is not None and "," in range_
-
-    if is_multi_range:
-        assert range_ is not None  # Guaranteed by is_multi_range check above
-        ranges = parse_multi_range(range_)
-    elif range_:
-        ranges = [parse_range(range_)]
-    else:
-        ranges = []  # No range — full sheet read
+        return _read_with_formulas(path, range_, sheet, effective_limit, offset, compact, precision)
 
-    # --- Determine target sheets ---
+    ranges = _parse_ranges(range_)
     available = get_sheet_names(str(path))
-
-    if all_sheets:
-        target_sheets: list[str | int] = list(available)
-    elif ranges and ranges[0]["sheet"]:
-        ts = ranges[0]["sheet"]
-        if ts not in available:
-            raise SheetNotFoundError(ts, available)
-        target_sheets = [ts]
-    elif sheet:
-        if sheet not in available:
-            raise SheetNotFoundError(sheet, available)
-        target_sheets = [sheet]
-    else:
-        target_sheets = [0]  # Default to first sheet
+    target_sheets = _target_sheets(ranges, sheet, all_sheets, available)
 
     # --- Multi-result path (multi-range OR all-sheets) ---
-    is_multi = is_multi_range or all_sheets
-
-    if is_multi:
+    if _is_multi_range(range_) or all_sheets:
         # Auto-resolve headers for multi-range reads — agents need header
         # names (e.g. "2014"), not column letters (e.g. "BG"). --no-header
         # is the explicit opt-out.
@@ -272,53 +297,24 @@ def read(
         }
         if should_include_meta():
             result["file_size_human"] = file_size_human(path)
-        output_spreadsheet_data(result)
-        return
+        return result
 
     # --- Single-range path (existing behaviour, backward compatible) ---
     target_sheet = target_sheets[0]
-    range_info = ranges[0] if ranges else None
-
-    oob_warning = None
-    if range_info and range_info["start"]:
-        df, oob_warning = _read_single_range(
-            path, target_sheet, range_info, no_header, effective_limit, offset
-        )
-    else:
-        df = read_sheet_data(
-            filepath=path,
-            sheet_name=target_sheet,
-            skip_rows=offset,
-            n_rows=effective_limit,
-            no_header=no_header,
-        )
-
-    df = apply_compact(df, compact)
-
-    # Resolve column letters to row-1 header names when --headers is used
-    column_map = None
-    if headers and not no_header and range_info and range_info.get("start"):
-        try:
-            sheet_headers = get_sheet_headers(path, target_sheet)
-            column_map = {}
-            for col_letter in df.columns:
-                idx = col_letter_to_index(col_letter)
-                if idx < len(sheet_headers):
-                    column_map[col_letter] = sheet_headers[idx]
-            rename_map = {letter: name for letter, name in column_map.items() if name}
-            df = df.rename(rename_map)
-        except Exception:
-            pass  # Header resolution is best-effort; don't break reads
-
-    if sort and sort in df.columns:
-        df = df.sort(sort, descending=descending)
-
+    df, column_map, oob_warning = _single_range_frame(
+        path,
+        ranges[0] if ranges else None,
+        target_sheet,
+        effective_limit,
+        offset,
+        sort,
+        descending,
+        no_header,
+        headers,
+        compact,
+    )
     elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
 
-    if format_ == "csv":
-        _output_csv(df)
-        return
-
     sheet_name_str = target_sheet if isinstance(target_sheet, str) else available[target_sheet]
     range_str = range_ or f"{sheet_name_str}"
 
@@ -347,7 +343,7 @@ def read(
     if not formulas and len(df) > 0:
         _add_formula_hint(result, df, path, target_sheet, available)
 
-    output_spreadsheet_data(result)
+    return result
 
 
 # ---------------------------------------------------------------------------
@@ -355,6 +351,125 @@ def read(
 # ---------------------------------------------------------------------------
 
 
+def _is_multi_range(range_: Optional[str]) -> bool:
+    return range_ is not None and "," in range_
+
+
+def _parse_ranges(range_: Optional[str]) -> list[ParsedRange]:
+    """Parse the RANGE argument; an empty list means a full-sheet read."""
+    if not range_:
+        return []
+    if _is_multi_range(range_):
+        return parse_multi_range(range_)
+    return [parse_range(range_)]
+
+
+def _target_sheets(
+    ranges: list[ParsedRange],
+    sheet: Optional[str],
+    all_sheets: bool,
+    available: list[str],
+) -> list[str | int]:
+    """Resolve which sheet(s) to read, raising SheetNotFoundError for unknown names."""
+    if all_sheets:
+        return list(available)
+    if ranges and ranges[0]["sheet"]:
+        ts = ranges[0]["sheet"]
+        if ts not in available:
+            raise SheetNotFoundError(ts, available)
+        return [ts]
+    if sheet:
+        if sheet not in available:
+            raise SheetNotFoundError(sheet, available)
+        return [sheet]
+    return [0]  # Default to first sheet
+
+
+def _read_frame(
+    file: str,
+    range_: Optional[str],
+    sheet: Optional[str],
+    limit: int,
+    offset: int,
+    sort: Optional[str],
+    descending: bool,
+    no_header: bool,
+    headers: bool,
+    compact: bool,
+) -> pl.DataFrame:
+    """Single-range read as a DataFrame, for ``--format csv``."""
+    path = validate_file(file)
+    ranges = _parse_ranges(range_)
+    available = get_sheet_names(str(path))
+    target_sheet = _target_sheets(ranges, sheet, False, available)[0]
+    df, _, _ = _single_range_frame(
+        path,
+        ranges[0] if ranges else None,
+        target_sheet,
+        min(limit, MAX_READ_ROWS),
+        offset,
+        sort,
+        descending,
+        no_header,
+        headers,
+        compact,
+    )
+    return df
+
+
+def _single_range_frame(
+    path: Path,
+    range_info: ParsedRange | None,
+    target_sheet: str | int,
+    effective_limit: int,
+    offset: int,
+    sort: Optional[str],
+    descending: bool,
+    no_header: bool,
+    headers: bool,
+    compact: bool,
+) -> tuple[pl.DataFrame, dict[str, str] | None, str | None]:
+    """Read one range (or the whole sheet) and apply compact, --headers and --sort.
+
+    Returns ``(df, column_map, oob_warning)``.
+    """
+    oob_warning = None
+    if range_info and range_info["start"]:
+        df, oob_warning = _read_single_range(
+            path, target_sheet, range_info, no_header, effective_limit, offset
+        )
+    else:
+        df = read_sheet_data(
+            filepath=path,
+            sheet_name=target_sheet,
+            skip_rows=offset,
+            n_rows=effective_limit,
+            no_header=no_header,
+        )
+
+    df = apply_compact(df, compact)
+
+    # Resolve column letters to row-1 header names when --headers is used
+    column_map = None
+    if headers and not no_header and range_info and range_info.get("start"):
+        try:
+            sheet_headers = get_sheet_headers(path, target_sheet)
+            column_map = {}
+            for col_letter in df.columns:
+                idx = col_letter_to_index(col_letter)
+                if idx < len(sheet_headers):
+                    column_map[col_letter] = sheet_headers[idx]
+            rename_map = {letter: name for letter, name in column_map.items() if name}
+            df = df.rename(rename_map)
+        except Exception:
+            pass  # Header resolution is best-effort; don't break reads
+
+    if sort and sort in df.columns:
+        df = df.sort(sort, descending=descending)
+
+    return df, column_map, oob_warning
+
+
 def _find_empty_col_indices(df: pl.DataFrame) -> list[int]:
     """Return column indices that contain null or empty-string values."""
     empty_indices = []
@@ -495,27 +610,26 @@ def _apply_date_conversion(
     """Best-effort conversion of Excel serial numbers to ISO dates.
 
     Uses index-based detection so it works in both normal and --no-header mode.
+    Each date column is converted in one columnar Polars pass; only cells
+    holding an in-range serial (numeric, or a numeric string under --no-header,
+    where all columns are String) are replaced.
     """
     try:
         sheet_arg = target_sheet if isinstance(target_sheet, str) else None
         date_indices = detect_date_column_indices(str(path), sheet_arg)
-        if not date_indices:
+        if not date_indices or not rows:
             return rows
-        for row in rows:
-            for idx in date_indices:
-                if idx >= len(row):
-                    continue
-                val = row[idx]
-                # --no-header makes all columns String; coerce numeric strings
-                if isinstance(val, str):
-                    try:
-                        val = float(val)
-                    except (ValueError, TypeError):
-                        continue
-                if isinstance(val, (int, float)) and val == val and val > 0:
-                    converted = excel_serial_to_isodate(float(val))
-                    if converted is not None:
-                        row[idx] = converted
+        for idx in sorted(date_indices):
+            values = [row[idx] if idx < len(row) else None for row in rows]
+            column = pl.Series(values, strict=False)
+            if not is_serial_dtype(column.dtype):
+                continue  # e.g. already Date/Datetime values — not serials
+            if column.dtype == pl.String:
+                column = column.str.strip_chars()  # float() accepted " 45000 "; the cast does not
+            converted = pl.select(serial_to_isodate_expr(pl.lit(column))).to_series()
+            for row, iso in zip(rows, converted):
+                if iso is not None:
+                    row[idx] = iso
     except Exception:
         pass  # date detection is best-effort; don't break reads
     return rows
@@ -529,7 +643,7 @@ def _read_with_formulas(
     offset: int,
     compact: bool = True,
     precision: int | None = None,
-) -> None:
+) -> dict[str, Any]:
     """Read with formula strings via openpyxl (slower path)."""
     start = time.perf_counter()
 
@@ -608,7 +722,7 @@ def _read_with_formulas(
     if should_include_meta():
         result["file_size_human"] = file_size_human(path)
 
-    output_spreadsheet_data(result)
+    return result
 
 
 def _output_csv(df) -> None:
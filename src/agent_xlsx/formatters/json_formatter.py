@@ -3,13 +3,29 @@
 from __future__ import annotations
 
 import json
+import math
 import sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path as _Path
 from typing import Any
 
+try:
+    import orjson as _orjson
+except ImportError:  # orjson is an optional accelerator — stdlib json is the fallback
+    _orjson = None
+
+if _orjson is not None:
+    _ORJSON_COMPACT = _orjson.OPT_PASSTHROUGH_DATETIME | _orjson.OPT_NON_STR_KEYS
+    _ORJSON_PRETTY = _ORJSON_COMPACT | _orjson.OPT_INDENT_2
+
 # Module-level flag toggled by the global --no-meta CLI option
 _suppress_meta: bool = False
 
+# Provenance tag pre-encoded in dumps_pretty's layout. It is spliced in after
+# the opening brace of the encoded payload instead of copying the caller's
+# dict just to put one constant key first.
+_DATA_ORIGIN_PREFIX = b'{\n  "_data_origin": "untrusted_spreadsheet",'
+
 
 def set_suppress_meta(value: bool) -> None:
     """Toggle metadata suppression (called by the --no-meta global callback)."""
@@ -23,9 +39,19 @@ def should_include_meta() -> bool:
 
 
 def output(data: dict[str, Any]) -> None:
-    """Print a dict as compact JSON to stdout."""
-    json.dump(data, sys.stdout, indent=2, default=_serialise)
-    sys.stdout.write("\n")
+    """Print a dict as JSON to stdout."""
+    _write_stdout(dumps_pretty(data) + b"\n")
+
+
+def _write_stdout(payload: bytes) -> None:
+    """Write already-encoded UTF-8 JSON to stdout."""
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        sys.stdout.write(payload.decode())
+        return
+    sys.stdout.flush()  # keep ordering with any prior text writes
+    out.write(payload)
+    out.flush()
 
 
 def output_spreadsheet_data(data: dict[str, Any]) -> None:
@@ -36,10 +62,39 @@ def output_spreadsheet_data(data: dict[str, Any]) -> None:
     When ``--no-meta`` is active, the tag is suppressed to reduce token waste
     on repeated calls against the same file.
     """
-    if _suppress_meta:
+    rows = data.get("rows")
+    if isinstance(rows, Iterator):
+        header = {k: v for k, v in data.items() if k != "rows"}
+        if not _suppress_meta:
+            header = {"_data_origin": "untrusted_spreadsheet", **header}
+        stream_rows(header, rows)
+    elif _suppress_meta:
         output(data)
-    else:
+    elif not data or "_data_origin" in data:
         output({"_data_origin": "untrusted_spreadsheet", **data})
+    else:
+        _write_stdout(_DATA_ORIGIN_PREFIX + dumps_pretty(data)[1:] + b"\n")
+
+
+def stream_rows(header: dict[str, Any], rows_iter: Iterable[Any]) -> None:
+    """Write *header* then each row as newline-delimited compact JSON (NDJSON).
+
+    Rows are encoded and written one at a time, so peak memory stays flat
+    regardless of row count — the full result is never materialised as a
+    single JSON document.
+    """
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        # Text-only stream (no underlying byte buffer) — decode per line
+        sys.stdout.write(_dumps_compact(header).decode() + "\n")
+        for row in rows_iter:
+            sys.stdout.write(_dumps_compact(row).decode() + "\n")
+        return
+    sys.stdout.flush()  # keep ordering with any prior text writes
+    out.write(_dumps_compact(header) + b"\n")
+    for row in rows_iter:
+        out.write(_dumps_compact(row) + b"\n")
+    out.flush()
 
 
 def relativize_path(result: dict[str, Any], key: str = "output_file") -> dict[str, Any]:
@@ -58,6 +113,60 @@ def relativize_path(result: dict[str, Any], key: str = "output_file") -> dict[st
     return result
 
 
+def dumps_pretty(obj: Any) -> bytes:
+    """Encode *obj* as 2-space-indented UTF-8 JSON, using orjson when installed.
+
+    Datetimes are passed through to :func:`_serialise` so both encoders
+    format them identically; anything orjson rejects (e.g. integers wider
+    than 64 bits) falls back to the stdlib encoder. The two are semantically
+    equivalent — same layout, raw UTF-8, NaN/inf as ``null`` — but float
+    spelling can differ (orjson writes ``1e-7``, the stdlib ``1e-07``).
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj, default=_serialise, option=_ORJSON_PRETTY)
+        except TypeError:
+            pass
+    return _dumps_stdlib(obj, indent=2)
+
+
+def _dumps_compact(obj: Any) -> bytes:
+    """Encode *obj* as compact UTF-8 JSON, using orjson when installed."""
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj, default=_serialise, option=_ORJSON_COMPACT)
+        except TypeError:
+            pass
+    return _dumps_stdlib(obj, separators=(",", ":"))
+
+
+def _dumps_stdlib(obj: Any, **kwargs: Any) -> bytes:
+    """Stdlib fallback equivalent to orjson's output: raw UTF-8, NaN/inf as ``null``.
+
+    ``json.dumps`` would otherwise emit the invalid tokens ``NaN``/``Infinity``,
+    so non-finite floats are swapped for ``None`` — only when one is present,
+    keeping the common case a single encode.
+    """
+    try:
+        encoded = json.dumps(obj, ensure_ascii=False, allow_nan=False, default=_serialise, **kwargs)
+    except ValueError:
+        encoded = json.dumps(
+            _finite(obj), ensure_ascii=False, allow_nan=False, default=_serialise, **kwargs
+        )
+    return encoded.encode()
+
+
+def _finite(obj: Any) -> Any:
+    """Copy *obj* with non-finite floats replaced by ``None``."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _finite(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(v) for v in obj]
+    return obj
+
+
 def _serialise(obj: Any) -> Any:
     """Handle non-standard types during JSON serialisation."""
     import datetime
@@ -73,8 +182,10 @@ def _serialise(obj: Any) -> Any:
         return str(obj)
     if hasattr(obj, "__float__"):
         v = float(obj)
+        if not math.isfinite(v):
+            return None  # NaN/inf have no JSON spelling; orjson also writes null
         # Return int if it's a whole number for cleaner output
-        if v == int(v) and not (v != v):  # NaN check
+        if v == int(v):
             return int(v)
         return v
     return str(obj)
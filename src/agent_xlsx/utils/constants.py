@@ -34,10 +34,10 @@ CHUNK_THRESHOLD_BYTES = 100 * 1024 * 1024  # 100MB — chunk reads above this
 WRITE_SIZE_WARN_BYTES = 20 * 1024 * 1024  # 20MB — warn/block before loading for write ops
 CHUNK_SIZE_ROWS = 100_000
 
-# Supported file extensions
-EXCEL_EXTENSIONS = {".xlsx", ".xlsm", ".xlsb", ".xls", ".ods"}
-WRITABLE_EXTENSIONS = {".xlsx", ".xlsm"}
-VBA_EXTENSIONS = {".xlsm", ".xlsb"}
+# Supported file extensions (lowercase; frozen so they are safe to share)
+EXCEL_EXTENSIONS = frozenset({".xlsx", ".xlsm", ".xlsb", ".xls", ".ods"})
+WRITABLE_EXTENSIONS = frozenset({".xlsx", ".xlsm"})
+VBA_EXTENSIONS = frozenset({".xlsm", ".xlsb"})
 
 # Default pagination
 DEFAULT_LIMIT = 100
@@ -9,5 +9,8 @@ def apply_compact(df: pl.DataFrame, compact: bool) -> pl.DataFrame:
     """Drop fully-null columns when compact mode is enabled."""
     if not compact or len(df) == 0:
         return df
-    non_null_cols = [col for col in df.columns if df[col].null_count() < len(df)]
+    n_rows = len(df)
+    # One null_count() pass over all columns instead of a call per column
+    null_counts = df.null_count().row(0)
+    non_null_cols = [col for col, nc in zip(df.columns, null_counts) if nc < n_rows]
     return df.select(non_null_cols) if non_null_cols else df
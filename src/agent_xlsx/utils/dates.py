@@ -2,13 +2,36 @@
 
 from __future__ import annotations
 
-import re
-from datetime import datetime, timedelta
+import functools
+import os
+import posixpath
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-# Regex to detect date-like number formats in Excel (contains year or day tokens)
-_DATE_FORMAT_RE = re.compile(r"[yYdD]")
+if TYPE_CHECKING:
+    import polars as pl
+
+# Date-like number formats in Excel contain year or day tokens
+_DATE_FORMAT_CHARS = frozenset("yYdD")
+
+# Excel's day zero (serial 0) under the 1900 date system
+_EXCEL_EPOCH = datetime(1899, 12, 30)
+_EXCEL_EPOCH_ORD = _EXCEL_EPOCH.toordinal()
+_US_PER_DAY = 86_400_000_000
+# Largest serial Excel can display as a date (9999-12-31)
+_MAX_SERIAL = 2_958_465
+
+
+def _is_date_format(fmt: str | None) -> bool:
+    """Whether an Excel number format string carries year or day tokens.
+
+    ``"General"`` — by far the most common format — is rejected by an
+    equality check before the character scan.
+    """
+    return bool(fmt) and fmt != "General" and not _DATE_FORMAT_CHARS.isdisjoint(fmt)
 
 
 def detect_date_columns(filepath: str | Path, sheet_name: str | None = None) -> dict[str, bool]:
@@ -51,8 +74,7 @@ def detect_date_columns(filepath: str | Path, sheet_name: str | None = None) ->
                 continue
             header_name = str(header_name)
 
-            fmt = data_cell.number_format or "General"
-            if _DATE_FORMAT_RE.search(fmt):
+            if _is_date_format(data_cell.number_format):
                 date_cols[header_name] = True
 
         return date_cols
@@ -66,25 +88,33 @@ def excel_serial_to_isodate(serial: float) -> str | None:
     Returns date-only (``"2024-02-15"``) for whole numbers, or
     datetime (``"2024-02-15T14:30:00"``) when a fractional time
     component is present.  Returns ``None`` for NaN values and the
-    serial as-is for non-positive values.
+    serial as-is for non-positive values and values past 9999-12-31.
     """
     if serial != serial:  # NaN check
         return None
-    if serial <= 0:
+    if serial <= 0 or serial >= _MAX_SERIAL + 1:
         return serial  # type: ignore[return-value]
 
-    base = datetime(1899, 12, 30)
     int_part = int(serial)
     frac_part = serial - int_part
 
-    dt = base + timedelta(days=int_part)
-
     if frac_part > 1e-9:
         # Has a time component
-        dt = dt + timedelta(days=frac_part)
-        return dt.strftime("%Y-%m-%dT%H:%M:%S")
+        dt = datetime.fromordinal(_EXCEL_EPOCH_ORD + int_part) + timedelta(days=frac_part)
+        return dt.isoformat(timespec="seconds")
+
+    return _iso_whole_day(int_part)
 
-    return dt.strftime("%Y-%m-%d")
+
+@functools.lru_cache(maxsize=65536)
+def _iso_whole_day(int_serial: int) -> str:
+    """ISO date for a whole-day serial.
+
+    Cached because date columns repeat the same serials across many rows;
+    65k entries bound the cache at a few MB.
+    """
+    # Ordinal arithmetic skips datetime/strftime entirely
+    return date.fromordinal(_EXCEL_EPOCH_ORD + int_serial).isoformat()
 
 
 def detect_date_column_indices(filepath: str | Path, sheet_name: str | None = None) -> set[int]:
@@ -93,7 +123,18 @@ def detect_date_column_indices(filepath: str | Path, sheet_name: str | None = No
     Unlike :func:`detect_date_columns` which returns header names, this
     returns indices — making it safe for ``--no-header`` mode where
     DataFrame columns are letters (A, B, C) rather than header values.
+
+    Reads ``styles.xml`` and row 2 of the worksheet straight from the zip
+    where possible, falling back to openpyxl for anything else.
     """
+    try:
+        return _detect_indices_from_xml(filepath, sheet_name)
+    except (zipfile.BadZipFile, KeyError, ValueError, SyntaxError):
+        return _detect_indices_openpyxl(filepath, sheet_name)
+
+
+def _detect_indices_openpyxl(filepath: str | Path, sheet_name: str | None) -> set[int]:
+    """openpyxl implementation of :func:`detect_date_column_indices`."""
     import openpyxl
 
     wb = openpyxl.load_workbook(str(filepath), read_only=True)
@@ -117,11 +158,7 @@ def detect_date_column_indices(filepath: str | Path, sheet_name: str | None = No
         except StopIteration:
             return set()
 
-        return {
-            i
-            for i, cell in enumerate(data_row)
-            if _DATE_FORMAT_RE.search(cell.number_format or "General")
-        }
+        return {i for i, cell in enumerate(data_row) if _is_date_format(cell.number_format)}
     finally:
         wb.close()
 
@@ -134,7 +171,20 @@ def detect_date_column_indices_batch(
     Returns ``{sheet_name: set[int]}`` mapping each sheet to its 0-based
     date column indices.  More efficient than calling
     :func:`detect_date_column_indices` per sheet.
+
+    For ``.xlsx``/``.xlsm`` packages the styles table and the first two
+    rows of each worksheet are streamed straight from the zip, skipping
+    openpyxl's workbook model.  Anything that cannot be read that way
+    falls back to openpyxl.
     """
+    try:
+        return _detect_batch_from_xml(filepath, sheet_names)
+    except (zipfile.BadZipFile, KeyError, ValueError, SyntaxError):
+        return _detect_batch_openpyxl(filepath, sheet_names)
+
+
+def _detect_batch_openpyxl(filepath: str | Path, sheet_names: list[str]) -> dict[str, set[int]]:
+    """openpyxl implementation of :func:`detect_date_column_indices_batch`."""
     import openpyxl
 
     result: dict[str, set[int]] = {}
@@ -157,15 +207,231 @@ def detect_date_column_indices_batch(
                 result[name] = set()
                 continue
             result[name] = {
-                i
-                for i, cell in enumerate(data_row)
-                if _DATE_FORMAT_RE.search(cell.number_format or "General")
+                i for i, cell in enumerate(data_row) if _is_date_format(cell.number_format)
             }
         return result
     finally:
         wb.close()
 
 
+# ---------------------------------------------------------------------------
+# Direct OOXML scanning (no openpyxl workbook model)
+# ---------------------------------------------------------------------------
+
+
+def _local(tag: str) -> str:
+    """Strip the ``{namespace}`` prefix from an XML tag or attribute name."""
+    return tag.rpartition("}")[2]
+
+
+def _detect_batch_from_xml(filepath: str | Path, sheet_names: list[str]) -> dict[str, set[int]]:
+    """Zip + XML-streaming implementation of :func:`detect_date_column_indices_batch`."""
+    with zipfile.ZipFile(filepath) as zf:
+        parts = _sheet_parts(zf)
+        date_styles = _date_style_ids(zf)
+        result: dict[str, set[int]] = {name: set() for name in sheet_names}
+        if not date_styles:
+            return result
+        todo = [(name, parts[name]) for name in sheet_names if name in parts]
+
+        def scan(part: str) -> set[int]:
+            return {col for col, style in _row2_style_ids(zf, part).items() if style in date_styles}
+
+        if len(todo) > 1:
+            # ZipFile reads are thread-safe and zlib inflation releases the GIL,
+            # so sheets overlap their decompression.
+            workers = min(len(todo), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                scanned = pool.map(scan, [part for _, part in todo])
+                for (name, _), cols in zip(todo, scanned):
+                    result[name] = cols
+        else:
+            for name, part in todo:
+                result[name] = scan(part)
+        return result
+
+
+def _detect_indices_from_xml(filepath: str | Path, sheet_name: str | None) -> set[int]:
+    """Zip + XML-streaming implementation of :func:`detect_date_column_indices`."""
+    with zipfile.ZipFile(filepath) as zf:
+        parts = _sheet_parts(zf)
+        if sheet_name is None:
+            ordered = list(parts.values())
+            active = _active_tab(zf)
+            part = ordered[active] if active < len(ordered) else None
+        else:
+            part = parts.get(sheet_name)
+        if part is None:
+            return set()
+        date_styles = _date_style_ids(zf)
+        if not date_styles:
+            return set()
+        return {col for col, style in _row2_style_ids(zf, part).items() if style in date_styles}
+
+
+def _active_tab(zf: zipfile.ZipFile) -> int:
+    """Index of the active sheet (``bookViews/workbookView@activeTab``, default 0)."""
+    from defusedxml.ElementTree import parse
+
+    with zf.open("xl/workbook.xml") as fh:
+        for el in parse(fh).getroot().iter():
+            if _local(el.tag) == "workbookView":
+                return int(el.get("activeTab", 0))
+    return 0
+
+
+def _sheet_parts(zf: zipfile.ZipFile) -> dict[str, str]:
+    """Map sheet names (in workbook order) to their part paths inside an ``.xlsx`` package."""
+    from defusedxml.ElementTree import parse
+
+    targets: dict[str, str] = {}
+    with zf.open("xl/_rels/workbook.xml.rels") as fh:
+        for rel in parse(fh).getroot():
+            target = rel.get("Target", "")
+            targets[rel.get("Id", "")] = (
+                target.lstrip("/") if target.startswith("/") else posixpath.normpath(f"xl/{target}")
+            )
+
+    parts: dict[str, str] = {}
+    with zf.open("xl/workbook.xml") as fh:
+        for el in parse(fh).getroot().iter():
+            if _local(el.tag) != "sheet":
+                continue
+            rel_id = next((v for k, v in el.attrib.items() if _local(k) == "id"), None)
+            if rel_id in targets:
+                parts[el.get("name", "")] = targets[rel_id]
+    return parts
+
+
+def _date_style_ids(zf: zipfile.ZipFile) -> set[int]:
+    """Indices into ``cellXfs`` whose number format is date-like.
+
+    Built-in format ids resolve through openpyxl's table, so results match
+    what ``cell.number_format`` reports.
+    """
+    from defusedxml.ElementTree import parse
+    from openpyxl.styles.numbers import BUILTIN_FORMATS
+
+    try:
+        fh = zf.open("xl/styles.xml")
+    except KeyError:
+        return set()
+    with fh:
+        root = parse(fh).getroot()
+
+    custom: dict[int, str] = {}
+    xf_formats: list[int] = []
+    for el in root:
+        name = _local(el.tag)
+        if name == "numFmts":
+            for fmt in el:
+                custom[int(fmt.get("numFmtId", 0))] = fmt.get("formatCode", "")
+        elif name == "cellXfs":
+            xf_formats = [int(xf.get("numFmtId", 0)) for xf in el]
+
+    return {
+        i
+        for i, fmt_id in enumerate(xf_formats)
+        if _is_date_format(custom.get(fmt_id, BUILTIN_FORMATS.get(fmt_id)))
+    }
+
+
+def _row2_style_ids(zf: zipfile.ZipFile, part: str) -> dict[int, int]:
+    """Return ``{0-based column: style index}`` for row 2 of a worksheet part.
+
+    Streams the sheet XML and stops as soon as row 2 has been read.
+    """
+    from defusedxml.ElementTree import iterparse
+
+    from agent_xlsx.utils.validation import col_letter_to_index
+
+    row_num = 0
+    with zf.open(part) as fh:
+        for _event, el in iterparse(fh, events=("end",)):
+            if _local(el.tag) != "row":
+                continue
+            ref = el.get("r")
+            row_num = int(ref) if ref else row_num + 1
+            if row_num < 2:
+                el.clear()
+                continue
+            if row_num > 2:
+                return {}
+            styles: dict[int, int] = {}
+            col = -1
+            for cell in el:
+                if _local(cell.tag) != "c":
+                    continue
+                cell_ref = cell.get("r")
+                col = col_letter_to_index(cell_ref.rstrip("0123456789")) if cell_ref else col + 1
+                styles[col] = int(cell.get("s", 0))
+            return styles
+    return {}
+
+
+def is_serial_dtype(dtype: pl.DataType) -> bool:
+    """Whether a column of *dtype* can hold Excel serials (numeric, or String under --no-header).
+
+    Temporal dtypes are excluded: casting a ``Date``/``Datetime`` to Float64
+    yields days or microseconds since 1970, not an Excel serial.
+    """
+    import polars as pl
+
+    return dtype.is_numeric() or dtype == pl.String
+
+
+def serial_to_isodate_expr(expr: pl.Expr) -> pl.Expr:
+    """Polars expression form of :func:`excel_serial_to_isodate`.
+
+    Evaluates to the ISO date (or datetime, when a time fraction is present)
+    for serials in Excel's date range (up to 9999-12-31) and to null for
+    everything else — non-positive or larger numbers, NaN, nulls and
+    non-numeric strings.  Numeric strings are
+    coerced, matching the ``--no-header`` handling of the scalar paths.
+    Callers must only apply it to columns passing :func:`is_serial_dtype`.
+    """
+    import polars as pl
+
+    serial = expr.cast(pl.Float64, strict=False).fill_nan(None)
+    micros = (serial * _US_PER_DAY).round(0).cast(pl.Int64, strict=False)
+    ts = pl.lit(_EXCEL_EPOCH) + pl.duration(microseconds=micros)
+    iso = (
+        pl.when(serial - serial.floor() > 1e-9)
+        .then(ts.dt.strftime("%Y-%m-%dT%H:%M:%S"))
+        .otherwise(ts.dt.strftime("%Y-%m-%d"))
+    )
+    return pl.when((serial > 0) & (serial < _MAX_SERIAL + 1)).then(iso)
+
+
+def convert_date_columns(df: pl.DataFrame, columns: list[str]) -> pl.DataFrame:
+    """Convert Excel serial numbers to ISO date strings for the named columns.
+
+    String columns have each numeric-serial cell replaced in place.  A
+    numeric column is converted only when every non-null value is an
+    in-range serial — otherwise it keeps its numbers rather than being
+    turned into strings wholesale.  Columns the reader already typed as
+    dates, and anything else that fails :func:`is_serial_dtype`, are left alone.
+    """
+    import polars as pl
+
+    string_cols = [c for c in columns if c in df.schema and df.schema[c] == pl.String]
+    numeric_cols = [c for c in columns if c in df.schema and df.schema[c].is_numeric()]
+
+    exprs: list[pl.Expr | pl.Series] = [
+        pl.coalesce(serial_to_isodate_expr(pl.col(c)), pl.col(c)).alias(c) for c in string_cols
+    ]
+    if numeric_cols:
+        converted = df.select(serial_to_isodate_expr(pl.col(c)).alias(c) for c in numeric_cols)
+        exprs += [
+            converted[c]
+            for c in numeric_cols
+            # NaN and non-positive values convert to null, so any extra null
+            # means the column is not purely serials
+            if converted[c].null_count() == df[c].null_count()
+        ]
+    return df.with_columns(exprs) if exprs else df
+
+
 def convert_date_values(
     rows: list[list[Any]],
     headers: list[str],
@@ -176,17 +442,31 @@ def convert_date_values(
     For each row, values at header indices that are in ``date_columns``
     are converted via :func:`excel_serial_to_isodate` when they are floats.
     Strings and ``None`` values pass through unchanged.
+
+    Numeric columns are converted in one vectorised Polars pass; columns
+    that mix strings with numbers fall back to the per-value conversion.
     """
+    import polars as pl
+
     # Pre-compute column indices for date columns
     date_indices = [i for i, h in enumerate(headers) if h in date_columns]
-    if not date_indices:
+    if not date_indices or not rows:
         return rows
 
-    for row in rows:
-        for idx in date_indices:
-            if idx >= len(row):
-                continue
-            val = row[idx]
-            if isinstance(val, (int, float)) and val == val:  # not NaN
-                row[idx] = excel_serial_to_isodate(float(val))
+    to_iso = excel_serial_to_isodate
+    numeric = (int, float)
+    for idx in date_indices:
+        values = [row[idx] if idx < len(row) else None for row in rows]
+        series = pl.Series(values, strict=False)
+        if not series.dtype.is_numeric():
+            # Mixed column: walk the already-extracted values (short rows hold
+            # None, so no bounds check) with the hot names bound as locals.
+            for row, val in zip(rows, values):
+                if isinstance(val, numeric) and val == val:  # not NaN
+                    row[idx] = to_iso(float(val))
+            continue
+        converted = pl.select(serial_to_isodate_expr(pl.lit(series))).to_series()
+        for row, iso in zip(rows, converted):
+            if iso is not None:
+                row[idx] = iso
     return rows
@@ -2,6 +2,40 @@
 
 from __future__ import annotations
 
+import functools
+
+# Availability probes are invariant for the life of a process (Excel's probe
+# launches an app instance), so each is run at most once.  Adapters are
+# imported at call time so tests can monkeypatch the probe functions.
+
+
+@functools.lru_cache(maxsize=1)
+def _aspose_ok() -> bool:
+    from agent_xlsx.adapters.aspose_adapter import is_aspose_available
+
+    return is_aspose_available()
+
+
+@functools.lru_cache(maxsize=1)
+def _excel_ok() -> bool:
+    from agent_xlsx.adapters.xlwings_adapter import is_excel_available
+
+    return is_excel_available()
+
+
+@functools.lru_cache(maxsize=1)
+def _libreoffice_ok() -> bool:
+    from agent_xlsx.adapters.libreoffice_adapter import is_libreoffice_available
+
+    return is_libreoffice_available()
+
+
+def clear_engine_cache() -> None:
+    """Forget cached engine availability (used by tests that mock the probes)."""
+    _aspose_ok.cache_clear()
+    _excel_ok.cache_clear()
+    _libreoffice_ok.cache_clear()
+
 
 def resolve_engine(command: str, engine: str, *, libreoffice: bool = True) -> str:
     """Resolve the backend engine for *command*.
@@ -21,8 +55,6 @@ def resolve_engine(command: str, engine: str, *, libreoffice: bool = True) -> st
     """
     import os
 
-    from agent_xlsx.adapters.aspose_adapter import is_aspose_available
-    from agent_xlsx.adapters.xlwings_adapter import is_excel_available
     from agent_xlsx.utils.errors import (
         AsposeNotInstalledError,
         ExcelRequiredError,
@@ -38,12 +70,12 @@ def resolve_engine(command: str, engine: str, *, libreoffice: bool = True) -> st
             engine_lower = env_engine.lower()
 
     if engine_lower == "excel":
-        if not is_excel_available():
+        if not _excel_ok():
             raise ExcelRequiredError(command)
         return "excel"
 
     if engine_lower == "aspose":
-        if not is_aspose_available():
+        if not _aspose_ok():
             raise AsposeNotInstalledError()
         return "aspose"
 
@@ -52,21 +84,17 @@ def resolve_engine(command: str, engine: str, *, libreoffice: bool = True) -> st
             # This command has no LibreOffice adapter; treat it as an unsupported
             # engine name rather than a missing installation.
             raise ExcelRequiredError(command)
-        from agent_xlsx.adapters.libreoffice_adapter import is_libreoffice_available
-
-        if not is_libreoffice_available():
+        if not _libreoffice_ok():
             raise LibreOfficeNotFoundError()
         return "libreoffice"
 
     if engine_lower == "auto":
-        if is_aspose_available():
+        if _aspose_ok():
             return "aspose"
-        if is_excel_available():
+        if _excel_ok():
             return "excel"
         if libreoffice:
-            from agent_xlsx.adapters.libreoffice_adapter import is_libreoffice_available
-
-            if is_libreoffice_available():
+            if _libreoffice_ok():
                 return "libreoffice"
             raise NoRenderingBackendError(command)
         raise ExcelRequiredError(command)
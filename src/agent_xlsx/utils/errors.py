@@ -3,8 +3,6 @@
 from __future__ import annotations
 
 import functools
-import json
-import sys
 from typing import Any
 
 
@@ -155,8 +153,10 @@ def handle_error(func):
         try:
             return func(*args, **kwargs)
         except AgentExcelError as e:
-            json.dump(e.to_dict(), sys.stdout, indent=2)
-            sys.stdout.write("\n")
+            # Same encoder and stdout write as success payloads
+            from agent_xlsx.formatters.json_formatter import output
+
+            output(e.to_dict())
             raise SystemExit(1)
 
     return wrapper
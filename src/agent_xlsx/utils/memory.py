@@ -2,21 +2,50 @@
 
 from __future__ import annotations
 
-import psutil
+import time
+from typing import TYPE_CHECKING
 
 from agent_xlsx.utils.constants import MAX_MEMORY_MB
 
+if TYPE_CHECKING:
+    import psutil
+
+# RSS readings younger than this are reused rather than re-sampled
+_CHECK_INTERVAL_S = 0.25
+
+_PROCESS: psutil.Process | None = None
+_last_check: list[float] = [float("-inf"), 0.0]  # [monotonic timestamp, memory_mb]
+
+
+def _proc() -> psutil.Process:
+    """This process's psutil handle — psutil is imported on first use only."""
+    global _PROCESS
+    if _PROCESS is None:
+        import psutil
+
+        _PROCESS = psutil.Process()
+    return _PROCESS
+
 
 def check_memory(limit_mb: float = MAX_MEMORY_MB) -> None:
-    """Raise if current process exceeds memory budget."""
+    """Raise if current process exceeds memory budget.
+
+    Called once per chunk in read loops, so the RSS sample is throttled to one
+    every ``_CHECK_INTERVAL_S`` — memory barely moves within that window.
+    """
     from agent_xlsx.utils.errors import MemoryExceededError
 
-    process = psutil.Process()
-    memory_mb = process.memory_info().rss / 1024 / 1024
+    now = time.monotonic()
+    if now - _last_check[0] < _CHECK_INTERVAL_S:
+        memory_mb = _last_check[1]
+    else:
+        memory_mb = _proc().memory_info().rss / 1024 / 1024
+        _last_check[0] = now
+        _last_check[1] = memory_mb
     if memory_mb > limit_mb:
         raise MemoryExceededError(memory_mb, limit_mb)
 
 
 def get_memory_mb() -> float:
     """Return current process memory in MB."""
-    return psutil.Process().memory_info().rss / 1024 / 1024
+    return _proc().memory_info().rss / 1024 / 1024
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import errno
+import functools
+import itertools
 import os
-import re
+import string
 from pathlib import Path
 from typing import TypedDict
 
@@ -11,6 +14,7 @@ from agent_xlsx.utils.constants import EXCEL_EXTENSIONS, WRITABLE_EXTENSIONS
 from agent_xlsx.utils.errors import (
     AgentExcelError,
     ExcelFileNotFoundError,
+    InvalidColumnError,
     InvalidFormatError,
     RangeInvalidError,
 )
@@ -26,12 +30,12 @@ class ParsedRange(TypedDict):
 
 def validate_file(filepath: str) -> Path:
     """Validate that the file exists and has a supported extension. Returns resolved Path."""
-    p = Path(filepath).resolve()
-    if not p.exists():
+    if not _exists(filepath):
         raise ExcelFileNotFoundError(filepath)
-    if p.suffix.lower() not in EXCEL_EXTENSIONS:
+    resolved = os.path.realpath(filepath)
+    if os.path.splitext(resolved)[1].lower() not in EXCEL_EXTENSIONS:
         raise InvalidFormatError(filepath)
-    return p
+    return Path(resolved)
 
 
 def validate_file_for_write(filepath: str) -> tuple[Path, bool]:
@@ -40,45 +44,65 @@ def validate_file_for_write(filepath: str) -> tuple[Path, bool]:
     Unlike validate_file(), allows non-existent files — they will be auto-created.
     Returns (resolved_path, is_new_file).
     """
-    p = Path(filepath).resolve()
-    if p.exists():
-        if p.suffix.lower() not in EXCEL_EXTENSIONS:
+    resolved = os.path.realpath(filepath)
+    suffix = os.path.splitext(resolved)[1].lower()
+    if _exists(filepath):
+        if suffix not in EXCEL_EXTENSIONS:
             raise InvalidFormatError(filepath)
-        return p, False
+        return Path(resolved), False
     # New file — must be a writable extension
-    if p.suffix.lower() not in WRITABLE_EXTENSIONS:
+    if suffix not in WRITABLE_EXTENSIONS:
         raise AgentExcelError(
             "INVALID_FORMAT",
             f"Cannot create '{filepath}' — only .xlsx and .xlsm files can be created",
             [f"Writable formats: {', '.join(sorted(WRITABLE_EXTENSIONS))}"],
         )
-    return p, True
+    return Path(resolved), True
+
+
+# errnos that mean "no such file" rather than a real failure (as Path.exists treats them)
+_MISSING_ERRNOS = frozenset({errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP})
+
+
+def _exists(filepath: str | Path) -> bool:
+    """Existence check with a single ``os.stat`` (no separate resolve + exists)."""
+    try:
+        os.stat(filepath)
+    except OSError as e:
+        if e.errno in _MISSING_ERRNOS:
+            return False
+        raise
+    except ValueError:  # embedded NUL and similar — cannot exist
+        return False
+    return True
+
+
+def file_stat(filepath: str | Path) -> os.stat_result:
+    """Return the ``os.stat`` result for *filepath* — one syscall for size, mtime, etc."""
+    return os.stat(filepath)
 
 
 def file_size_bytes(filepath: str | Path) -> int:
     """Return file size in bytes."""
-    return os.path.getsize(filepath)
+    return file_stat(filepath).st_size
 
 
 def file_size_human(filepath: str | Path) -> str:
     """Return file size as a human-readable string (e.g. '107.7 KB', '76.2 MB')."""
-    size = file_size_bytes(filepath)
-    if size < 1024:
-        return f"{size} B"
-    elif size < 1024 * 1024:
-        return f"{size / 1024:.1f} KB"
-    elif size < 1024 * 1024 * 1024:
-        return f"{size / (1024 * 1024):.1f} MB"
-    return f"{size / (1024 * 1024 * 1024):.1f} GB"
-
-
-# Pattern: optional "SheetName!" prefix, then cell range like A1:C10 or just A1
-_RANGE_RE = re.compile(
-    r"^(?:(?P<sheet>.+?)!)?"
-    r"(?P<start>[A-Z]{1,3}\d+)"
-    r"(?::(?P<end>[A-Z]{1,3}\d+))?$",
-    re.IGNORECASE,
-)
+    return file_size_human_from_stat(file_stat(filepath))
+
+
+def file_size_human_from_stat(st: os.stat_result) -> str:
+    """Human-readable size from an existing stat result, avoiding a second syscall."""
+    size = st.st_size
+    for unit, scale in _SIZE_UNITS:
+        if size >= scale:
+            return f"{size / scale:.1f} {unit}"
+    return f"{size} B"
+
+
+# Largest unit first; sizes below 1 KB are reported in plain bytes
+_SIZE_UNITS = (("GB", 1 << 30), ("MB", 1 << 20), ("KB", 1 << 10))
 
 
 def _normalise_shell_ref(ref: str) -> str:
@@ -88,7 +112,18 @@ def _normalise_shell_ref(ref: str) -> str:
     through subprocess chains (e.g. ``uv run``).  This strips the escape so
     ``2022\\!B1`` becomes ``2022!B1``.
     """
-    return ref.replace("\\!", "!")
+    return ref.replace("\\!", "!") if "\\" in ref else ref
+
+
+def _is_cell_ref(ref: str) -> bool:
+    """Cheap check for an ``A1``-style reference (1-3 ASCII letters, then digits)."""
+    letters = ref.rstrip("0123456789")
+    return (
+        0 < len(letters) <= 3
+        and len(letters) < len(ref)
+        and letters.isascii()
+        and letters.isalpha()
+    )
 
 
 def parse_range(range_str: str) -> ParsedRange:
@@ -96,14 +131,34 @@ def parse_range(range_str: str) -> ParsedRange:
 
     Returns dict with keys: sheet, start, end (end may be None for single cell).
     """
-    m = _RANGE_RE.match(_normalise_shell_ref(range_str).strip())
-    if not m:
+    sheet, start, end = _parse_range_cached(range_str)
+    return ParsedRange(sheet=sheet, start=start, end=end)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_range_cached(range_str: str) -> tuple[str | None, str, str | None]:
+    """Tokenise a range string into ``(sheet, start, end)``.
+
+    Memoised on the raw string — agents re-send the same ranges — and returns
+    a tuple so callers always get a fresh dict from :func:`parse_range`.
+    """
+    s = _normalise_shell_ref(range_str).strip()
+
+    # Tokenise by hand rather than with a regex: everything after the last
+    # "!" is the cell part, which splits on ":" into one or two references.
+    # The cell part is uppercased once; the sheet keeps its casing.
+    bang = s.rfind("!")
+    sheet = s[:bang] if bang >= 0 else None
+    cells = s[bang + 1 :]
+    start, colon, end = cells.upper().partition(":")
+    if (
+        sheet == ""
+        or not cells.isascii()  # str.upper() can map non-ASCII letters into A-Z ("ß" → "SS")
+        or not _is_cell_ref(start)
+        or (colon and not _is_cell_ref(end))
+    ):
         raise RangeInvalidError(range_str)
-    return ParsedRange(
-        sheet=m.group("sheet"),
-        start=m.group("start").upper(),
-        end=m.group("end").upper() if m.group("end") else None,
-    )
+    return sheet, start, end if colon else None
 
 
 def parse_multi_range(range_str: str) -> list[ParsedRange]:
@@ -113,15 +168,17 @@ def parse_multi_range(range_str: str) -> list[ParsedRange]:
     ranges that don't specify one, e.g.
     ``"2022!H54:AT54,H149:AT149"`` → both ranges on sheet ``"2022"``.
     """
-    parts = range_str.split(",")
     results: list[ParsedRange] = []
     sheet_ctx: str | None = None
-    for part in parts:
+    for part in range_str.split(","):
         part = part.strip()
-        if "!" in part:
-            parsed = parse_range(part)
-        elif sheet_ctx:
-            parsed = parse_range(f"{sheet_ctx}!{part}")
+        if sheet_ctx and "!" not in part:
+            # Inherit the carried sheet directly rather than re-tokenising "Sheet!part"
+            try:
+                _, start, end = _parse_range_cached(part)
+            except RangeInvalidError:
+                raise RangeInvalidError(f"{sheet_ctx}!{part}") from None
+            parsed = ParsedRange(sheet=sheet_ctx, start=start, end=end)
         else:
             parsed = parse_range(part)
         if parsed["sheet"]:
@@ -132,6 +189,16 @@ def parse_multi_range(range_str: str) -> list[ParsedRange]:
 
 def col_letter_to_index(col: str) -> int:
     """Convert Excel column letter(s) to 0-based index. A=0, B=1, Z=25, AA=26."""
+    cached = _COL_TO_IDX.get(col)
+    if cached is None:
+        cached = _COL_TO_IDX.get(col.upper())
+    if cached is not None:
+        return cached
+    if len(col) == 3 and col.isascii() and col.isalpha():
+        # Past XFD (outside the table): masking an ASCII letter with 0x1F
+        # gives 1..26 whatever its case
+        a, b, c = col.encode()
+        return (a & 0x1F) * 676 + (b & 0x1F) * 26 + (c & 0x1F) - 1
     result = 0
     for ch in col.upper():
         result = result * 26 + (ord(ch) - ord("A") + 1)
@@ -140,6 +207,13 @@ def col_letter_to_index(col: str) -> int:
 
 def index_to_col_letter(index: int) -> str:
     """Convert 0-based index to Excel column letter(s). 0=A, 25=Z, 26=AA."""
+    if 0 <= index < _TABLE_SIZE:
+        return _IDX_TO_COL[index]
+    return _index_to_col_letter(index)
+
+
+def _index_to_col_letter(index: int) -> str:
+    """Arithmetic conversion behind :func:`index_to_col_letter`."""
     result = ""
     idx = index + 1
     while idx > 0:
@@ -148,6 +222,20 @@ def index_to_col_letter(index: int) -> str:
     return result
 
 
+# Lookup tables for every Excel column (A..XFD), generated in index order;
+# only references past XFD fall back to arithmetic.
+# Built with C-level iterators to keep import cost to a few milliseconds.
+_TABLE_SIZE = 16384
+_IDX_TO_COL: list[str] = [
+    *string.ascii_uppercase,
+    *map("".join, itertools.product(string.ascii_uppercase, repeat=2)),
+    *itertools.islice(
+        map("".join, itertools.product(string.ascii_uppercase, repeat=3)), _TABLE_SIZE - 702
+    ),
+]
+_COL_TO_IDX: dict[str, int] = dict(zip(_IDX_TO_COL, range(_TABLE_SIZE)))
+
+
 def resolve_column_filter(
     columns_str: str,
     df_columns: list[str],
@@ -161,19 +249,21 @@ def resolve_column_filter(
     This enables header-name resolution even when df_columns are letters
     (e.g. range-scoped searches).
     """
-    from agent_xlsx.utils.errors import InvalidColumnError
-
     requested = [c.strip() for c in columns_str.split(",") if c.strip()]
     resolved: list[str] = []
     invalid: list[str] = []
+    # Set mirrors of df_columns / resolved keep membership tests O(1)
+    df_col_set = set(df_columns)
+    resolved_set: set[str] = set()
 
     # Map header names → column letters for fallback resolution
-    header_map = {h: index_to_col_letter(i) for i, h in enumerate(headers)} if headers else {}
+    header_map = _header_letter_map(headers) if headers else {}
 
     for ref in requested:
         # Exact DataFrame column name match (header name or letter)
-        if ref in df_columns:
-            if ref not in resolved:
+        if ref in df_col_set:
+            if ref not in resolved_set:
+                resolved_set.add(ref)
                 resolved.append(ref)
             continue
 
@@ -183,14 +273,16 @@ def resolve_column_filter(
             idx = col_letter_to_index(upper_ref)
             if 0 <= idx < len(df_columns):
                 name = df_columns[idx]
-                if name not in resolved:
+                if name not in resolved_set:
+                    resolved_set.add(name)
                     resolved.append(name)
                 continue
 
         # Header name fallback: resolve name → column letter, check df_columns
         if ref in header_map:
             col_letter = header_map[ref]
-            if col_letter in df_columns and col_letter not in resolved:
+            if col_letter in df_col_set and col_letter not in resolved_set:
+                resolved_set.add(col_letter)
                 resolved.append(col_letter)
                 continue
 
@@ -199,7 +291,7 @@ def resolve_column_filter(
     if invalid:
         # Include header names in error message for discoverability
         avail = (
-            list(df_columns) + [h for h in headers if h not in df_columns]
+            list(df_columns) + [h for h in headers if h not in df_col_set]
             if headers
             else list(df_columns)
         )
@@ -214,12 +306,10 @@ def resolve_column_letters(columns_str: str, headers: list[str] | None = None) -
     Accepts column letters (A, B, C) or header names (when headers provided).
     Returns a set of uppercase column letters.
     """
-    from agent_xlsx.utils.errors import InvalidColumnError
-
     requested = [c.strip() for c in columns_str.split(",") if c.strip()]
     letters: set[str] = set()
     invalid: list[str] = []
-    header_map = {h: index_to_col_letter(i) for i, h in enumerate(headers)} if headers else {}
+    header_map = _header_letter_map(headers) if headers else {}
 
     for ref in requested:
         # Header name lookup first (names can be purely alphabetic like "Formula")
@@ -238,3 +328,10 @@ def resolve_column_letters(columns_str: str, headers: list[str] | None = None) -
         raise InvalidColumnError(invalid, available)
 
     return letters
+
+
+def _header_letter_map(headers: list[str]) -> dict[str, str]:
+    """Map header names to column letters (later duplicates win, as before)."""
+    if len(headers) <= _TABLE_SIZE:
+        return dict(zip(headers, _IDX_TO_COL))
+    return {h: index_to_col_letter(i) for i, h in enumerate(headers)}
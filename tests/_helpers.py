@@ -0,0 +1,135 @@
+"""Shared test helpers: in-process command calls and session-built workbooks."""
+
+from __future__ import annotations
+
+import contextlib
+import inspect
+import io
+import json
+import os
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+import pytest
+from typer.models import ParameterInfo
+from typer.testing import CliRunner
+
+from agent_xlsx.cli import app
+
+try:
+    import orjson as _orjson
+except ImportError:  # optional — stdlib json is the fallback
+    _orjson = None
+
+try:
+    from filelock import FileLock as _FileLock
+except ImportError:  # optional — without it, parallel workers may build a template twice
+    _FileLock = None
+
+_runner = CliRunner()
+
+
+def invoke_json(args: Sequence[str], expect: int = 0) -> Any:
+    """Run the CLI in-process, assert its exit code, and decode stdout as JSON.
+
+    Runs with ``catch_exceptions=False`` so an unexpected exception surfaces
+    as its own traceback instead of an exit code mismatch.
+    """
+    result = _runner.invoke(app, args, catch_exceptions=False)
+    assert result.exit_code == expect, result.stdout
+    return _loads(result.stdout_bytes)
+
+
+def sheets_by_name(data: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Index a payload's ``sheets`` list by sheet name."""
+    return {sheet["name"]: sheet for sheet in data["sheets"]}
+
+
+def read_json(path: Path) -> Any:
+    """Decode a JSON file from its raw bytes (no intermediate ``str``)."""
+    return _loads(path.read_bytes())
+
+
+def _loads(raw: bytes | str) -> Any:
+    return _orjson.loads(raw) if _orjson is not None else json.loads(raw)
+
+
+def call_cmd(
+    cmd: Callable[..., None], *args: Any, expect: int = 0, **kwargs: Any
+) -> dict[str, Any]:
+    """Call a command function directly and return its decoded JSON output.
+
+    Skips Click's argv parsing and context setup; use ``runner.invoke`` when
+    the test is about option parsing. Parameters that are not passed take the
+    default declared in their ``typer.Option``/``typer.Argument``. The call
+    must exit with *expect* — pass ``expect=1`` to assert a structured error
+    from ``handle_error``.
+    """
+    sig = inspect.signature(cmd)
+    bound = sig.bind_partial(*args, **kwargs)
+    for name, param in sig.parameters.items():
+        if name not in bound.arguments:
+            default = param.default
+            bound.arguments[name] = (
+                default.default if isinstance(default, ParameterInfo) else default
+            )
+
+    buf = io.StringIO()
+    code = 0
+    with contextlib.redirect_stdout(buf):
+        try:
+            cmd(*bound.args, **bound.kwargs)
+        except SystemExit as exc:
+            code = exc.code or 0
+    out = buf.getvalue()
+    assert code == expect, out
+    return _loads(out)
+
+
+def memoised_run(run: Callable[..., dict[str, Any]]) -> Callable[..., dict[str, Any]]:
+    """Memoise ``run(path, **opts)`` per (workbook, options).
+
+    Lets tests that assert different keys of the same output share one run.
+    Results are shared, so tests must not mutate them.
+    """
+    cache: dict[tuple, dict[str, Any]] = {}
+
+    def memoised(path: Path | str, **opts: Any) -> dict[str, Any]:
+        key = (str(path), tuple(sorted(opts.items())))
+        if key not in cache:
+            cache[key] = run(str(path), **opts)
+        return cache[key]
+
+    return memoised
+
+
+def session_template(name: str) -> Callable[[Callable[[Path], None]], Any]:
+    """Register ``build(path)`` as a session fixture returning the built workbook's path.
+
+    The fixture takes the decorated function's name and is saved as *name*
+    in ``_template_dir``. Under pytest-xdist that directory is shared by all
+    workers, so only the first worker to need a template builds it.
+    """
+
+    def register(build: Callable[[Path], None]) -> Any:
+        @pytest.fixture(scope="session", name=build.__name__)
+        def fixture(_template_dir: Path) -> Path:
+            return _build_once(_template_dir / name, build)
+
+        fixture.__doc__ = build.__doc__
+        return fixture
+
+    return register
+
+
+def _build_once(path: Path, build: Callable[[Path], None]) -> Path:
+    lock = _FileLock(f"{path}.lock") if _FileLock is not None else contextlib.nullcontext()
+    with lock:
+        if not path.exists():
+            # Build beside the target and rename it into place, so another
+            # worker never opens a half-written workbook
+            partial = path.with_name(f".{os.getpid()}.{path.name}")
+            build(partial)
+            os.replace(partial, path)
+    return path
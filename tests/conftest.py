@@ -1,6 +1,8 @@
 """Shared pytest fixtures for agent-xlsx tests."""
 
+import os
 import shutil
+import tempfile
 from pathlib import Path
 
 import pytest
@@ -11,41 +13,110 @@ from openpyxl.styles import Font, PatternFill
 from openpyxl.worksheet.datavalidation import DataValidation
 from openpyxl.worksheet.hyperlink import Hyperlink
 
+# Imported at collection time so the first test to invoke a command does not
+# absorb the one-off cost of registering every command module (which pulls in
+# polars/fastexcel) or of the lazily imported openpyxl adapter.
+import agent_xlsx.adapters.openpyxl_adapter  # noqa: F401
+import agent_xlsx.cli  # noqa: F401
+from agent_xlsx.formatters.json_formatter import set_suppress_meta
+from agent_xlsx.utils.engine import clear_engine_cache
+
+from _helpers import session_template
+
+
+def _copy_to(template: Path, tmp_path: Path) -> Path:
+    """Copy a session-built template workbook into the test's own tmp_path.
+
+    Workbooks are built (openpyxl save) once per session; each test gets a
+    private copy so commands that write in place cannot leak between tests.
+    """
+    dest = tmp_path / template.name
+    shutil.copy(template, dest)
+    return dest
+
+
+@pytest.fixture(scope="session")
+def _template_dir(tmp_path_factory):
+    """Directory the session-built template workbooks are saved to.
+
+    On Linux this is a private directory on tmpfs (``/dev/shm``), so the
+    template saves and every per-test copy read from memory instead of disk.
+    Elsewhere it falls back to pytest's own temp directory. Under
+    pytest-xdist it is a directory shared by all workers of the run.
+    """
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        # One directory for every worker of this run (see session_template)
+        shared = tmp_path_factory.getbasetemp().parent / "templates"
+        shared.mkdir(exist_ok=True)
+        yield shared
+        return
+    shm = Path("/dev/shm")
+    if not (shm.is_dir() and os.access(shm, os.W_OK)):
+        yield tmp_path_factory.mktemp("templates")
+        return
+    path = Path(tempfile.mkdtemp(prefix="agent-xlsx-templates-", dir=shm))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_engine_cache():
+    """Reset cached engine probes so per-test monkeypatches take effect."""
+    clear_engine_cache()
+    yield
+    clear_engine_cache()
+
+
+@pytest.fixture(autouse=True)
+def _reset_meta_suppression():
+    """Undo a process-global ``--no-meta`` so it cannot leak into later tests.
+
+    Matters most under pytest-xdist, where test order within a worker varies.
+    """
+    yield
+    set_suppress_meta(False)
+
+
+@session_template("sample.xlsx")
+def _sample_xlsx_template(path):
+    """Build the ``sample_xlsx`` workbook once per session."""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+    ws.append(["header", "amount"])
+    ws.append(["value1", 100])
+    wb.save(path)
+
 
 @pytest.fixture
-def sample_xlsx(tmp_path):
+def sample_xlsx(tmp_path, _sample_xlsx_template):
     """Minimal .xlsx with known cell content for command output tests."""
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Sheet1"
-    ws["A1"] = "header"
-    ws["A2"] = "value1"
-    ws["B1"] = "amount"
-    ws["B2"] = 100
-    p = tmp_path / "sample.xlsx"
-    wb.save(p)
-    return p
+    return _copy_to(_sample_xlsx_template, tmp_path)
 
 
-@pytest.fixture
-def sample_xlsm(tmp_path):
-    """Minimal macro-enabled .xlsm for VBA gate tests (no actual VBA content needed)."""
-    wb = Workbook()
-    ws = wb.active
-    ws["A1"] = "test"
-    p = tmp_path / "sample.xlsm"
-    wb.save(p)
-    return p
+@pytest.fixture(scope="session")
+def sample_xlsx_ro(_sample_xlsx_template):
+    """The shared ``sample_xlsx`` itself, not a copy — for tests that never write to it."""
+    return _sample_xlsx_template
+
+
+@session_template("sample.xlsm")
+def _sample_xlsm_template(path):
+    """Build the ``sample_xlsm`` workbook once per session."""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet")
+    ws.append(["test"])
+    wb.save(path)
 
 
 @pytest.fixture
-def rich_xlsx(tmp_path):
-    """Multi-purpose workbook with formulas, comments, CF, DV, hyperlinks, merged cells.
+def sample_xlsm(tmp_path, _sample_xlsm_template):
+    """Minimal macro-enabled .xlsm for VBA gate tests (no actual VBA content needed)."""
+    return _copy_to(_sample_xlsm_template, tmp_path)
 
-    Used by: test_probe, test_overview, test_inspect, test_export
-    - Sheet "Sales": 5 cols (Date, Product, Revenue, Quantity, Region), 15 data rows
-    - Sheet "Summary": formulas, merged cell, comment, hyperlink, CF, DV
-    """
+
+@session_template("rich.xlsx")
+def _rich_xlsx_template(path):
+    """Build the ``rich_xlsx`` workbook once per session."""
     wb = Workbook()
 
     # --- Sheet: Sales ---
@@ -108,132 +179,152 @@ def rich_xlsx(tmp_path):
     ws_summary["D1"] = "Priority"
     ws_summary["D2"] = "High"
 
-    p = tmp_path / "rich.xlsx"
-    wb.save(p)
-    return p
+    wb.save(path)
 
 
 @pytest.fixture
-def multisheet_xlsx(tmp_path):
-    """3-sheet workbook for --sheet and --all-sheets tests.
+def rich_xlsx(tmp_path, _rich_xlsx_template):
+    """Multi-purpose workbook with formulas, comments, CF, DV, hyperlinks, merged cells.
 
-    - "Alpha": 3 cols (Name, Score, Grade), 5 rows
-    - "Beta": 2 cols (ID, Value), 10 rows
-    - "Gamma": headers only (empty data)
+    Used by: test_probe, test_overview, test_inspect, test_export
+    - Sheet "Sales": 5 cols (Date, Product, Revenue, Quantity, Region), 15 data rows
+    - Sheet "Summary": formulas, merged cell, comment, hyperlink, CF, DV
     """
-    wb = Workbook()
+    return _copy_to(_rich_xlsx_template, tmp_path)
+
+
+@pytest.fixture(scope="session")
+def rich_xlsx_ro(_rich_xlsx_template):
+    """The shared ``rich_xlsx`` itself, not a copy — for tests that never write to it."""
+    return _rich_xlsx_template
+
+
+@session_template("multisheet.xlsx")
+def _multisheet_xlsx_template(path):
+    """Build the ``multisheet_xlsx`` workbook once per session."""
+    wb = Workbook(write_only=True)
 
-    ws_alpha = wb.active
-    ws_alpha.title = "Alpha"
-    ws_alpha["A1"] = "Name"
-    ws_alpha["B1"] = "Score"
-    ws_alpha["C1"] = "Grade"
+    ws_alpha = wb.create_sheet("Alpha")
+    ws_alpha.append(["Name", "Score", "Grade"])
     for i in range(2, 7):
-        ws_alpha[f"A{i}"] = f"Student-{i - 1}"
-        ws_alpha[f"B{i}"] = 60 + (i - 1) * 5
-        ws_alpha[f"C{i}"] = "A" if i > 4 else "B"
+        ws_alpha.append([f"Student-{i - 1}", 60 + (i - 1) * 5, "A" if i > 4 else "B"])
 
     ws_beta = wb.create_sheet("Beta")
-    ws_beta["A1"] = "ID"
-    ws_beta["B1"] = "Value"
+    ws_beta.append(["ID", "Value"])
     for i in range(2, 12):
-        ws_beta[f"A{i}"] = i - 1
-        ws_beta[f"B{i}"] = (i - 1) * 100
+        ws_beta.append([i - 1, (i - 1) * 100])
 
     ws_gamma = wb.create_sheet("Gamma")
-    ws_gamma["A1"] = "Empty1"
-    ws_gamma["B1"] = "Empty2"
+    ws_gamma.append(["Empty1", "Empty2"])
     # No data rows — headers only
 
-    p = tmp_path / "multisheet.xlsx"
-    wb.save(p)
-    return p
+    wb.save(path)
 
 
 @pytest.fixture
-def formula_error_xlsx(tmp_path):
+def multisheet_xlsx(tmp_path, _multisheet_xlsx_template):
+    """3-sheet workbook for --sheet and --all-sheets tests.
+
+    - "Alpha": 3 cols (Name, Score, Grade), 5 rows
+    - "Beta": 2 cols (ID, Value), 10 rows
+    - "Gamma": headers only (empty data)
+    """
+    return _copy_to(_multisheet_xlsx_template, tmp_path)
+
+
+@pytest.fixture(scope="session")
+def multisheet_xlsx_ro(_multisheet_xlsx_template):
+    """The shared ``multisheet_xlsx`` itself, not a copy — for tests that never write to it."""
+    return _multisheet_xlsx_template
+
+
+@session_template("freetext.xlsx")
+def freetext_xlsx(path):
+    """Workbook with a free-text column (long strings) for truncation tests.
+
+    Built once and shared without a per-test copy: only read-only commands use it.
+    - "Data": ID + Description, 10 rows of 200+ char descriptions
+    """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Data")
+    ws.append(["ID", "Description"])
+    for i in range(1, 11):
+        # avg length well above FREETEXT_AVG_LENGTH_THRESHOLD (100)
+        ws.append([i, f"This is a very long description for item {i}. " * 5])
+
+    wb.save(path)
+
+
+@session_template("formula_errors.xlsx")
+def _formula_error_xlsx_template(path):
+    """Build the ``formula_error_xlsx`` workbook once per session."""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Errors")
+
+    # Col A: normal data for formula references; col B: normal formulas;
+    # col C: cached error values (simulates what openpyxl reads in data_only=True),
+    # with a second #REF! to test count > 1
+    ws.append(["Value", "Formula", "Errors"])
+    ws.append([10, "=SUM(A2:A5)", "#REF!"])
+    ws.append([20, "=A2+A3", "#DIV/0!"])
+    ws.append([30, None, "#NAME?"])
+    ws.append([0, None, "#REF!"])
+
+    wb.save(path)
+
+
+@pytest.fixture
+def formula_error_xlsx(tmp_path, _formula_error_xlsx_template):
     """Workbook with deliberate formula errors for recalc --check-only.
 
     Uses cached error string values (data_only=True reads these).
     Also has normal formulas for total_formulas counting.
     """
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Errors"
-
-    # Normal data for formula references
-    ws["A1"] = "Value"
-    ws["A2"] = 10
-    ws["A3"] = 20
-    ws["A4"] = 30
-    ws["A5"] = 0
+    return _copy_to(_formula_error_xlsx_template, tmp_path)
 
-    # Normal formulas
-    ws["B1"] = "Formula"
-    ws["B2"] = "=SUM(A2:A5)"
-    ws["B3"] = "=A2+A3"
 
-    # Cached error values (simulates what openpyxl reads in data_only=True)
-    ws["C1"] = "Errors"
-    ws["C2"] = "#REF!"
-    ws["C3"] = "#DIV/0!"
-    ws["C4"] = "#NAME?"
-    ws["C5"] = "#REF!"  # Second #REF! to test count > 1
+@session_template("compact.xlsx")
+def _compact_xlsx_template(path):
+    """Build the ``compact_xlsx`` workbook once per session."""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Data")
+    ws.append(["Name", "Value", "NullCol", "Category"])
+    for i in range(2, 7):
+        # C column intentionally left empty (null)
+        ws.append([f"Item-{i - 1}", (i - 1) * 10, None, "CatA" if i % 2 == 0 else "CatB"])
 
-    p = tmp_path / "formula_errors.xlsx"
-    wb.save(p)
-    return p
+    wb.save(path)
 
 
 @pytest.fixture
-def compact_xlsx(tmp_path):
+def compact_xlsx(tmp_path, _compact_xlsx_template):
     """Workbook with a fully-null column for compact/no-compact testing.
 
     4 columns: Name, Value, NullCol (all None), Category. 5 data rows.
     """
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Data"
-    ws["A1"] = "Name"
-    ws["B1"] = "Value"
-    ws["C1"] = "NullCol"
-    ws["D1"] = "Category"
-    for i in range(2, 7):
-        ws[f"A{i}"] = f"Item-{i - 1}"
-        ws[f"B{i}"] = (i - 1) * 10
-        # C column intentionally left empty (null)
-        ws[f"D{i}"] = "CatA" if i % 2 == 0 else "CatB"
+    return _copy_to(_compact_xlsx_template, tmp_path)
+
 
-    p = tmp_path / "compact.xlsx"
-    wb.save(p)
-    return p
+@session_template("unicode.xlsx")
+def _unicode_xlsx_template(path):
+    """Build the ``unicode_xlsx`` workbook once per session."""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+    ws.append(["Nom", "Montant (EUR)", "Region"])
+    ws.append(["Jean-Pierre", 1500.75, "Ile-de-France"])
+    ws.append(["\u5c71\u7530\u592a\u90ce", 2300.00, "\u6771\u4eac"])  # Japanese name, Tokyo
+    ws.append(["Muller", 980.50, "Baden-Wurttemberg"])
+
+    wb.save(path)
 
 
 @pytest.fixture
-def unicode_xlsx(tmp_path):
+def unicode_xlsx(tmp_path, _unicode_xlsx_template):
     """Workbook with Unicode content for edge case testing.
 
     Headers with accented characters, CJK values.
     """
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Sheet1"
-    ws["A1"] = "Nom"
-    ws["B1"] = "Montant (EUR)"
-    ws["C1"] = "Region"
-    ws["A2"] = "Jean-Pierre"
-    ws["B2"] = 1500.75
-    ws["C2"] = "Ile-de-France"
-    ws["A3"] = "\u5c71\u7530\u592a\u90ce"  # Japanese name
-    ws["B3"] = 2300.00
-    ws["C3"] = "\u6771\u4eac"  # Tokyo
-    ws["A4"] = "Muller"
-    ws["B4"] = 980.50
-    ws["C4"] = "Baden-Wurttemberg"
-
-    p = tmp_path / "unicode.xlsx"
-    wb.save(p)
-    return p
+    return _copy_to(_unicode_xlsx_template, tmp_path)
 
 
 @pytest.fixture
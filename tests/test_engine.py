@@ -4,40 +4,56 @@ import pytest
 
 from agent_xlsx.utils.engine import resolve_engine
 
+_ADAPTERS = "agent_xlsx.adapters"
+
+
+@pytest.fixture
+def engine_env(monkeypatch):
+    """Stub engine availability probes in one call.
+
+    ``engine_env(aspose=False, excel=True)`` patches just the named probes;
+    any engine left as ``None`` keeps its real probe.
+    """
+
+    def _apply(
+        aspose: bool | None = None, excel: bool | None = None, libre: bool | None = None
+    ) -> None:
+        if aspose is not None:
+            monkeypatch.setattr(f"{_ADAPTERS}.aspose_adapter._ASPOSE_AVAILABLE", None)
+            monkeypatch.setattr(f"{_ADAPTERS}.aspose_adapter.is_aspose_available", lambda: aspose)
+        if excel is not None:
+            monkeypatch.setattr(f"{_ADAPTERS}.xlwings_adapter.is_excel_available", lambda: excel)
+        if libre is not None:
+            monkeypatch.setattr(
+                f"{_ADAPTERS}.libreoffice_adapter.is_libreoffice_available", lambda: libre
+            )
+
+    return _apply
 
-def test_env_var_overrides_auto(monkeypatch):
-    """AGENT_XLSX_ENGINE env var overrides 'auto' engine selection."""
-    # Mock Aspose as unavailable so auto would normally fall through
-    monkeypatch.setattr("agent_xlsx.adapters.aspose_adapter._ASPOSE_AVAILABLE", None)
-    monkeypatch.setattr("agent_xlsx.adapters.aspose_adapter.is_aspose_available", lambda: False)
-    monkeypatch.setattr("agent_xlsx.adapters.xlwings_adapter.is_excel_available", lambda: False)
 
-    # Set env var to libreoffice and mock it as available
+def test_env_var_overrides_auto(monkeypatch, engine_env):
+    """AGENT_XLSX_ENGINE env var overrides 'auto' engine selection."""
+    # Aspose/Excel unavailable so auto would normally fall through; LibreOffice available
+    engine_env(aspose=False, excel=False, libre=True)
     monkeypatch.setenv("AGENT_XLSX_ENGINE", "libreoffice")
-    monkeypatch.setattr(
-        "agent_xlsx.adapters.libreoffice_adapter.is_libreoffice_available",
-        lambda: True,
-    )
 
     result = resolve_engine("screenshot", "auto", libreoffice=True)
     assert result == "libreoffice"
 
 
-def test_env_var_ignored_when_explicit_engine(monkeypatch):
+def test_env_var_ignored_when_explicit_engine(monkeypatch, engine_env):
     """AGENT_XLSX_ENGINE is ignored when user explicitly sets engine != auto."""
     monkeypatch.setenv("AGENT_XLSX_ENGINE", "libreoffice")
-    monkeypatch.setattr("agent_xlsx.adapters.aspose_adapter.is_aspose_available", lambda: True)
+    engine_env(aspose=True)
 
     # Explicit "aspose" should not be overridden by the env var
     result = resolve_engine("screenshot", "aspose", libreoffice=True)
     assert result == "aspose"
 
 
-def test_aspose_unavailable_falls_through(monkeypatch):
+def test_aspose_unavailable_falls_through(engine_env):
     """When Aspose is unavailable, auto falls through to next engine."""
-    monkeypatch.setattr("agent_xlsx.adapters.aspose_adapter._ASPOSE_AVAILABLE", None)
-    monkeypatch.setattr("agent_xlsx.adapters.aspose_adapter.is_aspose_available", lambda: False)
-    monkeypatch.setattr("agent_xlsx.adapters.xlwings_adapter.is_excel_available", lambda: True)
+    engine_env(aspose=False, excel=True)
 
     result = resolve_engine("screenshot", "auto", libreoffice=True)
     assert result == "excel"
@@ -48,40 +64,43 @@ def test_aspose_unavailable_falls_through(monkeypatch):
 # ---------------------------------------------------------------------------
 
 
-def test_all_engines_unavailable_raises(monkeypatch):
+def test_all_engines_unavailable_raises(engine_env):
     """When all engines are unavailable, auto raises NoRenderingBackendError."""
     from agent_xlsx.utils.errors import NoRenderingBackendError
 
-    monkeypatch.setattr("agent_xlsx.adapters.aspose_adapter._ASPOSE_AVAILABLE", None)
-    monkeypatch.setattr("agent_xlsx.adapters.aspose_adapter.is_aspose_available", lambda: False)
-    monkeypatch.setattr("agent_xlsx.adapters.xlwings_adapter.is_excel_available", lambda: False)
-    monkeypatch.setattr(
-        "agent_xlsx.adapters.libreoffice_adapter.is_libreoffice_available",
-        lambda: False,
-    )
+    engine_env(aspose=False, excel=False, libre=False)
 
     with pytest.raises(NoRenderingBackendError):
         resolve_engine("screenshot", "auto", libreoffice=True)
 
 
-def test_lo_alias_resolves_to_libreoffice(monkeypatch):
+def test_lo_alias_resolves_to_libreoffice(engine_env):
     """'lo' is accepted as alias for 'libreoffice'."""
-    monkeypatch.setattr(
-        "agent_xlsx.adapters.libreoffice_adapter.is_libreoffice_available",
-        lambda: True,
-    )
+    engine_env(libre=True)
 
     result = resolve_engine("screenshot", "lo", libreoffice=True)
     assert result == "libreoffice"
 
 
-def test_unknown_engine_raises(monkeypatch):
+def test_unknown_engine_raises(engine_env):
     """An unrecognised engine string raises an error."""
     from agent_xlsx.utils.errors import NoRenderingBackendError
 
-    monkeypatch.setattr("agent_xlsx.adapters.aspose_adapter._ASPOSE_AVAILABLE", None)
-    monkeypatch.setattr("agent_xlsx.adapters.aspose_adapter.is_aspose_available", lambda: False)
-    monkeypatch.setattr("agent_xlsx.adapters.xlwings_adapter.is_excel_available", lambda: False)
+    engine_env(aspose=False, excel=False)
 
     with pytest.raises(NoRenderingBackendError):
         resolve_engine("screenshot", "nonexistent_engine", libreoffice=True)
+
+
+def test_availability_probe_cached(monkeypatch):
+    """Availability probes run once per process, not once per resolve."""
+    calls = []
+
+    def _probe():
+        calls.append(1)
+        return True
+
+    monkeypatch.setattr(f"{_ADAPTERS}.xlwings_adapter.is_excel_available", _probe)
+    assert resolve_engine("objects", "excel", libreoffice=False) == "excel"
+    assert resolve_engine("objects", "excel", libreoffice=False) == "excel"
+    assert len(calls) == 1
@@ -2,12 +2,20 @@
 
 import json
 
+import pytest
+from openpyxl import Workbook
 from typer.testing import CliRunner
 
 from agent_xlsx.cli import app
 
 runner = CliRunner()
 
+# Shared argv fragments (Typer accepts any sequence for args)
+_JSON = ("--format", "json")
+_CSV = ("--format", "csv")
+_MD = ("--format", "markdown")
+_ENVELOPE = "--json-envelope"
+
 
 # ---------------------------------------------------------------------------
 # Default format (JSON) — stdout
@@ -16,7 +24,7 @@ runner = CliRunner()
 
 def test_export_json_default(rich_xlsx):
     """Default export produces JSON with expected envelope fields."""
-    result = runner.invoke(app, ["export", str(rich_xlsx)])
+    result = runner.invoke(app, ("export", str(rich_xlsx)))
     assert result.exit_code == 0, result.stdout
     data = json.loads(result.stdout)
     assert data["_data_origin"] == "untrusted_spreadsheet"
@@ -30,7 +38,7 @@ def test_export_json_default(rich_xlsx):
 
 def test_export_json_explicit_format(rich_xlsx):
     """--format json produces the same structured output as the default."""
-    result = runner.invoke(app, ["export", str(rich_xlsx), "--format", "json"])
+    result = runner.invoke(app, ("export", str(rich_xlsx), *_JSON))
     assert result.exit_code == 0, result.stdout
     data = json.loads(result.stdout)
     assert data["_data_origin"] == "untrusted_spreadsheet"
@@ -38,16 +46,37 @@ def test_export_json_explicit_format(rich_xlsx):
     assert "export_time_ms" in data
 
 
+def test_export_json_converts_date_serials(rich_xlsx):
+    """Date-formatted serial numbers export as ISO date strings."""
+    result = runner.invoke(app, ("export", str(rich_xlsx), "--sheet", "Sales"))
+    assert result.exit_code == 0, result.stdout
+    data = json.loads(result.stdout)
+    assert data["data"][0]["Date"] == "2023-03-17"  # serial 45002
+    assert isinstance(data["data"][0]["Revenue"], float)
+
+
 # ---------------------------------------------------------------------------
 # --sheet flag
 # ---------------------------------------------------------------------------
 
 
+def test_export_json_columnar(multisheet_xlsx):
+    """--columnar emits data as column -> values lists with the same content as rows."""
+    args = ("export", str(multisheet_xlsx), "--sheet", "Alpha", *_JSON)
+    rows = json.loads(runner.invoke(app, args).stdout)
+    result = runner.invoke(app, (*args, "--columnar"))
+    assert result.exit_code == 0, result.stdout
+    data = json.loads(result.stdout)
+    assert data["layout"] == "columnar"
+    assert data["row_count"] == rows["row_count"] == 5
+    assert list(data["data"]) == data["columns"] == ["Name", "Score", "Grade"]
+    assert data["data"]["Name"] == [r["Name"] for r in rows["data"]]
+    assert "layout" not in rows
+
+
 def test_export_sheet_flag(multisheet_xlsx):
     """--sheet selects the specified sheet for export."""
-    result = runner.invoke(
-        app, ["export", str(multisheet_xlsx), "--sheet", "Beta", "--format", "json"]
-    )
+    result = runner.invoke(app, ("export", str(multisheet_xlsx), "--sheet", "Beta", *_JSON))
     assert result.exit_code == 0, result.stdout
     data = json.loads(result.stdout)
     assert data["sheet"] == "Beta"
@@ -57,7 +86,7 @@ def test_export_sheet_flag(multisheet_xlsx):
 
 def test_export_sheet_not_found(multisheet_xlsx):
     """--sheet with a non-existent name produces a SHEET_NOT_FOUND error."""
-    result = runner.invoke(app, ["export", str(multisheet_xlsx), "--sheet", "Nope"])
+    result = runner.invoke(app, ("export", str(multisheet_xlsx), "--sheet", "Nope"))
     assert result.exit_code == 1
     data = json.loads(result.stdout)
     assert data["error"] is True
@@ -71,19 +100,19 @@ def test_export_sheet_not_found(multisheet_xlsx):
 
 def test_export_csv_raw_stdout(sample_xlsx):
     """--format csv writes raw CSV to stdout (no JSON wrapping)."""
-    result = runner.invoke(app, ["export", str(sample_xlsx), "--format", "csv"])
+    result = runner.invoke(app, ("export", str(sample_xlsx), *_CSV))
     assert result.exit_code == 0, result.stdout
-    lines = result.stdout.strip().split("\n")
+    lines = result.stdout_bytes.splitlines()
     # First line should be the CSV header row
-    assert "header" in lines[0]
-    assert "amount" in lines[0]
+    assert b"header" in lines[0]
+    assert b"amount" in lines[0]
     # At least header + 1 data row
     assert len(lines) >= 2
 
 
 def test_export_csv_json_envelope(sample_xlsx):
     """--format csv --json-envelope wraps CSV in a JSON envelope."""
-    result = runner.invoke(app, ["export", str(sample_xlsx), "--format", "csv", "--json-envelope"])
+    result = runner.invoke(app, ("export", str(sample_xlsx), *_CSV, _ENVELOPE))
     assert result.exit_code == 0, result.stdout
     data = json.loads(result.stdout)
     assert data["_data_origin"] == "untrusted_spreadsheet"
@@ -101,20 +130,18 @@ def test_export_csv_json_envelope(sample_xlsx):
 
 def test_export_markdown_raw_stdout(sample_xlsx):
     """--format markdown writes a Markdown table to stdout."""
-    result = runner.invoke(app, ["export", str(sample_xlsx), "--format", "markdown"])
+    result = runner.invoke(app, ("export", str(sample_xlsx), *_MD))
     assert result.exit_code == 0, result.stdout
-    lines = result.stdout.strip().split("\n")
+    lines = result.stdout_bytes.splitlines()
     # Markdown table: header row, separator row, data rows
-    assert lines[0].startswith("|")
-    assert "---" in lines[1]
+    assert lines[0].startswith(b"|")
+    assert b"---" in lines[1]
     assert len(lines) >= 3
 
 
 def test_export_markdown_json_envelope(sample_xlsx):
     """--format markdown --json-envelope wraps Markdown in a JSON envelope."""
-    result = runner.invoke(
-        app, ["export", str(sample_xlsx), "--format", "markdown", "--json-envelope"]
-    )
+    result = runner.invoke(app, ("export", str(sample_xlsx), *_MD, _ENVELOPE))
     assert result.exit_code == 0, result.stdout
     data = json.loads(result.stdout)
     assert data["_data_origin"] == "untrusted_spreadsheet"
@@ -123,6 +150,23 @@ def test_export_markdown_json_envelope(sample_xlsx):
     assert "|" in data["data"]
 
 
+def test_export_markdown_escapes_pipes_and_newlines(tmp_path):
+    """Pipes and line breaks inside cells do not break the Markdown table."""
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["a|b", "note"])
+    ws.append(["x|y", "line1\nline2"])
+    path = tmp_path / "pipes.xlsx"
+    wb.save(path)
+
+    result = runner.invoke(app, ("export", str(path), *_MD))
+    assert result.exit_code == 0, result.stdout
+    lines = result.stdout_bytes.splitlines()
+    assert lines[0] == b"| a\\|b | note |"
+    assert lines[2] == b"| x\\|y | line1 line2 |"
+    assert len(lines) == 3
+
+
 # ---------------------------------------------------------------------------
 # --output (file write)
 # ---------------------------------------------------------------------------
@@ -131,7 +175,7 @@ def test_export_markdown_json_envelope(sample_xlsx):
 def test_export_output_json_file(rich_xlsx, tmp_path):
     """--output writes JSON to a file and prints a success message."""
     out = tmp_path / "export.json"
-    result = runner.invoke(app, ["export", str(rich_xlsx), "--output", str(out)])
+    result = runner.invoke(app, ("export", str(rich_xlsx), "--output", str(out)))
     assert result.exit_code == 0, result.stdout
     # Stdout is a success envelope
     meta = json.loads(result.stdout)
@@ -147,9 +191,7 @@ def test_export_output_json_file(rich_xlsx, tmp_path):
 def test_export_output_csv_file(sample_xlsx, tmp_path):
     """--output with CSV writes the file and prints a success message."""
     out = tmp_path / "export.csv"
-    result = runner.invoke(
-        app, ["export", str(sample_xlsx), "--format", "csv", "--output", str(out)]
-    )
+    result = runner.invoke(app, ("export", str(sample_xlsx), *_CSV, "--output", str(out)))
     assert result.exit_code == 0, result.stdout
     meta = json.loads(result.stdout)
     assert meta["status"] == "success"
@@ -162,9 +204,7 @@ def test_export_output_csv_file(sample_xlsx, tmp_path):
 def test_export_output_markdown_file(sample_xlsx, tmp_path):
     """--output with Markdown writes the file and prints a success message."""
     out = tmp_path / "export.md"
-    result = runner.invoke(
-        app, ["export", str(sample_xlsx), "--format", "markdown", "--output", str(out)]
-    )
+    result = runner.invoke(app, ("export", str(sample_xlsx), *_MD, "--output", str(out)))
     assert result.exit_code == 0, result.stdout
     meta = json.loads(result.stdout)
     assert meta["status"] == "success"
@@ -174,6 +214,22 @@ def test_export_output_markdown_file(sample_xlsx, tmp_path):
     assert "---" in md_text
 
 
+@pytest.mark.parametrize(("fmt", "suffix"), [("csv", ".csv"), ("markdown", ".md")])
+def test_export_streamed_outputs_match(multisheet_xlsx, tmp_path, fmt, suffix):
+    """Streamed file and stdout writes produce the same text as the JSON envelope."""
+    args = ("export", str(multisheet_xlsx), "--sheet", "Beta", "--format", fmt)
+    envelope = json.loads(runner.invoke(app, [*args, "--json-envelope"]).stdout)["data"]
+
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0, result.stdout
+    assert result.stdout == envelope
+
+    out = tmp_path / f"export{suffix}"
+    result = runner.invoke(app, [*args, "--output", str(out)])
+    assert result.exit_code == 0, result.stdout
+    assert out.read_text(encoding="utf-8") == envelope
+
+
 # ---------------------------------------------------------------------------
 # --no-header flag
 # ---------------------------------------------------------------------------
@@ -181,7 +237,7 @@ def test_export_output_markdown_file(sample_xlsx, tmp_path):
 
 def test_export_no_header(sample_xlsx):
     """--no-header uses column letters (A, B, ...) instead of row-1 values."""
-    result = runner.invoke(app, ["export", str(sample_xlsx), "--no-header", "--format", "json"])
+    result = runner.invoke(app, ("export", str(sample_xlsx), "--no-header", *_JSON))
     assert result.exit_code == 0, result.stdout
     data = json.loads(result.stdout)
     # Column names should be letters, not header values
@@ -198,7 +254,7 @@ def test_export_no_header(sample_xlsx):
 
 def test_export_compact_drops_null_column(compact_xlsx):
     """Default compact mode drops the fully-null NullCol column."""
-    result = runner.invoke(app, ["export", str(compact_xlsx), "--format", "json"])
+    result = runner.invoke(app, ("export", str(compact_xlsx), *_JSON))
     assert result.exit_code == 0, result.stdout
     data = json.loads(result.stdout)
     assert "NullCol" not in data["columns"]
@@ -209,7 +265,7 @@ def test_export_compact_drops_null_column(compact_xlsx):
 
 def test_export_no_compact_keeps_null_column(compact_xlsx):
     """--no-compact preserves all columns including fully-null ones."""
-    result = runner.invoke(app, ["export", str(compact_xlsx), "--no-compact", "--format", "json"])
+    result = runner.invoke(app, ("export", str(compact_xlsx), "--no-compact", *_JSON))
     assert result.exit_code == 0, result.stdout
     data = json.loads(result.stdout)
     assert "NullCol" in data["columns"]
@@ -226,15 +282,7 @@ def test_export_json_envelope_ignored_with_output(sample_xlsx, tmp_path):
     out = tmp_path / "export.csv"
     result = runner.invoke(
         app,
-        [
-            "export",
-            str(sample_xlsx),
-            "--format",
-            "csv",
-            "--output",
-            str(out),
-            "--json-envelope",
-        ],
+        ("export", str(sample_xlsx), *_CSV, "--output", str(out), _ENVELOPE),
     )
     assert result.exit_code == 0, result.stdout
     meta = json.loads(result.stdout)
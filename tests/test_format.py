@@ -1,19 +1,28 @@
 """Tests for the format command — multi-range support."""
 
+import io
 import json
+from pathlib import Path
 
 import pytest
-from openpyxl import Workbook
+from openpyxl import Workbook, load_workbook
 from typer.testing import CliRunner
 
+from agent_xlsx.adapters import openpyxl_adapter as oxl
 from agent_xlsx.cli import app
+from agent_xlsx.formatters.json_formatter import dumps_pretty
 
 runner = CliRunner()
 
 
-@pytest.fixture()
-def styled_xlsx(tmp_path):
-    """Workbook with data for formatting tests."""
+def _bold(path, cell_ref: str, bold: bool = True) -> None:
+    """Setup step: set font bold via the adapter, skipping CLI parsing and output."""
+    oxl.apply_formatting(path, "Sheet1", cell_ref, font_opts={"bold": bold})
+
+
+@pytest.fixture(scope="session")
+def _styled_xlsx_bytes():
+    """Serialise the ``styled_xlsx`` workbook to bytes once per session."""
     wb = Workbook()
     ws = wb.active
     ws.title = "Sheet1"
@@ -32,8 +41,16 @@ def styled_xlsx(tmp_path):
     ws["A5"] = 10
     ws["B5"] = 20
     ws["C5"] = 30
+    buf = io.BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+@pytest.fixture()
+def styled_xlsx(tmp_path, _styled_xlsx_bytes):
+    """Workbook with data for formatting tests (private per-test copy)."""
     p = tmp_path / "styled.xlsx"
-    wb.save(p)
+    p.write_bytes(_styled_xlsx_bytes)
     return p
 
 
@@ -54,14 +71,12 @@ def test_format_multi_range_apply_bold(styled_xlsx):
     assert data["ranges_formatted"] == 2
     assert data["total_cells_formatted"] == 4  # 3 cells in A1:C1 + 1 in B4
 
-    # Verify formatting was applied to both ranges
-    r1 = runner.invoke(app, ["format", str(styled_xlsx), "A1", "--read"])
-    assert r1.exit_code == 0
-    assert json.loads(r1.stdout)["font"]["bold"] is True
-
-    r2 = runner.invoke(app, ["format", str(styled_xlsx), "B4", "--read"])
-    assert r2.exit_code == 0
-    assert json.loads(r2.stdout)["font"]["bold"] is True
+    # Verify formatting was applied to both ranges (one multi-range read)
+    r = runner.invoke(app, ["format", str(styled_xlsx), "A1,B4", "--read"])
+    assert r.exit_code == 0
+    results = json.loads(r.stdout)["results"]
+    assert [x["range"] for x in results] == ["A1", "B4"]
+    assert all(x["formatting"]["font"]["bold"] is True for x in results)
 
 
 def test_format_multi_range_apply_number_format(styled_xlsx):
@@ -84,10 +99,7 @@ def test_format_multi_range_apply_number_format(styled_xlsx):
 def test_format_multi_range_read(styled_xlsx):
     """Multi-range read returns formatting per range."""
     # Apply bold to A1 first
-    runner.invoke(
-        app,
-        ["format", str(styled_xlsx), "A1", "--font", '{"bold": true}'],
-    )
+    _bold(styled_xlsx, "A1")
 
     result = runner.invoke(
         app,
@@ -107,13 +119,22 @@ def test_format_multi_range_read(styled_xlsx):
 # ---------------------------------------------------------------------------
 
 
+def test_format_multi_range_read_reflects_later_saves(styled_xlsx):
+    """Multi-range --read reports each range, and a later read sees an intervening save."""
+    result = runner.invoke(app, ["format", str(styled_xlsx), "A1,B2,C3", "--read"])
+    assert result.exit_code == 0, result.stdout
+    cells = [r["formatting"]["cell"] for r in json.loads(result.stdout)["results"]]
+    assert cells == ["A1", "B2", "C3"]
+
+    _bold(styled_xlsx, "A1")
+    r = runner.invoke(app, ["format", str(styled_xlsx), "A1", "--read"])
+    assert json.loads(r.stdout)["font"]["bold"] is True
+
+
 def test_format_multi_range_copy(styled_xlsx):
     """Multi-range copy applies source formatting to all target ranges."""
     # Make A1 bold
-    runner.invoke(
-        app,
-        ["format", str(styled_xlsx), "A1", "--font", '{"bold": true}'],
-    )
+    _bold(styled_xlsx, "A1")
 
     # Copy A1's formatting to B4 and C5
     result = runner.invoke(
@@ -126,9 +147,11 @@ def test_format_multi_range_copy(styled_xlsx):
     assert data["ranges_formatted"] == 2
 
     # Verify both cells got bold
-    for cell_ref in ("B4", "C5"):
-        r = runner.invoke(app, ["format", str(styled_xlsx), cell_ref, "--read"])
-        assert json.loads(r.stdout)["font"]["bold"] is True
+    r = runner.invoke(app, ["format", str(styled_xlsx), "B4,C5", "--read"])
+    assert r.exit_code == 0
+    results = json.loads(r.stdout)["results"]
+    assert [x["range"] for x in results] == ["B4", "C5"]
+    assert all(x["formatting"]["font"]["bold"] is True for x in results)
 
 
 # ---------------------------------------------------------------------------
@@ -252,7 +275,7 @@ def test_format_shorthand_combines_with_json(styled_xlsx):
 def test_format_no_bold_shorthand(styled_xlsx):
     """--no-bold explicitly disables bold."""
     # First make it bold
-    runner.invoke(app, ["format", str(styled_xlsx), "A1", "--bold"])
+    _bold(styled_xlsx, "A1")
     # Then un-bold it
     result = runner.invoke(app, ["format", str(styled_xlsx), "A1", "--no-bold"])
     assert result.exit_code == 0, result.stdout
@@ -275,8 +298,6 @@ def test_format_multi_range_output_preserves_all(styled_xlsx, tmp_path):
     range's formatting survived. Fixed with working_path variable that switches
     to the output file after the first iteration.
     """
-    from openpyxl import load_workbook
-
     out = tmp_path / "formatted.xlsx"
     result = runner.invoke(
         app,
@@ -292,7 +313,7 @@ def test_format_multi_range_output_preserves_all(styled_xlsx, tmp_path):
     assert result.exit_code == 0, result.stdout
 
     # Verify BOTH cells are bold in the output file
-    wb = load_workbook(str(out))
+    wb = load_workbook(str(out), keep_links=False)
     ws = wb.active
     assert ws["A1"].font.bold is True, "A1 should be bold (first range)"
     assert ws["B1"].font.bold is True, "B1 should be bold (second range)"
@@ -307,8 +328,6 @@ def test_format_multi_range_output_non_writable_extension(styled_xlsx, tmp_path)
     save path, not the raw user-provided output string, otherwise iteration 2
     tries to load a file that doesn't exist.
     """
-    from openpyxl import load_workbook
-
     # Use .xls extension — adapter will auto-convert to .xlsx
     out = tmp_path / "formatted.xls"
     result = runner.invoke(
@@ -327,7 +346,7 @@ def test_format_multi_range_output_non_writable_extension(styled_xlsx, tmp_path)
     # Adapter converts .xls → .xlsx; verify the actual file exists and has both ranges
     actual_out = tmp_path / "formatted.xlsx"
     assert actual_out.exists(), "Adapter should auto-convert .xls to .xlsx"
-    wb = load_workbook(str(actual_out))
+    wb = load_workbook(str(actual_out), keep_links=False)
     ws = wb.active
     assert ws["A1"].font.bold is True, "A1 should be bold (first range)"
     assert ws["B1"].font.bold is True, "B1 should be bold (second range)"
@@ -361,7 +380,7 @@ def test_format_batch_file(styled_xlsx, tmp_path):
     """--batch-file reads format spec from a JSON file and applies all styles."""
     batch_spec = [{"range": "A1:C1", "bold": True, "fill_color": "FFFF00"}]
     batch_file = tmp_path / "batch.json"
-    batch_file.write_text(json.dumps(batch_spec))
+    batch_file.write_bytes(dumps_pretty(batch_spec))
 
     result = runner.invoke(
         app,
@@ -394,9 +413,7 @@ def test_format_batch_comma_ranges(styled_xlsx):
     assert data["total_cells_formatted"] == 6  # A1:C1 (3) + A3:C3 (3)
 
     # A1 and A3 should be bold, A2 should NOT
-    from openpyxl import load_workbook
-
-    wb = load_workbook(str(styled_xlsx))
+    wb = load_workbook(str(styled_xlsx), keep_links=False)
     ws = wb.active
     assert ws["A1"].font.bold is True, "A1 should be bold (first range)"
     assert ws["A3"].font.bold is True, "A3 should be bold (second range)"
@@ -411,8 +428,6 @@ def test_format_batch_comma_ranges(styled_xlsx):
 
 def test_format_output_file_is_relative(styled_xlsx):
     """output_file in response must be present, relative, and match the source filename."""
-    from pathlib import Path
-
     result = runner.invoke(
         app,
         ["format", str(styled_xlsx), "A1", "--bold"],
@@ -1,7 +1,7 @@
 """Tests for the inspect command: metadata, sheet, range, names, charts, vba,
 format, comments, conditional, validation, hyperlinks, and error handling."""
 
-import json
+import functools
 
 import pytest
 from openpyxl import Workbook
@@ -11,6 +11,9 @@ from openpyxl.worksheet.datavalidation import DataValidation
 from typer.testing import CliRunner
 
 from agent_xlsx.cli import app
+from agent_xlsx.commands.inspect import run as inspect_run
+
+from _helpers import invoke_json, memoised_run, session_template
 
 runner = CliRunner()
 
@@ -20,10 +23,21 @@ runner = CliRunner()
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def inspect_xlsx(tmp_path):
+@pytest.fixture(scope="module")
+def rich_inspect(rich_xlsx_ro):
+    """``inspect.run`` on the shared rich workbook, memoised per option set.
+
+    Asserts on the payload dict directly, with no JSON round-trip — see
+    ``memoised_run``.
+    """
+    return functools.partial(memoised_run(inspect_run), rich_xlsx_ro)
+
+
+@session_template("inspect.xlsx")
+def inspect_xlsx(path):
     """Workbook with formulas, merged cells, comments, and DV for full inspection.
 
+    Built once per session and shared: inspect never writes to its input.
     Omits conditional formatting and _hyperlinks because openpyxl 3.1.5
     does not reliably round-trip these through _cf_rules iteration and
     _hyperlinks after save/reload.
@@ -32,24 +46,21 @@ def inspect_xlsx(tmp_path):
 
     ws = wb.active
     ws.title = "Data"
-    ws["A1"] = "Value"
-    ws["A2"] = 10
-    ws["A3"] = 20
+    for row in (["Value"], [10], [20]):
+        ws.append(row)
 
     ws_summary = wb.create_sheet("Summary")
-
-    # Merged cell
+    for row in (
+        ["Report Title"],
+        [],
+        ["Total", "=SUM(Data!A2:A3)"],
+        ["Average", "=AVERAGE(Data!A2:A3)"],
+    ):
+        ws_summary.append(row)
+
+    # Merged title cell with font and comment on its anchor
     ws_summary.merge_cells("A1:C1")
-    ws_summary["A1"] = "Report Title"
     ws_summary["A1"].font = Font(bold=True, size=14)
-
-    # Formulas
-    ws_summary["A3"] = "Total"
-    ws_summary["B3"] = "=SUM(Data!A2:A3)"
-    ws_summary["A4"] = "Average"
-    ws_summary["B4"] = "=AVERAGE(Data!A2:A3)"
-
-    # Comment
     ws_summary["A1"].comment = Comment("Header comment", "Tester")
 
     # Data validation
@@ -60,9 +71,7 @@ def inspect_xlsx(tmp_path):
     ws_summary.add_data_validation(dv)
     dv.add("D2")
 
-    p = tmp_path / "inspect.xlsx"
-    wb.save(p)
-    return p
+    wb.save(path)
 
 
 # ---------------------------------------------------------------------------
@@ -70,11 +79,9 @@ def inspect_xlsx(tmp_path):
 # ---------------------------------------------------------------------------
 
 
-def test_inspect_default_metadata(rich_xlsx):
+def test_inspect_default_metadata(rich_xlsx_ro):
     """Default inspect returns workbook-level metadata for all sheets."""
-    result = runner.invoke(app, ["inspect", str(rich_xlsx)])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = invoke_json(["inspect", str(rich_xlsx_ro)])
 
     # Workbook-level keys from get_workbook_metadata
     assert "sheets" in data
@@ -84,7 +91,7 @@ def test_inspect_default_metadata(rich_xlsx):
     assert "total_formula_count" in data
     assert "total_chart_count" in data
 
-    # rich_xlsx has Sales and Summary sheets
+    # rich_xlsx_ro has Sales and Summary sheets
     sheet_names = [s["name"] for s in data["sheets"]]
     assert "Sales" in sheet_names
     assert "Summary" in sheet_names
@@ -94,10 +101,9 @@ def test_inspect_default_metadata(rich_xlsx):
     assert data["has_vba"] is False
 
 
-def test_inspect_default_sheet_metadata_shape(rich_xlsx):
+def test_inspect_default_sheet_metadata_shape(rich_inspect):
     """Each sheet in default inspect has the expected per-sheet keys."""
-    result = runner.invoke(app, ["inspect", str(rich_xlsx)])
-    data = json.loads(result.stdout)
+    data = rich_inspect()
 
     for sheet in data["sheets"]:
         assert "name" in sheet
@@ -117,9 +123,7 @@ def test_inspect_default_sheet_metadata_shape(rich_xlsx):
 
 def test_inspect_sheet_full_inspection(inspect_xlsx):
     """--sheet returns comprehensive inspection data for a single sheet."""
-    result = runner.invoke(app, ["inspect", str(inspect_xlsx), "--sheet", "Summary"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = inspect_run(str(inspect_xlsx), sheet="Summary")
 
     assert data["sheet"] == "Summary"
     assert "dimensions" in data
@@ -155,11 +159,9 @@ def test_inspect_sheet_full_inspection(inspect_xlsx):
     assert data["hyperlinks"]["count"] == 0
 
 
-def test_inspect_sheet_full_with_all_elements(rich_xlsx):
-    """--sheet on rich_xlsx Summary has CF, hyperlinks, comments, DV, merged cells."""
-    result = runner.invoke(app, ["inspect", str(rich_xlsx), "--sheet", "Summary"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+def test_inspect_sheet_full_with_all_elements(rich_inspect):
+    """--sheet on rich_xlsx_ro Summary has CF, hyperlinks, comments, DV, merged cells."""
+    data = rich_inspect(sheet="Summary")
 
     assert data["sheet"] == "Summary"
     assert data["formulas"]["count"] == 3
@@ -175,9 +177,7 @@ def test_inspect_sheet_full_with_all_elements(rich_xlsx):
 
 def test_inspect_sheet_no_special_elements(inspect_xlsx):
     """Data sheet has no formulas, comments, CF, DV, or hyperlinks."""
-    result = runner.invoke(app, ["inspect", str(inspect_xlsx), "--sheet", "Data"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = inspect_run(str(inspect_xlsx), sheet="Data")
 
     assert data["sheet"] == "Data"
     assert data["formulas"]["count"] == 0
@@ -192,11 +192,9 @@ def test_inspect_sheet_no_special_elements(inspect_xlsx):
 # ---------------------------------------------------------------------------
 
 
-def test_inspect_range_with_formulas(rich_xlsx):
+def test_inspect_range_with_formulas(rich_inspect):
     """--range returns formula summary for a range containing formulas."""
-    result = runner.invoke(app, ["inspect", str(rich_xlsx), "--range", "Summary!B3:B5"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = rich_inspect(range_="Summary!B3:B5")
 
     assert data["range"] == "Summary!B3:B5"
     assert data["sheet"] == "Summary"
@@ -210,11 +208,9 @@ def test_inspect_range_with_formulas(rich_xlsx):
     assert any("AVERAGE" in f for f in formulas)
 
 
-def test_inspect_range_data_only(rich_xlsx):
+def test_inspect_range_data_only(rich_inspect):
     """--range on a data-only range returns cells with no formulas."""
-    result = runner.invoke(app, ["inspect", str(rich_xlsx), "--range", "Sales!A1:E1"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = rich_inspect(range_="Sales!A1:E1")
 
     # formula_count reflects total cells in the range (5 header cells)
     assert data["formula_count"] == 5
@@ -223,21 +219,17 @@ def test_inspect_range_data_only(rich_xlsx):
         assert cell["formula"] is None
 
 
-def test_inspect_range_defaults_to_first_sheet(rich_xlsx):
+def test_inspect_range_defaults_to_first_sheet(rich_inspect):
     """--range without sheet prefix defaults to the first sheet."""
-    result = runner.invoke(app, ["inspect", str(rich_xlsx), "--range", "A1:B2"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = rich_inspect(range_="A1:B2")
 
-    # First sheet in rich_xlsx is "Sales"
+    # First sheet in rich_xlsx_ro is "Sales"
     assert data["sheet"] == "Sales"
 
 
-def test_inspect_range_output_shape(rich_xlsx):
+def test_inspect_range_output_shape(rich_inspect):
     """--range output has the expected keys from summarise_formulas."""
-    result = runner.invoke(app, ["inspect", str(rich_xlsx), "--range", "Summary!B3:B5"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = rich_inspect(range_="Summary!B3:B5")
 
     assert "formula_count" in data
     assert "formula_columns" in data
@@ -252,15 +244,13 @@ def test_inspect_range_output_shape(rich_xlsx):
 # ---------------------------------------------------------------------------
 
 
-def test_inspect_names(rich_xlsx):
+def test_inspect_names(rich_inspect):
     """--names returns named ranges info."""
-    result = runner.invoke(app, ["inspect", str(rich_xlsx), "--names"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = rich_inspect(names=True)
 
     assert "named_ranges" in data
     assert "count" in data
-    # rich_xlsx has no named ranges defined
+    # rich_xlsx_ro has no named ranges defined
     assert data["count"] == 0
     assert data["named_ranges"] == []
 
@@ -270,15 +260,13 @@ def test_inspect_names(rich_xlsx):
 # ---------------------------------------------------------------------------
 
 
-def test_inspect_charts(rich_xlsx):
+def test_inspect_charts(rich_inspect):
     """--charts returns chart info across all sheets."""
-    result = runner.invoke(app, ["inspect", str(rich_xlsx), "--charts"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = rich_inspect(charts=True)
 
     assert "charts" in data
     assert "total_chart_count" in data
-    # rich_xlsx has no charts
+    # rich_xlsx_ro has no charts
     assert data["total_chart_count"] == 0
     assert data["charts"] == []
 
@@ -288,11 +276,9 @@ def test_inspect_charts(rich_xlsx):
 # ---------------------------------------------------------------------------
 
 
-def test_inspect_vba_no_macros(rich_xlsx):
+def test_inspect_vba_no_macros(rich_inspect):
     """--vba on a regular .xlsx reports no VBA."""
-    result = runner.invoke(app, ["inspect", str(rich_xlsx), "--vba"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = rich_inspect(vba=True)
 
     assert "has_vba" in data
     assert data["has_vba"] is False
@@ -303,11 +289,9 @@ def test_inspect_vba_no_macros(rich_xlsx):
 # ---------------------------------------------------------------------------
 
 
-def test_inspect_format_cell_with_sheet_ref(rich_xlsx):
+def test_inspect_format_cell_with_sheet_ref(rich_inspect):
     """--format with Sheet!Cell returns detailed formatting."""
-    result = runner.invoke(app, ["inspect", str(rich_xlsx), "--format", "Summary!A1"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = rich_inspect(format_cell="Summary!A1")
 
     assert data["cell"] == "A1"
     # A1 in Summary has bold=True, size=14
@@ -321,33 +305,27 @@ def test_inspect_format_cell_with_sheet_ref(rich_xlsx):
     assert "number_format" in data
 
 
-def test_inspect_format_with_sheet_flag(rich_xlsx):
+def test_inspect_format_with_sheet_flag(rich_xlsx_ro):
     """--format combined with --sheet resolves the correct sheet."""
-    result = runner.invoke(app, ["inspect", str(rich_xlsx), "--sheet", "Summary", "--format", "A1"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = invoke_json(["inspect", str(rich_xlsx_ro), "--sheet", "Summary", "--format", "A1"])
 
     # Should match Summary!A1 formatting
     assert data["font"]["bold"] is True
     assert data["font"]["size"] == 14
 
 
-def test_inspect_format_defaults_to_first_sheet(rich_xlsx):
+def test_inspect_format_defaults_to_first_sheet(rich_inspect):
     """--format without sheet prefix or --sheet defaults to first sheet."""
-    result = runner.invoke(app, ["inspect", str(rich_xlsx), "--format", "A1"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = rich_inspect(format_cell="A1")
 
     # First sheet is Sales; A1 value is "Date"
     assert data["cell"] == "A1"
     assert data["value"] == "Date"
 
 
-def test_inspect_format_output_shape(rich_xlsx):
+def test_inspect_format_output_shape(rich_inspect):
     """--format output has font, fill, border, alignment, and number_format."""
-    result = runner.invoke(app, ["inspect", str(rich_xlsx), "--format", "Summary!A1"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = rich_inspect(format_cell="Summary!A1")
 
     # Font sub-keys
     assert "name" in data["font"]
@@ -379,11 +357,9 @@ def test_inspect_format_output_shape(rich_xlsx):
 # ---------------------------------------------------------------------------
 
 
-def test_inspect_comments(rich_xlsx):
+def test_inspect_comments(rich_inspect):
     """--comments returns comment data for the target sheet."""
-    result = runner.invoke(app, ["inspect", str(rich_xlsx), "--sheet", "Summary", "--comments"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = rich_inspect(sheet="Summary", comments=True)
 
     assert data["sheet"] == "Summary"
     assert data["comment_count"] == 1
@@ -393,22 +369,18 @@ def test_inspect_comments(rich_xlsx):
     assert data["truncated"] is False
 
 
-def test_inspect_comments_defaults_to_first_sheet(rich_xlsx):
+def test_inspect_comments_defaults_to_first_sheet(rich_inspect):
     """--comments without --sheet defaults to the first sheet (Sales)."""
-    result = runner.invoke(app, ["inspect", str(rich_xlsx), "--comments"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = rich_inspect(comments=True)
 
     # Sales sheet has no comments
     assert data["sheet"] == "Sales"
     assert data["comment_count"] == 0
 
 
-def test_inspect_comments_output_shape(rich_xlsx):
+def test_inspect_comments_output_shape(rich_inspect):
     """--comments output has the expected capped-list keys."""
-    result = runner.invoke(app, ["inspect", str(rich_xlsx), "--sheet", "Summary", "--comments"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = rich_inspect(sheet="Summary", comments=True)
 
     assert "sheet" in data
     assert "comments" in data
@@ -427,11 +399,9 @@ def test_inspect_comments_output_shape(rich_xlsx):
 # ---------------------------------------------------------------------------
 
 
-def test_inspect_conditional(rich_xlsx):
+def test_inspect_conditional(rich_inspect):
     """--conditional returns CF rules for a sheet with conditional formatting."""
-    result = runner.invoke(app, ["inspect", str(rich_xlsx), "--conditional", "Summary"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = rich_inspect(conditional="Summary")
 
     assert data["sheet"] == "Summary"
     assert data["rule_count"] == 1
@@ -442,11 +412,9 @@ def test_inspect_conditional(rich_xlsx):
     assert data["truncated"] is False
 
 
-def test_inspect_conditional_no_rules(rich_xlsx):
+def test_inspect_conditional_no_rules(rich_inspect):
     """--conditional on a sheet with no CF returns empty results."""
-    result = runner.invoke(app, ["inspect", str(rich_xlsx), "--conditional", "Sales"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = rich_inspect(conditional="Sales")
 
     assert data["sheet"] == "Sales"
     assert data["rule_count"] == 0
@@ -459,11 +427,9 @@ def test_inspect_conditional_no_rules(rich_xlsx):
 # ---------------------------------------------------------------------------
 
 
-def test_inspect_validation(rich_xlsx):
+def test_inspect_validation(rich_inspect):
     """--validation returns data validation rules for a sheet."""
-    result = runner.invoke(app, ["inspect", str(rich_xlsx), "--validation", "Summary"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = rich_inspect(validation="Summary")
 
     assert data["sheet"] == "Summary"
     assert data["validation_count"] == 1
@@ -476,21 +442,17 @@ def test_inspect_validation(rich_xlsx):
     assert data["truncated"] is False
 
 
-def test_inspect_validation_no_rules(rich_xlsx):
+def test_inspect_validation_no_rules(rich_inspect):
     """--validation on a sheet with no DV returns empty results."""
-    result = runner.invoke(app, ["inspect", str(rich_xlsx), "--validation", "Sales"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = rich_inspect(validation="Sales")
 
     assert data["validation_count"] == 0
     assert data["validations"] == []
 
 
-def test_inspect_validation_output_shape(rich_xlsx):
+def test_inspect_validation_output_shape(rich_inspect):
     """--validation output has the expected capped-list keys."""
-    result = runner.invoke(app, ["inspect", str(rich_xlsx), "--validation", "Summary"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = rich_inspect(validation="Summary")
 
     assert "sheet" in data
     assert "validations" in data
@@ -503,11 +465,9 @@ def test_inspect_validation_output_shape(rich_xlsx):
 # ---------------------------------------------------------------------------
 
 
-def test_inspect_hyperlinks(rich_xlsx):
+def test_inspect_hyperlinks(rich_inspect):
     """--hyperlinks returns hyperlink data for a sheet with links."""
-    result = runner.invoke(app, ["inspect", str(rich_xlsx), "--hyperlinks", "Summary"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = rich_inspect(hyperlinks="Summary")
 
     assert data["sheet"] == "Summary"
     assert data["hyperlink_count"] == 1
@@ -517,11 +477,9 @@ def test_inspect_hyperlinks(rich_xlsx):
     assert data["truncated"] is False
 
 
-def test_inspect_hyperlinks_no_links(rich_xlsx):
+def test_inspect_hyperlinks_no_links(rich_inspect):
     """--hyperlinks on a sheet with no hyperlinks returns empty results."""
-    result = runner.invoke(app, ["inspect", str(rich_xlsx), "--hyperlinks", "Sales"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = rich_inspect(hyperlinks="Sales")
 
     assert data["hyperlink_count"] == 0
     assert data["hyperlinks"] == []
@@ -534,9 +492,7 @@ def test_inspect_hyperlinks_no_links(rich_xlsx):
 
 def test_inspect_file_not_found():
     """inspect with a missing file produces a structured error."""
-    result = runner.invoke(app, ["inspect", "/tmp/nonexistent_inspect.xlsx"])
-    assert result.exit_code == 1
-    data = json.loads(result.stdout)
+    data = invoke_json(["inspect", "/tmp/nonexistent_inspect.xlsx"], expect=1)
     assert data["error"] is True
     assert data["code"] == "FILE_NOT_FOUND"
 
@@ -545,23 +501,19 @@ def test_inspect_invalid_format(tmp_path):
     """inspect with a non-Excel file produces INVALID_FORMAT error."""
     txt = tmp_path / "data.txt"
     txt.write_text("not excel")
-    result = runner.invoke(app, ["inspect", str(txt)])
-    assert result.exit_code == 1
-    data = json.loads(result.stdout)
+    data = invoke_json(["inspect", str(txt)], expect=1)
     assert data["error"] is True
     assert data["code"] == "INVALID_FORMAT"
 
 
-def test_inspect_sheet_not_found(rich_xlsx):
+def test_inspect_sheet_not_found(rich_xlsx_ro):
     """--sheet with a non-existent sheet name exits with a non-zero code."""
-    result = runner.invoke(app, ["inspect", str(rich_xlsx), "--sheet", "NonExistent"])
+    result = runner.invoke(app, ["inspect", str(rich_xlsx_ro), "--sheet", "NonExistent"])
     assert result.exit_code != 0
 
 
-def test_inspect_invalid_range(rich_xlsx):
+def test_inspect_invalid_range(rich_xlsx_ro):
     """--range with an invalid range string produces RANGE_INVALID error."""
-    result = runner.invoke(app, ["inspect", str(rich_xlsx), "--range", "not-a-range!!!"])
-    assert result.exit_code == 1
-    data = json.loads(result.stdout)
+    data = invoke_json(["inspect", str(rich_xlsx_ro), "--range", "not-a-range!!!"], expect=1)
     assert data["error"] is True
     assert data["code"] == "RANGE_INVALID"
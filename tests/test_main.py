@@ -6,59 +6,49 @@ These tests call main() directly to exercise the except-Exception handler.
 
 import json
 import sys
-from io import StringIO
-from unittest.mock import patch
+
+import pytest
 
 from agent_xlsx.__main__ import main
 
 
-def test_internal_error_produces_json(sample_xlsx):
+def test_internal_error_produces_json(sample_xlsx, capsys, monkeypatch):
     """Unexpected exceptions produce structured JSON on stdout, traceback on stderr."""
-    stdout_buf = StringIO()
-    stderr_buf = StringIO()
-
-    with (
-        patch("sys.argv", ["agent-xlsx", "read", str(sample_xlsx), "--formulas"]),
-        patch(
-            "agent_xlsx.commands.read._read_with_formulas",
-            side_effect=ValueError("simulated internal error"),
-        ),
-        patch.object(sys, "stdout", stdout_buf),
-        patch.object(sys, "stderr", stderr_buf),
-    ):
-        try:
-            main()
-        except SystemExit as e:
-            assert e.code == 1
-
-    data = json.loads(stdout_buf.getvalue())
+
+    def _fail(*args, **kwargs):
+        raise ValueError("simulated internal error")
+
+    monkeypatch.setattr(sys, "argv", ["agent-xlsx", "read", str(sample_xlsx), "--formulas"])
+    monkeypatch.setattr("agent_xlsx.commands.read._read_with_formulas", _fail)
+
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+    assert exc_info.value.code == 1
+
+    out, err = capsys.readouterr()
+    data = json.loads(out)
     assert data["error"] is True
     assert data["code"] == "INTERNAL_ERROR"
     assert data["exception_type"] == "ValueError"
     assert "simulated internal error" in data["message"]
 
     # Traceback preserved on stderr for developers
-    assert "ValueError: simulated internal error" in stderr_buf.getvalue()
+    assert "ValueError: simulated internal error" in err
 
 
-def test_unknown_option_returns_cli_usage_error():
+def test_unknown_option_returns_cli_usage_error(capsys, monkeypatch):
     """Unknown CLI flags produce structured JSON with CLI_USAGE_ERROR code.
 
     Exercises the custom click.UsageError handler in __main__.py which converts
     Typer/Click usage errors into structured JSON on stdout (exit code 2).
     """
-    stdout_buf = StringIO()
-
-    with (
-        patch("sys.argv", ["agent-xlsx", "--nonexistent-flag"]),
-        patch.object(sys, "stdout", stdout_buf),
-    ):
-        try:
-            main()
-        except SystemExit as e:
-            assert e.code == 2
-
-    data = json.loads(stdout_buf.getvalue())
+    monkeypatch.setattr(sys, "argv", ["agent-xlsx", "--nonexistent-flag"])
+
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+    assert exc_info.value.code == 2
+
+    data = json.loads(capsys.readouterr().out)
     assert data["error"] is True
     assert data["code"] == "CLI_USAGE_ERROR"
     assert "--nonexistent-flag" in data["message"]
@@ -1,12 +1,22 @@
 """Tests for the overview command — structural metadata overview of a workbook."""
 
-import json
+import functools
 
-from typer.testing import CliRunner
+import pytest
 
-from agent_xlsx.cli import app
+from agent_xlsx.commands.overview import overview as overview_cmd
 
-runner = CliRunner()
+from _helpers import call_cmd, invoke_json, memoised_run, sheets_by_name
+
+# ---------------------------------------------------------------------------
+# Fixtures — overview only reads its input, so tests take the shared ``*_xlsx_ro`` workbooks
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def overview_of():
+    """In-process ``overview``, memoised per (workbook, options) — see ``memoised_run``."""
+    return memoised_run(functools.partial(call_cmd, overview_cmd))
 
 
 # ---------------------------------------------------------------------------
@@ -14,11 +24,9 @@ runner = CliRunner()
 # ---------------------------------------------------------------------------
 
 
-def test_overview_default_structure(sample_xlsx):
+def test_overview_default_structure(sample_xlsx_ro):
     """Default overview returns expected top-level keys and data origin tag."""
-    result = runner.invoke(app, ["overview", str(sample_xlsx)])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = invoke_json(["overview", str(sample_xlsx_ro)])
 
     # output_spreadsheet_data wraps with _data_origin
     assert data["_data_origin"] == "untrusted_spreadsheet"
@@ -43,10 +51,9 @@ def test_overview_default_structure(sample_xlsx):
     assert len(data["sheets"]) == 1
 
 
-def test_overview_sheet_info_structure(sample_xlsx):
+def test_overview_sheet_info_structure(overview_of, sample_xlsx_ro):
     """Each sheet entry has the expected structural fields."""
-    result = runner.invoke(app, ["overview", str(sample_xlsx)])
-    data = json.loads(result.stdout)
+    data = overview_of(sample_xlsx_ro)
     sheet = data["sheets"][0]
 
     assert sheet["name"] == "Sheet1"
@@ -66,30 +73,26 @@ def test_overview_sheet_info_structure(sample_xlsx):
 # ---------------------------------------------------------------------------
 
 
-def test_overview_formula_count_accuracy(rich_xlsx):
+def test_overview_formula_count_accuracy(overview_of, rich_xlsx_ro):
     """Formula count matches the number of formulas in the rich fixture."""
-    result = runner.invoke(app, ["overview", str(rich_xlsx)])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = overview_of(rich_xlsx_ro)
 
-    # rich_xlsx has 3 formulas in Summary sheet: B3, B4, B5
+    # rich_xlsx_ro has 3 formulas in Summary sheet: B3, B4, B5
     assert data["total_formula_count"] == 3
 
+    sheets = sheets_by_name(data)
     # Sales sheet has no formulas
-    sales_sheet = next(s for s in data["sheets"] if s["name"] == "Sales")
-    assert sales_sheet["has_formulas"] is False
-    assert sales_sheet["formula_count"] == 0
+    assert sheets["Sales"]["has_formulas"] is False
+    assert sheets["Sales"]["formula_count"] == 0
 
     # Summary sheet has all 3 formulas
-    summary_sheet = next(s for s in data["sheets"] if s["name"] == "Summary")
-    assert summary_sheet["has_formulas"] is True
-    assert summary_sheet["formula_count"] == 3
+    assert sheets["Summary"]["has_formulas"] is True
+    assert sheets["Summary"]["formula_count"] == 3
 
 
-def test_overview_no_formulas_in_plain_workbook(sample_xlsx):
+def test_overview_no_formulas_in_plain_workbook(overview_of, sample_xlsx_ro):
     """Workbook with no formulas reports zero formula count."""
-    result = runner.invoke(app, ["overview", str(sample_xlsx)])
-    data = json.loads(result.stdout)
+    data = overview_of(sample_xlsx_ro)
 
     assert data["total_formula_count"] == 0
     assert data["sheets"][0]["has_formulas"] is False
@@ -101,13 +104,11 @@ def test_overview_no_formulas_in_plain_workbook(sample_xlsx):
 # ---------------------------------------------------------------------------
 
 
-def test_overview_include_formulas(rich_xlsx):
+def test_overview_include_formulas(overview_of, rich_xlsx_ro):
     """--include-formulas adds sample_formulas with pattern deduplication."""
-    result = runner.invoke(app, ["overview", str(rich_xlsx), "--include-formulas"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = overview_of(rich_xlsx_ro, include_formulas=True)
 
-    summary_sheet = next(s for s in data["sheets"] if s["name"] == "Summary")
+    summary_sheet = sheets_by_name(data)["Summary"]
     assert "sample_formulas" in summary_sheet
 
     formulas = summary_sheet["sample_formulas"]
@@ -127,27 +128,23 @@ def test_overview_include_formulas(rich_xlsx):
 # ---------------------------------------------------------------------------
 
 
-def test_overview_include_formatting(rich_xlsx):
+def test_overview_include_formatting(overview_of, rich_xlsx_ro):
     """--include-formatting reports merged cell info for sheets that have them."""
-    result = runner.invoke(app, ["overview", str(rich_xlsx), "--include-formatting"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = overview_of(rich_xlsx_ro, include_formatting=True)
 
+    sheets = sheets_by_name(data)
     # Summary sheet has merged cells (A1:C1)
-    summary_sheet = next(s for s in data["sheets"] if s["name"] == "Summary")
-    assert "has_merged_cells" in summary_sheet
-    assert summary_sheet["has_merged_cells"] is True
-    assert summary_sheet["merged_cell_count"] >= 1
+    assert "has_merged_cells" in sheets["Summary"]
+    assert sheets["Summary"]["has_merged_cells"] is True
+    assert sheets["Summary"]["merged_cell_count"] >= 1
 
     # Sales sheet has no merged cells
-    sales_sheet = next(s for s in data["sheets"] if s["name"] == "Sales")
-    assert sales_sheet["has_merged_cells"] is False
+    assert sheets["Sales"]["has_merged_cells"] is False
 
 
-def test_overview_no_formatting_by_default(rich_xlsx):
+def test_overview_no_formatting_by_default(overview_of, rich_xlsx_ro):
     """Without --include-formatting, merged cell info is absent."""
-    result = runner.invoke(app, ["overview", str(rich_xlsx)])
-    data = json.loads(result.stdout)
+    data = overview_of(rich_xlsx_ro)
 
     for sheet in data["sheets"]:
         assert "has_merged_cells" not in sheet
@@ -158,10 +155,9 @@ def test_overview_no_formatting_by_default(rich_xlsx):
 # ---------------------------------------------------------------------------
 
 
-def test_overview_named_ranges_empty(sample_xlsx):
+def test_overview_named_ranges_empty(overview_of, sample_xlsx_ro):
     """Workbook without named ranges reports empty list and zero count."""
-    result = runner.invoke(app, ["overview", str(sample_xlsx)])
-    data = json.loads(result.stdout)
+    data = overview_of(sample_xlsx_ro)
 
     assert data["named_ranges"] == []
     assert data["named_range_count"] == 0
@@ -172,10 +168,9 @@ def test_overview_named_ranges_empty(sample_xlsx):
 # ---------------------------------------------------------------------------
 
 
-def test_overview_has_vba_false_for_xlsx(sample_xlsx):
+def test_overview_has_vba_false_for_xlsx(overview_of, sample_xlsx_ro):
     """A .xlsx file reports has_vba: false."""
-    result = runner.invoke(app, ["overview", str(sample_xlsx)])
-    data = json.loads(result.stdout)
+    data = overview_of(sample_xlsx_ro)
 
     assert data["has_vba"] is False
     assert data["vba_module_count"] == 0
@@ -197,9 +192,7 @@ def test_overview_empty_workbook(tmp_path):
     p = tmp_path / "empty.xlsx"
     wb.save(p)
 
-    result = runner.invoke(app, ["overview", str(p)])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = call_cmd(overview_cmd, str(p))
 
     assert data["file"] == "empty.xlsx"
     assert data["total_formula_count"] == 0
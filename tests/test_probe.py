@@ -1,13 +1,22 @@
 """Tests for the probe CLI command — workbook profiling."""
 
-import json
+import functools
 
 import pytest
-from typer.testing import CliRunner
 
-from agent_xlsx.cli import app
+from agent_xlsx.commands.probe import probe as probe_cmd
 
-runner = CliRunner()
+from _helpers import call_cmd, invoke_json, memoised_run
+
+# ---------------------------------------------------------------------------
+# Fixtures — probe only reads its input, so tests take the shared ``*_xlsx_ro`` workbooks
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def probe_of():
+    """In-process ``probe``, memoised per (workbook, options) — see ``memoised_run``."""
+    return memoised_run(functools.partial(call_cmd, probe_cmd))
 
 
 # ---------------------------------------------------------------------------
@@ -15,11 +24,10 @@ runner = CliRunner()
 # ---------------------------------------------------------------------------
 
 
-def test_probe_default_lean_output(rich_xlsx):
+@pytest.mark.xdist_group("probe_light")
+def test_probe_default_lean_output(probe_of, rich_xlsx_ro):
     """Default probe returns sheet names, dimensions, headers — no data parsing."""
-    result = runner.invoke(app, ["probe", str(rich_xlsx)])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = probe_of(rich_xlsx_ro)
 
     # Top-level metadata
     assert data["_data_origin"] == "untrusted_spreadsheet"
@@ -47,11 +55,10 @@ def test_probe_default_lean_output(rich_xlsx):
     assert "numeric_summary" not in sales
 
 
-def test_probe_default_includes_column_map(sample_xlsx):
+@pytest.mark.xdist_group("probe_light")
+def test_probe_default_includes_column_map(probe_of, sample_xlsx_ro):
     """Default probe includes column_map for header-to-letter mapping."""
-    result = runner.invoke(app, ["probe", str(sample_xlsx)])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = probe_of(sample_xlsx_ro)
 
     sheet = data["sheets"][0]
     assert "column_map" in sheet
@@ -59,11 +66,10 @@ def test_probe_default_includes_column_map(sample_xlsx):
     assert sheet["column_map"]["amount"] == "B"
 
 
-def test_probe_default_named_ranges_and_tables(rich_xlsx):
+@pytest.mark.xdist_group("probe_light")
+def test_probe_default_named_ranges_and_tables(probe_of, rich_xlsx_ro):
     """Default probe includes named_ranges, tables, and has_vba fields."""
-    result = runner.invoke(app, ["probe", str(rich_xlsx)])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = probe_of(rich_xlsx_ro)
 
     assert "named_ranges" in data
     assert isinstance(data["named_ranges"], list)
@@ -77,11 +83,10 @@ def test_probe_default_named_ranges_and_tables(rich_xlsx):
 # ---------------------------------------------------------------------------
 
 
-def test_probe_types_includes_column_types(rich_xlsx):
+@pytest.mark.xdist_group("probe_light")
+def test_probe_types_includes_column_types(probe_of, rich_xlsx_ro):
     """--types adds column_types and null_counts to each sheet."""
-    result = runner.invoke(app, ["probe", str(rich_xlsx), "--types"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = probe_of(rich_xlsx_ro, types=True)
 
     sales = data["sheets"][0]
     assert "column_types" in sales
@@ -97,11 +102,9 @@ def test_probe_types_includes_column_types(rich_xlsx):
 # ---------------------------------------------------------------------------
 
 
-def test_probe_sample_includes_head_tail(rich_xlsx):
+def test_probe_sample_includes_head_tail(probe_of, rich_xlsx_ro):
     """--sample N returns head and tail sample rows."""
-    result = runner.invoke(app, ["probe", str(rich_xlsx), "--sample", "2"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = probe_of(rich_xlsx_ro, sample=2)
 
     sales = data["sheets"][0]
     assert "sample" in sales
@@ -116,11 +119,10 @@ def test_probe_sample_includes_head_tail(rich_xlsx):
 # ---------------------------------------------------------------------------
 
 
-def test_probe_stats_includes_numeric_summary(rich_xlsx):
+@pytest.mark.xdist_group("probe_stats")
+def test_probe_stats_includes_numeric_summary(probe_of, rich_xlsx_ro):
     """--stats includes numeric_summary with min/max/mean/median/std."""
-    result = runner.invoke(app, ["probe", str(rich_xlsx), "--stats"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = probe_of(rich_xlsx_ro, stats=True)
 
     sales = data["sheets"][0]
     # --stats implies --types
@@ -135,11 +137,10 @@ def test_probe_stats_includes_numeric_summary(rich_xlsx):
         assert "mean" in col_summary
 
 
-def test_probe_stats_includes_string_summary(rich_xlsx):
+@pytest.mark.xdist_group("probe_stats")
+def test_probe_stats_includes_string_summary(probe_of, rich_xlsx_ro):
     """--stats includes string_summary with unique counts and top_values."""
-    result = runner.invoke(app, ["probe", str(rich_xlsx), "--stats"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = probe_of(rich_xlsx_ro, stats=True)
 
     sales = data["sheets"][0]
     # Product and Region are string columns in Sales
@@ -155,11 +156,10 @@ def test_probe_stats_includes_string_summary(rich_xlsx):
 # ---------------------------------------------------------------------------
 
 
-def test_probe_full_enables_all_detail(rich_xlsx):
+@pytest.mark.xdist_group("probe_stats")
+def test_probe_full_enables_all_detail(probe_of, rich_xlsx_ro):
     """--full enables types + stats + sample(3)."""
-    result = runner.invoke(app, ["probe", str(rich_xlsx), "--full"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = probe_of(rich_xlsx_ro, full=True)
 
     sales = data["sheets"][0]
     # --full implies types, stats, sample(3)
@@ -176,11 +176,9 @@ def test_probe_full_enables_all_detail(rich_xlsx):
 # ---------------------------------------------------------------------------
 
 
-def test_probe_sheet_filters_to_single_sheet(multisheet_xlsx):
+def test_probe_sheet_filters_to_single_sheet(probe_of, multisheet_xlsx_ro):
     """--sheet filters output to the specified sheet only."""
-    result = runner.invoke(app, ["probe", str(multisheet_xlsx), "--sheet", "Beta"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = probe_of(multisheet_xlsx_ro, sheet="Beta")
 
     assert len(data["sheets"]) == 1
     assert data["sheets"][0]["name"] == "Beta"
@@ -193,11 +191,9 @@ def test_probe_sheet_filters_to_single_sheet(multisheet_xlsx):
 # ---------------------------------------------------------------------------
 
 
-def test_probe_no_header_uses_column_letters(sample_xlsx):
+def test_probe_no_header_uses_column_letters(probe_of, sample_xlsx_ro):
     """--no-header uses column letters (A, B, C) instead of row-1 values."""
-    result = runner.invoke(app, ["probe", str(sample_xlsx), "--no-header", "--types"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = probe_of(sample_xlsx_ro, no_header=True, types=True)
 
     sheet = data["sheets"][0]
     assert sheet["headers"][0] == "A"
@@ -206,11 +202,9 @@ def test_probe_no_header_uses_column_letters(sample_xlsx):
     assert "column_map" not in sheet
 
 
-def test_probe_no_header_lean_mode(sample_xlsx):
+def test_probe_no_header_lean_mode(probe_of, sample_xlsx_ro):
     """--no-header in lean mode (no --types) still uses letter headers."""
-    result = runner.invoke(app, ["probe", str(sample_xlsx), "--no-header"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = probe_of(sample_xlsx_ro, no_header=True)
 
     sheet = data["sheets"][0]
     assert sheet["headers"][0] == "A"
@@ -223,11 +217,10 @@ def test_probe_no_header_lean_mode(sample_xlsx):
 # ---------------------------------------------------------------------------
 
 
-def test_probe_head_cols_limits_profiled_columns(rich_xlsx):
+@pytest.mark.xdist_group("probe_light")
+def test_probe_head_cols_limits_profiled_columns(probe_of, rich_xlsx_ro):
     """--head-cols N limits profiling to first N columns."""
-    result = runner.invoke(app, ["probe", str(rich_xlsx), "--types", "--head-cols", "2"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = probe_of(rich_xlsx_ro, types=True, head_cols=2)
 
     sales = data["sheets"][0]
     # Full header list should still include all columns
@@ -244,11 +237,9 @@ def test_probe_head_cols_limits_profiled_columns(rich_xlsx):
 # ---------------------------------------------------------------------------
 
 
-def test_probe_empty_sheet(multisheet_xlsx):
+def test_probe_empty_sheet(probe_of, multisheet_xlsx_ro):
     """Probe handles headers-only (empty data) sheets gracefully."""
-    result = runner.invoke(app, ["probe", str(multisheet_xlsx), "--sheet", "Gamma"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = probe_of(multisheet_xlsx_ro, sheet="Gamma")
 
     gamma = data["sheets"][0]
     assert gamma["name"] == "Gamma"
@@ -257,11 +248,10 @@ def test_probe_empty_sheet(multisheet_xlsx):
     assert "Empty2" in gamma["headers"]
 
 
-def test_probe_empty_sheet_with_stats(multisheet_xlsx):
+@pytest.mark.xdist_group("probe_stats")
+def test_probe_empty_sheet_with_stats(probe_of, multisheet_xlsx_ro):
     """--stats on an empty (headers-only) sheet does not crash."""
-    result = runner.invoke(app, ["probe", str(multisheet_xlsx), "--sheet", "Gamma", "--stats"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = probe_of(multisheet_xlsx_ro, sheet="Gamma", stats=True)
 
     gamma = data["sheets"][0]
     # Should succeed but numeric_summary may be absent (no data rows)
@@ -277,9 +267,7 @@ def test_probe_empty_sheet_with_stats(multisheet_xlsx):
 def test_probe_file_not_found(tmp_path):
     """Non-existent file returns FILE_NOT_FOUND structured error."""
     fake_path = str(tmp_path / "nonexistent.xlsx")
-    result = runner.invoke(app, ["probe", fake_path])
-    assert result.exit_code == 1
-    data = json.loads(result.stdout)
+    data = call_cmd(probe_cmd, fake_path, expect=1)
     assert data["error"] is True
     assert data["code"] == "FILE_NOT_FOUND"
 
@@ -288,18 +276,14 @@ def test_probe_invalid_format(tmp_path):
     """Non-Excel file returns INVALID_FORMAT structured error."""
     bad_file = tmp_path / "notes.txt"
     bad_file.write_text("not excel")
-    result = runner.invoke(app, ["probe", str(bad_file)])
-    assert result.exit_code == 1
-    data = json.loads(result.stdout)
+    data = invoke_json(["probe", str(bad_file)], expect=1)
     assert data["error"] is True
     assert data["code"] == "INVALID_FORMAT"
 
 
-def test_probe_sheet_not_found(sample_xlsx):
+def test_probe_sheet_not_found(sample_xlsx_ro):
     """--sheet with non-existent sheet name returns SHEET_NOT_FOUND error."""
-    result = runner.invoke(app, ["probe", str(sample_xlsx), "--sheet", "DoesNotExist"])
-    assert result.exit_code == 1
-    data = json.loads(result.stdout)
+    data = call_cmd(probe_cmd, str(sample_xlsx_ro), sheet="DoesNotExist", expect=1)
     assert data["error"] is True
     assert data["code"] == "SHEET_NOT_FOUND"
     assert "suggestions" in data
@@ -310,11 +294,9 @@ def test_probe_sheet_not_found(sample_xlsx):
 # ---------------------------------------------------------------------------
 
 
-def test_probe_multisheet_all_sheets(multisheet_xlsx):
+def test_probe_multisheet_all_sheets(probe_of, multisheet_xlsx_ro):
     """Probe without --sheet returns all sheets in order."""
-    result = runner.invoke(app, ["probe", str(multisheet_xlsx)])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = probe_of(multisheet_xlsx_ro)
 
     assert len(data["sheets"]) == 3
     names = [s["name"] for s in data["sheets"]]
@@ -326,11 +308,10 @@ def test_probe_multisheet_all_sheets(multisheet_xlsx):
 # ---------------------------------------------------------------------------
 
 
-def test_probe_full_with_explicit_sample(rich_xlsx):
+@pytest.mark.xdist_group("probe_stats")
+def test_probe_full_with_explicit_sample(probe_of, rich_xlsx_ro):
     """--full + --sample 5 uses the larger sample count."""
-    result = runner.invoke(app, ["probe", str(rich_xlsx), "--full", "--sample", "5"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = probe_of(rich_xlsx_ro, full=True, sample=5)
 
     sales = data["sheets"][0]
     assert "sample" in sales
@@ -343,24 +324,12 @@ def test_probe_full_with_explicit_sample(rich_xlsx):
 # ---------------------------------------------------------------------------
 
 
-def test_probe_brief_includes_types_and_nulls(rich_xlsx):
-    """--brief includes column_types and null_counts."""
-    result = runner.invoke(app, ["probe", str(rich_xlsx), "--brief"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+def test_probe_brief_profile(probe_of, rich_xlsx_ro):
+    """--brief includes column_types and null_counts but no sample or summaries."""
+    sales = probe_of(rich_xlsx_ro, brief=True)["sheets"][0]
 
-    sales = data["sheets"][0]
     assert "column_types" in sales, "--brief should include column_types"
     assert "null_counts" in sales, "--brief should include null_counts"
-
-
-def test_probe_brief_excludes_sample_and_stats(rich_xlsx):
-    """--brief excludes sample, numeric_summary, and string_summary."""
-    result = runner.invoke(app, ["probe", str(rich_xlsx), "--brief"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
-
-    sales = data["sheets"][0]
     assert "sample" not in sales, "--brief should NOT include sample"
     assert "numeric_summary" not in sales, "--brief should NOT include numeric_summary"
     assert "string_summary" not in sales, "--brief should NOT include string_summary"
@@ -371,30 +340,10 @@ def test_probe_brief_excludes_sample_and_stats(rich_xlsx):
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
-def freetext_xlsx(tmp_path):
-    """Workbook with a free-text column (long strings) for truncation tests."""
-    from openpyxl import Workbook
-
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Data"
-    ws["A1"] = "ID"
-    ws["B1"] = "Description"
-    for i in range(2, 12):  # 10 data rows
-        ws[f"A{i}"] = i - 1
-        # 200+ char strings — avg well above FREETEXT_AVG_LENGTH_THRESHOLD (100)
-        ws[f"B{i}"] = f"This is a very long description for item {i - 1}. " * 5
-    p = tmp_path / "freetext.xlsx"
-    wb.save(p)
-    return p
-
-
-def test_probe_stats_free_text_columns_are_compact(freetext_xlsx):
+@pytest.mark.xdist_group("probe_stats")
+def test_probe_stats_free_text_columns_are_compact(probe_of, freetext_xlsx):
     """Free-text columns (avg > 100 chars) emit type: free_text instead of top_values."""
-    result = runner.invoke(app, ["probe", str(freetext_xlsx), "--full"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = probe_of(freetext_xlsx, full=True)
 
     sheet = data["sheets"][0]
     assert "string_summary" in sheet
@@ -405,11 +354,9 @@ def test_probe_stats_free_text_columns_are_compact(freetext_xlsx):
     assert "avg_length" in desc_summary
 
 
-def test_probe_sample_long_strings_are_truncated(freetext_xlsx):
+def test_probe_sample_long_strings_are_truncated(probe_of, freetext_xlsx):
     """Sample row string values are capped at SAMPLE_VALUE_MAX_CHARS (100) + '...'."""
-    result = runner.invoke(app, ["probe", str(freetext_xlsx), "--sample", "3"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = probe_of(freetext_xlsx, sample=3)
 
     sheet = data["sheets"][0]
     assert "sample" in sheet
@@ -1,32 +1,32 @@
 """Tests for read command: --headers flag and file_size_human output."""
 
-import json
+import datetime
 
+import polars as pl
 import pytest
 from openpyxl import Workbook
 from typer.testing import CliRunner
 
 from agent_xlsx.cli import app
+from agent_xlsx.commands import read as read_mod
+from agent_xlsx.commands.read import run as read_run
+from agent_xlsx.utils.constants import DEFAULT_LIMIT
+
+from _helpers import invoke_json, session_template
 
 runner = CliRunner()
 
 
-@pytest.fixture
-def tabular_xlsx(tmp_path):
-    """Workbook with headers in row 1 and data in rows 2+."""
+@session_template("tabular.xlsx")
+def tabular_xlsx(path):
+    """Workbook with headers in row 1 and data in rows 2+ (session-shared; read never writes)."""
     wb = Workbook()
     ws = wb.active
     ws.title = "Sales"
-    ws["A1"] = "Product"
-    ws["B1"] = "Revenue"
-    ws["C1"] = "Region"
+    ws.append(["Product", "Revenue", "Region"])
     for i in range(2, 12):
-        ws[f"A{i}"] = f"Product-{i - 1}"
-        ws[f"B{i}"] = (i - 1) * 1000
-        ws[f"C{i}"] = "North" if i % 2 == 0 else "South"
-    p = tmp_path / "tabular.xlsx"
-    wb.save(p)
-    return p
+        ws.append([f"Product-{i - 1}", (i - 1) * 1000, "North" if i % 2 == 0 else "South"])
+    wb.save(path)
 
 
 # ---------------------------------------------------------------------------
@@ -36,9 +36,7 @@ def tabular_xlsx(tmp_path):
 
 def test_read_headers_resolves_column_names(tabular_xlsx):
     """--headers resolves letter headers to row-1 names in range reads."""
-    result = runner.invoke(app, ["read", str(tabular_xlsx), "A5:C5", "--headers"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = read_run(str(tabular_xlsx), range_="A5:C5", headers=True)
     # Headers should be resolved from row 1, not letters
     assert "Product" in data["headers"]
     assert "Revenue" in data["headers"]
@@ -50,18 +48,14 @@ def test_read_headers_resolves_column_names(tabular_xlsx):
 
 def test_read_headers_with_no_header_ignored(tabular_xlsx):
     """--headers + --no-header: --no-header takes precedence."""
-    result = runner.invoke(app, ["read", str(tabular_xlsx), "A5:C5", "--headers", "--no-header"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = read_run(str(tabular_xlsx), range_="A5:C5", headers=True, no_header=True)
     # Should still have letter headers since --no-header wins
     assert "column_map" not in data
 
 
 def test_read_headers_without_range_is_noop(tabular_xlsx):
     """--headers without a range is a no-op (full reads already have headers)."""
-    result = runner.invoke(app, ["read", str(tabular_xlsx), "--headers"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = read_run(str(tabular_xlsx), headers=True)
     # Full read: headers are already from row 1
     assert "Product" in data["headers"]
     # No column_map needed since headers were already resolved
@@ -70,9 +64,7 @@ def test_read_headers_without_range_is_noop(tabular_xlsx):
 
 def test_read_range_without_headers_uses_letters(tabular_xlsx):
     """Range reads without --headers use column letters (existing behavior)."""
-    result = runner.invoke(app, ["read", str(tabular_xlsx), "A5:C5"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = read_run(str(tabular_xlsx), range_="A5:C5")
     # Should be letter headers: A, B, C
     assert data["headers"] == ["A", "B", "C"]
     assert "column_map" not in data
@@ -85,9 +77,7 @@ def test_read_range_without_headers_uses_letters(tabular_xlsx):
 
 def test_read_file_size_human_present(tabular_xlsx):
     """file_size_human field is present in read output."""
-    result = runner.invoke(app, ["read", str(tabular_xlsx)])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = invoke_json(["read", str(tabular_xlsx)])
     assert "file_size_human" in data
     assert isinstance(data["file_size_human"], str)
     # Should be in KB range for a small test file
@@ -96,9 +86,7 @@ def test_read_file_size_human_present(tabular_xlsx):
 
 def test_probe_file_size_human_present(tabular_xlsx):
     """file_size_human field is present in probe output."""
-    result = runner.invoke(app, ["probe", str(tabular_xlsx)])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = invoke_json(["probe", str(tabular_xlsx)])
     assert "file_size_human" in data
     assert "size_bytes" in data  # backward compat: size_bytes still present
 
@@ -108,38 +96,27 @@ def test_probe_file_size_human_present(tabular_xlsx):
 # ---------------------------------------------------------------------------
 
 
-def test_read_headers_multi_range(tabular_xlsx):
-    """--headers resolves names on multi-range reads."""
-    result = runner.invoke(app, ["read", str(tabular_xlsx), "A5:C5,A8:C8", "--headers"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+@pytest.mark.parametrize(
+    ("range_", "names", "first_col"),
+    [
+        pytest.param("A5:C5,A8:C8", ("Product", "Revenue"), "A", id="from-col-a"),
+        pytest.param("B5:C5,B8:C8", ("Revenue", "Region"), "B", id="from-col-b"),
+    ],
+)
+def test_read_headers_multi_range(tabular_xlsx, range_, names, first_col):
+    """--headers resolves names on multi-range reads, including non-A start columns."""
+    data = read_run(str(tabular_xlsx), range_=range_, headers=True)
     # Multi-range returns results array
     for r in data["results"]:
-        assert "Product" in r["headers"]
-        assert "Revenue" in r["headers"]
+        for name in names:
+            assert name in r["headers"]
         assert "column_map" in r
-        assert r["column_map"]["A"] == "Product"
-
-
-def test_read_headers_multi_range_wide_columns(tabular_xlsx):
-    """--headers resolves names for non-A columns on multi-range reads."""
-    result = runner.invoke(app, ["read", str(tabular_xlsx), "B5:C5,B8:C8", "--headers"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
-    for r in data["results"]:
-        assert "Revenue" in r["headers"]
-        assert "Region" in r["headers"]
-        assert "column_map" in r
-        assert r["column_map"]["B"] == "Revenue"
+        assert r["column_map"][first_col] == names[0]
 
 
 def test_read_headers_multi_range_no_header_wins(tabular_xlsx):
     """--headers + --no-header on multi-range: --no-header wins."""
-    result = runner.invoke(
-        app, ["read", str(tabular_xlsx), "A5:C5,A8:C8", "--headers", "--no-header"]
-    )
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = read_run(str(tabular_xlsx), range_="A5:C5,A8:C8", headers=True, no_header=True)
     for r in data["results"]:
         assert "column_map" not in r
 
@@ -152,18 +129,14 @@ def test_read_headers_multi_range_no_header_wins(tabular_xlsx):
 def test_read_oob_columns_returns_warning(tabular_xlsx):
     """Reading beyond the sheet's data range returns a warning."""
     # tabular_xlsx has columns A-C (3 columns). Requesting A1:Z2 should warn.
-    result = runner.invoke(app, ["read", str(tabular_xlsx), "A1:Z2"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = read_run(str(tabular_xlsx), range_="A1:Z2")
     assert "warning" in data
     assert "omitted" in data["warning"].lower() or "column" in data["warning"].lower()
 
 
 def test_read_within_bounds_no_warning(tabular_xlsx):
     """Reading within the sheet's data range produces no warning."""
-    result = runner.invoke(app, ["read", str(tabular_xlsx), "A1:C2"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = read_run(str(tabular_xlsx), range_="A1:C2")
     assert "warning" not in data
 
 
@@ -172,30 +145,23 @@ def test_read_within_bounds_no_warning(tabular_xlsx):
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def sparse_xlsx(tmp_path):
-    """Workbook with data gaps that produce EmptyCell in read_only mode."""
+@session_template("sparse.xlsx")
+def sparse_xlsx(path):
+    """Workbook with data gaps that produce EmptyCell in read_only mode (session-shared)."""
     wb = Workbook()
     ws = wb.active
     ws.title = "Sparse"
-    ws["A1"] = "Val"
-    ws["B1"] = "Formula"
-    ws["A2"] = 10
-    ws["B2"] = "=SUM(A2:A3)"
-    ws["A3"] = 20
-    ws["B3"] = "=AVERAGE(A2:A3)"
+    ws.append(["Val", "Formula"])
+    ws.append([10, "=SUM(A2:A3)"])
+    ws.append([20, "=AVERAGE(A2:A3)"])
     # Row 4 intentionally empty — creates EmptyCell objects in read_only mode
     ws["B5"] = "=A2*2"
-    p = tmp_path / "sparse.xlsx"
-    wb.save(p)
-    return p
+    wb.save(path)
 
 
 def test_read_formulas_with_empty_cells(sparse_xlsx):
     """--formulas handles EmptyCell objects without crashing."""
-    result = runner.invoke(app, ["read", str(sparse_xlsx), "--formulas"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = read_run(str(sparse_xlsx), formulas=True)
     assert data["backend"] == "openpyxl"
     # Should have cells from non-empty positions only (compact mode strips empties)
     assert data["cell_count"] > 0
@@ -211,100 +177,51 @@ def test_read_formulas_with_empty_cells(sparse_xlsx):
 
 def test_read_sheet_flag(multisheet_xlsx):
     """--sheet selects the specified sheet for reading."""
-    result = runner.invoke(app, ["read", str(multisheet_xlsx), "--sheet", "Beta"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = read_run(str(multisheet_xlsx), sheet="Beta")
     assert data["headers"] == ["ID", "Value"]
     assert data["row_count"] == 10
 
 
 def test_read_sheet_not_found(multisheet_xlsx):
     """--sheet with a non-existent name produces a SHEET_NOT_FOUND error."""
-    result = runner.invoke(app, ["read", str(multisheet_xlsx), "--sheet", "DoesNotExist"])
-    assert result.exit_code == 1
-    data = json.loads(result.stdout)
+    data = invoke_json(["read", str(multisheet_xlsx), "--sheet", "DoesNotExist"], expect=1)
     assert data["error"] is True
     assert data["code"] == "SHEET_NOT_FOUND"
 
 
 # ---------------------------------------------------------------------------
-# --limit flag
-# ---------------------------------------------------------------------------
-
-
-def test_read_limit(multisheet_xlsx):
-    """--limit caps the number of returned rows."""
-    result = runner.invoke(app, ["read", str(multisheet_xlsx), "--sheet", "Beta", "--limit", "3"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
-    assert data["row_count"] == 3
-    assert len(data["data"]) == 3
-
-
-# ---------------------------------------------------------------------------
-# --offset flag
+# --limit / --offset
 # ---------------------------------------------------------------------------
 
 
-def test_read_offset(multisheet_xlsx):
-    """--offset skips the specified number of rows."""
-    # Beta has 10 data rows. Offset 5 should leave 5 rows.
-    result = runner.invoke(app, ["read", str(multisheet_xlsx), "--sheet", "Beta", "--offset", "5"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
-    assert data["row_count"] == 5
+@pytest.mark.parametrize(
+    ("offset", "limit", "expected_rows"),
+    [
+        pytest.param(0, 3, 3, id="limit"),
+        # Beta has 10 data rows, so skipping 5 leaves 5
+        pytest.param(5, DEFAULT_LIMIT, 5, id="offset"),
+        pytest.param(2, 3, 3, id="offset-then-limit"),
+    ],
+)
+def test_read_limit_offset(multisheet_xlsx, offset, limit, expected_rows):
+    """--offset skips the first N rows, then --limit caps the rest at M."""
+    data = read_run(str(multisheet_xlsx), sheet="Beta", offset=offset, limit=limit)
+    assert data["row_count"] == expected_rows
+    assert len(data["data"]) == expected_rows
 
 
 # ---------------------------------------------------------------------------
-# --limit + --offset combined
+# --sort / --descending
 # ---------------------------------------------------------------------------
 
 
-def test_read_limit_and_offset(multisheet_xlsx):
-    """--limit + --offset work together: skip first N rows then cap at M."""
-    result = runner.invoke(
-        app,
-        ["read", str(multisheet_xlsx), "--sheet", "Beta", "--offset", "2", "--limit", "3"],
-    )
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
-    assert data["row_count"] == 3
-    assert len(data["data"]) == 3
-
-
-# ---------------------------------------------------------------------------
-# --sort ascending
-# ---------------------------------------------------------------------------
-
-
-def test_read_sort_ascending(multisheet_xlsx):
-    """--sort sorts rows by the specified column in ascending order."""
-    result = runner.invoke(
-        app, ["read", str(multisheet_xlsx), "--sheet", "Alpha", "--sort", "Score"]
-    )
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
-    score_idx = data["headers"].index("Score")
-    scores = [row[score_idx] for row in data["data"]]
-    assert scores == sorted(scores)
-
-
-# ---------------------------------------------------------------------------
-# --sort --descending
-# ---------------------------------------------------------------------------
-
-
-def test_read_sort_descending(multisheet_xlsx):
-    """--sort --descending sorts rows in descending order."""
-    result = runner.invoke(
-        app,
-        ["read", str(multisheet_xlsx), "--sheet", "Alpha", "--sort", "Score", "--descending"],
-    )
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+@pytest.mark.parametrize("descending", [False, True], ids=["ascending", "descending"])
+def test_read_sort(multisheet_xlsx, descending):
+    """--sort orders rows by the named column; --descending reverses the order."""
+    data = read_run(str(multisheet_xlsx), sheet="Alpha", sort="Score", descending=descending)
     score_idx = data["headers"].index("Score")
     scores = [row[score_idx] for row in data["data"]]
-    assert scores == sorted(scores, reverse=True)
+    assert scores == sorted(scores, reverse=descending)
 
 
 # ---------------------------------------------------------------------------
@@ -314,18 +231,14 @@ def test_read_sort_descending(multisheet_xlsx):
 
 def test_read_compact_default(compact_xlsx):
     """Default compact mode drops the fully-null NullCol column."""
-    result = runner.invoke(app, ["read", str(compact_xlsx)])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = read_run(str(compact_xlsx))
     assert "NullCol" not in data["headers"]
     assert "Name" in data["headers"]
 
 
 def test_read_no_compact(compact_xlsx):
     """--no-compact preserves fully-null columns."""
-    result = runner.invoke(app, ["read", str(compact_xlsx), "--no-compact"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = read_run(str(compact_xlsx), compact=False)
     assert "NullCol" in data["headers"]
     assert len(data["headers"]) == 4
 
@@ -337,9 +250,7 @@ def test_read_no_compact(compact_xlsx):
 
 def test_read_all_sheets(multisheet_xlsx):
     """--all-sheets reads every sheet and returns a results array."""
-    result = runner.invoke(app, ["read", str(multisheet_xlsx), "--all-sheets"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = read_run(str(multisheet_xlsx), all_sheets=True)
     assert "results" in data
     assert data["total_ranges"] == 3
     sheet_names = [r["sheet"] for r in data["results"]]
@@ -356,13 +267,15 @@ def test_read_all_sheets(multisheet_xlsx):
 def test_read_format_csv(multisheet_xlsx):
     """--format csv outputs raw CSV to stdout."""
     result = runner.invoke(
-        app, ["read", str(multisheet_xlsx), "--sheet", "Alpha", "--format", "csv"]
+        app,
+        ["read", str(multisheet_xlsx), "--sheet", "Alpha", "--format", "csv"],
+        catch_exceptions=False,
     )
     assert result.exit_code == 0, result.stdout
-    lines = result.stdout.strip().split("\n")
+    lines = result.stdout_bytes.splitlines()
     # First line is header row
-    assert "Name" in lines[0]
-    assert "Score" in lines[0]
+    assert b"Name" in lines[0]
+    assert b"Score" in lines[0]
     # 5 data rows + 1 header = 6 lines
     assert len(lines) == 6
 
@@ -375,18 +288,14 @@ def test_read_format_csv(multisheet_xlsx):
 def test_read_truncated_flag_when_at_limit(multisheet_xlsx):
     """truncated=true when row_count equals the effective limit."""
     # Beta has 10 rows; setting limit=5 should truncate
-    result = runner.invoke(app, ["read", str(multisheet_xlsx), "--sheet", "Beta", "--limit", "5"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = read_run(str(multisheet_xlsx), sheet="Beta", limit=5)
     assert data["truncated"] is True
 
 
 def test_read_truncated_flag_when_below_limit(multisheet_xlsx):
     """truncated=false when all rows fit within the limit."""
     # Alpha has 5 rows; default limit is 100, so not truncated
-    result = runner.invoke(app, ["read", str(multisheet_xlsx), "--sheet", "Alpha"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = read_run(str(multisheet_xlsx), sheet="Alpha")
     assert data["truncated"] is False
 
 
@@ -402,9 +311,7 @@ def test_read_default_range_field_is_sheet_name(tabular_xlsx):
     sheet name when target_sheet was an integer index. Fixed to resolve via
     available[target_sheet].
     """
-    result = runner.invoke(app, ["read", str(tabular_xlsx)])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = read_run(str(tabular_xlsx))
     # tabular_xlsx has sheet named "Sales" with first column header "Product"
     assert data["range"] == "Sales", (
         f"Expected sheet name 'Sales' in range field, got '{data['range']}'"
@@ -438,9 +345,7 @@ def float_xlsx(tmp_path):
 
 def test_read_precision_rounds_single_range(float_xlsx):
     """--precision 2 rounds all float values to at most 2 decimal places."""
-    result = runner.invoke(app, ["read", str(float_xlsx), "--precision", "2"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = read_run(str(float_xlsx), precision=2)
     for row in data["data"]:
         for val in row:
             if isinstance(val, float):
@@ -450,9 +355,7 @@ def test_read_precision_rounds_single_range(float_xlsx):
 
 def test_read_precision_rounds_multi_range(float_xlsx):
     """--precision 1 rounds values in multi-range reads."""
-    result = runner.invoke(app, ["read", str(float_xlsx), "A2:B2,A4:B4", "--precision", "1"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = read_run(str(float_xlsx), range_="A2:B2,A4:B4", precision=1)
     for entry in data["results"]:
         for row in entry["data"]:
             for val in row:
@@ -484,16 +387,56 @@ def formula_hint_xlsx(tmp_path):
 
 def test_read_detects_uncached_formulas_hint(formula_hint_xlsx):
     """Default read flags uncached formulas with has_uncached_formulas and hint."""
-    result = runner.invoke(app, ["read", str(formula_hint_xlsx)])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = read_run(str(formula_hint_xlsx))
     assert data.get("has_uncached_formulas") is True, "Should detect uncached formulas"
     assert "hint" in data, "Should include a hint about uncached formulas"
 
 
 def test_read_formulas_mode_skips_uncached_hint(formula_hint_xlsx):
     """--formulas mode does NOT add has_uncached_formulas since formulas are visible."""
-    result = runner.invoke(app, ["read", str(formula_hint_xlsx), "--formulas"])
-    assert result.exit_code == 0, result.stdout
-    data = json.loads(result.stdout)
+    data = read_run(str(formula_hint_xlsx), formulas=True)
     assert "has_uncached_formulas" not in data, "--formulas should not add uncached formula hint"
+
+
+# ---------------------------------------------------------------------------
+# Date serial conversion — columnar pass over date-formatted columns
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def serial_dates_xlsx(tmp_path):
+    """Row 2 date-formatted (drives detection); later rows hold raw serials and text."""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Dates"
+    ws.append(["When", "N"])
+    ws.cell(row=2, column=1, value=45000).number_format = "yyyy-mm-dd"
+    for v in (45001.25, "txt", -2, 45003):
+        ws.append([v, 1])
+    p = tmp_path / "serial_dates.xlsx"
+    wb.save(p)
+    return p
+
+
+def test_read_date_conversion_leaves_date_values(monkeypatch, tmp_path):
+    """Values that are already dates are not re-read as serials (days since 1970)."""
+    monkeypatch.setattr(read_mod, "detect_date_column_indices", lambda *_: {0})
+    rows = [[datetime.date(2024, 1, 1)], [datetime.date(2024, 2, 1)]]
+    out = read_mod._apply_date_conversion(rows, pl.DataFrame(), tmp_path / "x.xlsx", "Sheet")
+    assert out == [[datetime.date(2024, 1, 1)], [datetime.date(2024, 2, 1)]]
+
+
+def test_read_date_conversion_out_of_range_and_padded(monkeypatch, tmp_path):
+    """Serials past 9999-12-31 stay numeric; padded numeric strings still convert."""
+    monkeypatch.setattr(read_mod, "detect_date_column_indices", lambda *_: {0, 1})
+    rows = [[45000.0, " 45000 "], [1e7, "1e7"]]
+    out = read_mod._apply_date_conversion(rows, pl.DataFrame(), tmp_path / "x.xlsx", "Sheet")
+    assert out == [["2023-03-15", "2023-03-15"], [1e7, "1e7"]]
+
+
+@pytest.mark.parametrize("no_header", [False, True])
+def test_read_converts_date_serials(serial_dates_xlsx, no_header):
+    """Positive serials become ISO dates (numeric strings too); other values pass through."""
+    data = read_run(str(serial_dates_xlsx), no_header=no_header)
+    when = [row[0] for row in data["data"]][-4:]
+    assert when == ["2023-03-16T06:00:00", "txt", "-2", "2023-03-18"]
@@ -51,7 +51,7 @@ def test_sheet_create(multisheet_xlsx, tmp_path):
     assert data["sheet"] == "NewSheet"
 
     # Verify the sheet was actually created
-    wb = load_workbook(str(test_file))
+    wb = load_workbook(str(test_file), read_only=True)
     assert "NewSheet" in wb.sheetnames
     assert len(wb.sheetnames) == 4
     wb.close()
@@ -78,7 +78,7 @@ def test_sheet_rename(multisheet_xlsx, tmp_path):
     assert data["new_name"] == "AlphaRenamed"
 
     # Verify in workbook
-    wb = load_workbook(str(test_file))
+    wb = load_workbook(str(test_file), read_only=True)
     assert "AlphaRenamed" in wb.sheetnames
     assert "Alpha" not in wb.sheetnames
     wb.close()
@@ -111,7 +111,7 @@ def test_sheet_delete(multisheet_xlsx, tmp_path):
     assert data["sheet"] == "Gamma"
 
     # Verify the sheet was removed
-    wb = load_workbook(str(test_file))
+    wb = load_workbook(str(test_file), read_only=True)
     assert "Gamma" not in wb.sheetnames
     assert len(wb.sheetnames) == 2
     wb.close()
@@ -151,7 +151,7 @@ def test_sheet_copy_with_new_name(multisheet_xlsx, tmp_path):
     assert data["copy"] == "AlphaCopy"
 
     # Verify both sheets exist
-    wb = load_workbook(str(test_file))
+    wb = load_workbook(str(test_file), read_only=True)
     assert "Alpha" in wb.sheetnames
     assert "AlphaCopy" in wb.sheetnames
     assert len(wb.sheetnames) == 4
@@ -173,7 +173,7 @@ def test_sheet_copy_without_new_name(multisheet_xlsx, tmp_path):
     assert "copy" in data["copy"].lower() or "Alpha" in data["copy"]
 
     # Verify the original still exists
-    wb = load_workbook(str(test_file))
+    wb = load_workbook(str(test_file), read_only=True)
     assert "Alpha" in wb.sheetnames
     assert len(wb.sheetnames) == 4
     wb.close()
@@ -271,12 +271,12 @@ def test_sheet_create_with_output(multisheet_xlsx, tmp_path):
     assert output_file.exists()
 
     # Output file should have the new sheet
-    wb_out = load_workbook(str(output_file))
+    wb_out = load_workbook(str(output_file), read_only=True)
     assert "OutputSheet" in wb_out.sheetnames
     wb_out.close()
 
     # Original should NOT have the new sheet
-    wb_orig = load_workbook(str(test_file))
+    wb_orig = load_workbook(str(test_file), read_only=True)
     assert "OutputSheet" not in wb_orig.sheetnames
     wb_orig.close()
 
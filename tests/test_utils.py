@@ -1,33 +1,66 @@
 """Tests for utility functions — pure unit tests, no CLI invocations."""
 
 import datetime
+import json
+import os
+import re
+import types
 
 import pytest
 
-from agent_xlsx.formatters.json_formatter import _serialise
+from agent_xlsx.formatters import json_formatter
+from agent_xlsx.formatters.json_formatter import (
+    _serialise,
+    output_spreadsheet_data,
+    stream_rows,
+)
 from agent_xlsx.formatters.token_optimizer import cap_list, summarise_formulas
+from agent_xlsx.utils import memory
 from agent_xlsx.utils.dates import (
+    convert_date_columns,
+    convert_date_values,
+    detect_date_column_indices,
+    detect_date_column_indices_batch,
     detect_date_columns,
     excel_serial_to_isodate,
 )
 from agent_xlsx.utils.errors import (
+    ExcelFileNotFoundError,
     InvalidColumnError,
+    InvalidFormatError,
+    MemoryExceededError,
     RangeInvalidError,
+    SheetNotFoundError,
+    handle_error,
 )
 from agent_xlsx.utils.validation import (
     _normalise_shell_ref,
     col_letter_to_index,
     file_size_human,
+    file_size_human_from_stat,
+    file_stat,
     index_to_col_letter,
     parse_multi_range,
     parse_range,
     resolve_column_filter,
+    validate_file,
+    validate_file_for_write,
 )
 
 # ---------------------------------------------------------------------------
 # validation.py — parse_range
 # ---------------------------------------------------------------------------
 
+# Reference grammar for range strings: optional "SheetName!" prefix, then a
+# cell range like A1:C10 or just A1.  parse_range tokenises by hand; this is
+# the oracle it is checked against.
+_RANGE_RE = re.compile(
+    r"^(?:(?P<sheet>.+)!)?"
+    r"(?P<start>[A-Za-z]{1,3}[0-9]+)"
+    r"(?::(?P<end>[A-Za-z]{1,3}[0-9]+))?$",
+    re.DOTALL,
+)
+
 
 class TestParseRange:
     """Tests for parse_range: Excel range string parsing."""
@@ -53,6 +86,16 @@ class TestParseRange:
         assert result["start"] == "A1"
         assert result["end"] == "C10"
 
+    def test_cached_result_not_shared(self):
+        """Repeat parses are memoised but each call returns its own dict."""
+        first = parse_range("Data!A1:B2")
+        first["sheet"] = "mutated"
+        assert parse_range("Data!A1:B2")["sheet"] == "Data"
+
+    def test_sheet_case_preserved(self):
+        result = parse_range("myData!b2:c3")
+        assert result == {"sheet": "myData", "start": "B2", "end": "C3"}
+
     def test_three_letter_column(self):
         result = parse_range("AAA1:ZZZ999")
         assert result == {"sheet": None, "start": "AAA1", "end": "ZZZ999"}
@@ -79,6 +122,41 @@ class TestParseRange:
         result = parse_range("  A1:B2  ")
         assert result == {"sheet": None, "start": "A1", "end": "B2"}
 
+    @pytest.mark.parametrize(
+        "ref",
+        [
+            "A1",
+            "b2:c3",
+            "a!b!A1",
+            "Data!AB12:aC9",
+            "Q1 2024!A1",
+            "AAAA1",
+            "A1:",
+            "!A1",
+            "1A",
+            "A1:B",
+            "A\u0661",
+            "A1:B2:C3",
+            "Multi\nLine!A1",
+            "\u00df1",
+            "A1:\ufb01",
+            "!" * 50 + "A" * 50,
+        ],
+    )
+    def test_tokenizer_matches_reference_grammar(self, ref):
+        """The hand-written tokenizer accepts and rejects exactly what _RANGE_RE does."""
+        m = _RANGE_RE.match(ref)
+        if m is None:
+            with pytest.raises(RangeInvalidError):
+                parse_range(ref)
+        else:
+            end = m.group("end")
+            assert parse_range(ref) == {
+                "sheet": m.group("sheet"),
+                "start": m.group("start").upper(),
+                "end": end.upper() if end else None,
+            }
+
 
 # ---------------------------------------------------------------------------
 # validation.py — parse_multi_range
@@ -117,6 +195,11 @@ class TestParseMultiRange:
         assert result[0]["start"] == "A1"
         assert result[1]["start"] == "C3"
 
+    def test_inherited_sheet_invalid_part_names_full_ref(self):
+        """An invalid part under an inherited sheet reports the sheet-qualified ref."""
+        with pytest.raises(RangeInvalidError, match="Data!oops"):
+            parse_multi_range("Data!A1:B2, oops")
+
 
 # ---------------------------------------------------------------------------
 # validation.py — col_letter_to_index / index_to_col_letter
@@ -155,6 +238,19 @@ class TestColumnConversion:
         for i in range(0, 100):
             assert col_letter_to_index(index_to_col_letter(i)) == i
 
+    def test_three_letter_columns(self):
+        """Three-letter columns convert, including past XFD (beyond the lookup table)."""
+        assert col_letter_to_index("AAA") == 702
+        assert col_letter_to_index("xfd") == 16383
+        assert col_letter_to_index("ZZZ") == 18277
+        assert index_to_col_letter(18277) == "ZZZ"
+        assert index_to_col_letter(16383) == "XFD"
+
+    def test_three_letter_round_trip(self):
+        for i in range(702, 16384, 97):
+            letters = index_to_col_letter(i)
+            assert col_letter_to_index(letters) == col_letter_to_index(letters.lower()) == i
+
 
 # ---------------------------------------------------------------------------
 # validation.py — _normalise_shell_ref
@@ -197,6 +293,59 @@ class TestFileSizeHuman:
         f.write_bytes(b"x" * (2 * 1024 * 1024))  # 2 MB
         assert file_size_human(str(f)) == "2.0 MB"
 
+    @pytest.mark.parametrize(
+        ("size", "expected"),
+        [
+            (0, "0 B"),
+            (1023, "1023 B"),
+            (1024, "1.0 KB"),
+            ((1 << 20) - 1, "1024.0 KB"),
+            (1 << 20, "1.0 MB"),
+            (3 << 30, "3.0 GB"),
+        ],
+    )
+    def test_unit_boundaries(self, size, expected):
+        st = os.stat_result((0,) * 6 + (size,) + (0,) * 3)
+        assert file_size_human_from_stat(st) == expected
+
+    def test_from_existing_stat(self, tmp_path):
+        f = tmp_path / "kb.txt"
+        f.write_bytes(b"x" * 5120)
+        st = file_stat(f)
+        assert st.st_size == 5120
+        assert file_size_human_from_stat(st) == "5.0 KB"
+
+
+# ---------------------------------------------------------------------------
+# validation.py — validate_file / validate_file_for_write
+# ---------------------------------------------------------------------------
+
+
+class TestValidateFile:
+    """Tests for validate_file / validate_file_for_write: single-stat existence checks."""
+
+    def test_existing_file_resolved(self, sample_xlsx):
+        assert validate_file(str(sample_xlsx)) == sample_xlsx.resolve()
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(ExcelFileNotFoundError):
+            validate_file(str(tmp_path / "nope.xlsx"))
+
+    def test_path_under_a_file_is_missing(self, sample_xlsx):
+        with pytest.raises(ExcelFileNotFoundError):
+            validate_file(str(sample_xlsx / "child.xlsx"))
+
+    def test_unsupported_suffix(self, tmp_path):
+        f = tmp_path / "notes.txt"
+        f.write_text("x")
+        with pytest.raises(InvalidFormatError):
+            validate_file(str(f))
+
+    def test_for_write_new_and_existing(self, sample_xlsx, tmp_path):
+        assert validate_file_for_write(str(sample_xlsx)) == (sample_xlsx.resolve(), False)
+        new = tmp_path / "new.xlsx"
+        assert validate_file_for_write(str(new)) == (new.resolve(), True)
+
 
 # ---------------------------------------------------------------------------
 # validation.py — resolve_column_filter
@@ -270,6 +419,98 @@ class TestExcelSerialToIsodate:
         # 1 = 1899-12-31 (the day after the epoch)
         assert excel_serial_to_isodate(1.0) == "1899-12-31"
 
+    def test_repeated_and_mixed_serials_match_datetime_arithmetic(self):
+        """Whole and fractional serials, repeated, agree with plain datetime arithmetic."""
+        epoch = datetime.datetime(1899, 12, 30)
+        for serial in [45337.0, 45337.5, 45337.0, 1.0, 45337.25, 2958465.0, 45337.0]:
+            dt = epoch + datetime.timedelta(days=serial)
+            expected = (
+                dt.date().isoformat() if serial.is_integer() else dt.isoformat(timespec="seconds")
+            )
+            assert excel_serial_to_isodate(serial) == expected
+
+
+# ---------------------------------------------------------------------------
+# dates.py — convert_date_values / convert_date_columns
+# ---------------------------------------------------------------------------
+
+
+class TestConvertDateValues:
+    """Tests for vectorised serial-to-ISO conversion over rows and DataFrames."""
+
+    def test_rows_numeric_column(self):
+        rows = [[45000.0, "a"], [45000.5, "b"], [None, "c"], [-1, "d"]]
+        convert_date_values(rows, ["When", "Label"], {"When"})
+        assert rows[0][0] == "2023-03-15"
+        assert rows[1][0] == excel_serial_to_isodate(45000.5)
+        assert rows[2][0] is None
+        assert rows[3][0] == -1
+
+    def test_rows_strings_pass_through(self):
+        rows = [[45000], ["n/a"], ["45000"]]
+        convert_date_values(rows, ["When"], {"When"})
+        assert rows == [["2023-03-15"], ["n/a"], ["45000"]]
+
+    def test_rows_short_row_skipped(self):
+        rows = [[1], [2, 45000.0]]
+        convert_date_values(rows, ["A", "B"], {"B"})
+        assert rows == [[1], [2, "2023-03-15"]]
+
+    def test_rows_mixed_column_short_row(self):
+        rows = [["x", "n/a"], ["y"], ["z", 45000], ["w", float("nan")]]
+        convert_date_values(rows, ["K", "When"], {"When"})
+        assert rows[:3] == [["x", "n/a"], ["y"], ["z", "2023-03-15"]]
+        assert rows[3][1] != rows[3][1]  # NaN left untouched
+
+    def test_dataframe_columns(self):
+        import polars as pl
+
+        df = pl.DataFrame({"When": [45000.0, 45000.25, None], "N": [1, 2, 3]})
+        out = convert_date_columns(df, ["When"])
+        assert out["When"].to_list() == ["2023-03-15", "2023-03-15T06:00:00", None]
+        assert out["N"].to_list() == [1, 2, 3]
+
+    def test_dataframe_temporal_column_untouched(self):
+        import polars as pl
+
+        df = pl.DataFrame({"When": [datetime.date(2024, 1, 1)]})
+        out = convert_date_columns(df, ["When"])
+        assert out["When"].dtype == pl.Date
+        assert out["When"].to_list() == [datetime.date(2024, 1, 1)]
+
+    def test_dataframe_out_of_range_keeps_numbers(self):
+        import polars as pl
+
+        df = pl.DataFrame({"N": [45000.0, -1.0, float("nan")]})
+        out = convert_date_columns(df, ["N"])
+        assert out["N"].dtype == pl.Float64
+        assert out["N"].to_list()[:2] == [45000.0, -1.0]
+
+    def test_dataframe_past_max_serial_keeps_numbers(self):
+        """Serials past 9999-12-31 are not dates, however far out of range."""
+        import polars as pl
+
+        df = pl.DataFrame({"d": [45000.0, 1e7]})
+        out = convert_date_columns(df, ["d"])
+        assert out["d"].to_list() == [45000.0, 1e7]
+        strs = pl.DataFrame({"d": ["2958465", "2958466", "1e7", "1e9"]})
+        assert convert_date_columns(strs, ["d"])["d"].to_list() == [
+            "9999-12-31",
+            "2958466",
+            "1e7",
+            "1e9",
+        ]
+
+    def test_scalar_past_max_serial_returned_as_is(self):
+        assert excel_serial_to_isodate(2958465.5) == "9999-12-31T12:00:00"
+        assert excel_serial_to_isodate(1e7) == 1e7
+
+    def test_dataframe_numeric_strings(self):
+        import polars as pl
+
+        df = pl.DataFrame({"A": ["Date", "45000"]})
+        assert convert_date_columns(df, ["A"])["A"].to_list() == ["Date", "2023-03-15"]
+
 
 # ---------------------------------------------------------------------------
 # dates.py — detect_date_columns
@@ -295,6 +536,42 @@ class TestDetectDateColumns:
         assert result == {}
 
 
+class TestDetectDateColumnIndicesBatch:
+    """Tests for detect_date_column_indices_batch: zip/XML scan with openpyxl fallback."""
+
+    def test_detects_per_sheet(self, rich_xlsx):
+        result = detect_date_column_indices_batch(str(rich_xlsx), ["Sales", "Summary", "Nope"])
+        assert result == {"Sales": {0}, "Summary": set(), "Nope": set()}
+
+    def test_matches_openpyxl_path(self, rich_xlsx):
+        from agent_xlsx.utils.dates import _detect_batch_openpyxl
+
+        names = ["Sales", "Summary"]
+        expected = _detect_batch_openpyxl(str(rich_xlsx), names)
+        assert detect_date_column_indices_batch(str(rich_xlsx), names) == expected
+
+
+class TestDetectDateColumnIndices:
+    """Tests for detect_date_column_indices: single-sheet zip/XML scan."""
+
+    def test_named_sheet(self, rich_xlsx):
+        assert detect_date_column_indices(str(rich_xlsx), "Sales") == {0}
+        assert detect_date_column_indices(str(rich_xlsx), "Summary") == set()
+        assert detect_date_column_indices(str(rich_xlsx), "Nope") == set()
+
+    def test_active_sheet_matches_openpyxl(self, rich_xlsx, tmp_path):
+        from openpyxl import load_workbook
+
+        from agent_xlsx.utils.dates import _detect_indices_openpyxl
+
+        wb = load_workbook(rich_xlsx)
+        wb.active = 1  # Summary
+        p = tmp_path / "active.xlsx"
+        wb.save(p)
+        assert detect_date_column_indices(str(p)) == _detect_indices_openpyxl(p, None) == set()
+        assert detect_date_column_indices(str(rich_xlsx)) == {0}
+
+
 # ---------------------------------------------------------------------------
 # token_optimizer.py — cap_list
 # ---------------------------------------------------------------------------
@@ -412,3 +689,178 @@ class TestSerialise:
                 return "custom-repr"
 
         assert _serialise(Custom()) == "custom-repr"
+
+
+# ---------------------------------------------------------------------------
+# json_formatter.py — dumps_pretty
+# ---------------------------------------------------------------------------
+
+
+class TestDumpsPretty:
+    """Tests for dumps_pretty: the stdlib fallback is equivalent to the orjson fast path."""
+
+    PAYLOAD = {
+        "when": datetime.datetime(2024, 1, 15),
+        "at": datetime.datetime(2024, 1, 15, 9, 30),
+        "span": datetime.timedelta(hours=1),
+        "name": "\u6771\u4eac",
+        1: [1.5, None, True],
+        "gaps": [float("nan"), float("inf"), -float("inf")],
+        "exp": [1e-7, 1e16],
+    }
+
+    def test_stdlib_fallback_matches(self, monkeypatch):
+        """Both encoders decode to the same data, including non-ASCII, NaN/inf and exponents."""
+        fast = json_formatter.dumps_pretty(self.PAYLOAD)
+        monkeypatch.setattr(json_formatter, "_orjson", None)
+        slow = json_formatter.dumps_pretty(self.PAYLOAD)
+        assert json.loads(slow) == json.loads(fast)
+        assert "\u6771\u4eac".encode() in slow  # raw UTF-8, not \u escapes
+        data = json.loads(slow)
+        assert data["when"] == "2024-01-15"  # midnight → date-only
+        assert data["1"] == [1.5, None, True]
+        assert data["gaps"] == [None, None, None]
+        assert data["exp"] == [1e-7, 1e16]
+
+    def test_stdlib_fallback_bytes_match_without_exponents(self, monkeypatch):
+        """Apart from exponent spelling (1e-7 vs 1e-07), the layout is byte-identical."""
+        payload = {k: v for k, v in self.PAYLOAD.items() if k != "exp"}
+        fast = json_formatter.dumps_pretty(payload)
+        monkeypatch.setattr(json_formatter, "_orjson", None)
+        assert json_formatter.dumps_pretty(payload) == fast
+
+    def test_non_finite_float_like_becomes_null(self, monkeypatch):
+        """A NaN from a __float__ type is written as null rather than raising."""
+
+        class FakeNum:
+            def __float__(self):
+                return float("nan")
+
+        monkeypatch.setattr(json_formatter, "_orjson", None)
+        assert json.loads(json_formatter.dumps_pretty({"v": FakeNum()})) == {"v": None}
+
+    def test_wide_int_falls_back(self):
+        assert json.loads(json_formatter.dumps_pretty({"n": 2**70})) == {"n": 2**70}
+
+
+# ---------------------------------------------------------------------------
+# json_formatter.py — stream_rows / output_spreadsheet_data
+# ---------------------------------------------------------------------------
+
+
+class TestStreamRows:
+    """Tests for stream_rows: NDJSON output for row generators."""
+
+    def test_header_then_one_line_per_row(self, capsys):
+        stream_rows({"headers": ["A", "B"]}, iter([[1, "x"], [2, "y"]]))
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"headers": ["A", "B"]},
+            [1, "x"],
+            [2, "y"],
+        ]
+
+    def test_rows_are_compact(self, capsys):
+        stream_rows({}, iter([{"a": 1}]))
+        assert capsys.readouterr().out.splitlines()[1] == '{"a":1}'
+
+    @pytest.mark.parametrize("orjson", [True, False])
+    def test_nan_rows_are_valid_json(self, capsys, monkeypatch, orjson):
+        """NaN/inf cells become null on both encoders, so every line parses."""
+        if not orjson:
+            monkeypatch.setattr(json_formatter, "_orjson", None)
+        stream_rows({}, iter([[float("nan"), "\u6771"], [float("inf"), 1]]))
+        lines = capsys.readouterr().out.splitlines()[1:]
+        assert lines == ['[null,"\u6771"]', "[null,1]"]
+
+    def test_generator_rows_routed_to_stream(self, capsys):
+        output_spreadsheet_data({"headers": ["A"], "rows": (r for r in [[1], [2]])})
+        lines = capsys.readouterr().out.splitlines()
+        header = json.loads(lines[0])
+        assert header == {"_data_origin": "untrusted_spreadsheet", "headers": ["A"]}
+        assert [json.loads(line) for line in lines[1:]] == [[1], [2]]
+
+    def test_list_rows_not_streamed(self, capsys):
+        output_spreadsheet_data({"rows": [[1], [2]]})
+        data = json.loads(capsys.readouterr().out)
+        assert data["rows"] == [[1], [2]]
+
+    @pytest.mark.parametrize("orjson", [True, False])
+    def test_prefix_matches_dict_prepend(self, capsys, monkeypatch, orjson):
+        """The pre-encoded _data_origin prefix yields the same bytes as prepending the key."""
+        if not orjson:
+            monkeypatch.setattr(json_formatter, "_orjson", None)
+        data = {"format": "csv", "data": "a,b\n\u6771,2\n", "row_count": 1}
+        output_spreadsheet_data(data)
+        expected = json_formatter.dumps_pretty({"_data_origin": "untrusted_spreadsheet", **data})
+        assert capsys.readouterr().out == expected.decode() + "\n"
+
+    def test_empty_payload_tagged(self, capsys):
+        output_spreadsheet_data({})
+        assert json.loads(capsys.readouterr().out) == {"_data_origin": "untrusted_spreadsheet"}
+
+
+# ---------------------------------------------------------------------------
+# memory.py — check_memory
+# ---------------------------------------------------------------------------
+
+
+class TestCheckMemory:
+    """Tests for check_memory: throttled RSS sampling."""
+
+    def test_over_limit_raises(self, monkeypatch):
+        monkeypatch.setattr(memory, "_last_check", [float("-inf"), 0.0])
+        with pytest.raises(MemoryExceededError):
+            memory.check_memory(limit_mb=0)
+
+    def test_recent_sample_reused(self, monkeypatch):
+        """A reading inside the throttle window is reused without a new sample."""
+        monkeypatch.setattr(memory.time, "monotonic", lambda: 100.0)
+        monkeypatch.setattr(memory, "_last_check", [100.0, 1.0])
+        sampled = []
+
+        def fake_proc():
+            sampled.append(1)
+            return types.SimpleNamespace(memory_info=lambda: types.SimpleNamespace(rss=0))
+
+        monkeypatch.setattr(memory, "_proc", fake_proc)
+        memory.check_memory(limit_mb=2)
+        with pytest.raises(MemoryExceededError):
+            memory.check_memory(limit_mb=0.5)
+        assert sampled == []
+
+
+# ---------------------------------------------------------------------------
+# errors.py — AgentExcelError.to_dict
+# ---------------------------------------------------------------------------
+
+
+class TestErrorToDict:
+    """Tests for AgentExcelError.to_dict: structured error payload."""
+
+    def test_payload(self):
+        d = RangeInvalidError("Z").to_dict()
+        assert d["error"] is True
+        assert d["code"] == "RANGE_INVALID"
+        assert d["suggestions"]
+
+    def test_fresh_dict_per_call(self):
+        err = RangeInvalidError("Z")
+        err.to_dict()["message"] = "changed"
+        assert err.to_dict()["message"] != "changed"
+
+
+class TestHandleError:
+    """Tests for handle_error: structured errors share the success-path encoder."""
+
+    def test_non_ascii_error_written_as_utf8(self, capsys):
+        @handle_error
+        def fail():
+            raise SheetNotFoundError("\u6771\u4eac", ["Sheet1"])
+
+        with pytest.raises(SystemExit) as exc:
+            fail()
+        assert exc.value.code == 1
+        out = capsys.readouterr().out
+        assert "Sheet '\u6771\u4eac' not found" in out  # raw UTF-8, not \u escapes
+        assert json.loads(out)["code"] == "SHEET_NOT_FOUND"
@@ -97,13 +97,14 @@ def test_write_output_creates_new_file_directly(tmp_path):
 # ---------------------------------------------------------------------------
 
 
-def test_write_output_rejects_large_source(sample_xlsx, monkeypatch):
+def test_write_output_rejects_large_source(sample_xlsx, tmp_path, monkeypatch):
     """--output with a large source file fails fast with FILE_TOO_LARGE."""
     monkeypatch.setattr(
         "agent_xlsx.adapters.openpyxl_adapter.file_size_bytes",
         lambda _: 30 * 1024 * 1024,  # 30MB
     )
-    result = runner.invoke(app, ["write", str(sample_xlsx), "A1", "test", "-o", "/tmp/out.xlsx"])
+    out = tmp_path / "out.xlsx"
+    result = runner.invoke(app, ["write", str(sample_xlsx), "A1", "test", "-o", str(out)])
     assert result.exit_code == 1
     data = json.loads(result.stdout)
     assert data["error"] is True
@@ -271,7 +272,7 @@ def test_write_negative_number_via_value_option(tmp_path):
     assert data["status"] == "success"
 
     # Verify the value was written correctly
-    wb = load_workbook(str(out))
+    wb = load_workbook(str(out), read_only=True)
     ws = wb.active
     assert ws["C10"].value == -4.095
     wb.close()
@@ -283,7 +284,7 @@ def test_write_value_option_overrides_positional(tmp_path):
     result = runner.invoke(app, ["write", str(out), "A1", "positional", "--value", "option-wins"])
     assert result.exit_code == 0, result.stdout
 
-    wb = load_workbook(str(out))
+    wb = load_workbook(str(out), read_only=True)
     ws = wb.active
     assert ws["A1"].value == "option-wins"
     wb.close()
@@ -297,7 +298,7 @@ def test_write_negative_number_double_dash(tmp_path):
     data = json.loads(result.stdout)
     assert data["status"] == "success"
 
-    wb = load_workbook(str(out))
+    wb = load_workbook(str(out), read_only=True)
     ws = wb.active
     assert ws["A1"].value == -99.5
     wb.close()
@@ -321,7 +322,7 @@ def test_write_from_json_file(tmp_path):
     assert data["cells_written"] == 4
 
     # Verify written data
-    wb = load_workbook(str(out))
+    wb = load_workbook(str(out), read_only=True)
     ws = wb.active
     assert ws["A1"].value == 1
     assert ws["B1"].value == 2